@@ -0,0 +1,94 @@
+"""Background asset loading.
+
+AssetLoader runs named load jobs on one worker thread, lowest priority first,
+so the menu's own assets land before the gameplay ones stream in behind it.
+Results are picked up on the main thread with take_finished() / get().
+"""
+import heapq
+import threading
+
+from game.eventlog import log
+
+MENU = 0        # priority for what the first menu frames need
+GAMEPLAY = 1    # everything else
+
+
+class AssetLoader:
+    def __init__(self):
+        self._queue = []            # heap of (priority, seq, name, fn, args)
+        self._seq = 0
+        self._results = {}
+        self._finished = []         # names done since the last take_finished()
+        self._total = 0
+        self._done = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def add(self, name, fn, *args, priority=GAMEPLAY):
+        """Queue fn(*args); its return value is stored under name."""
+        with self._cond:
+            heapq.heappush(self._queue, (priority, self._seq, name, fn, args))
+            self._seq += 1
+            self._total += 1
+            restart = self._thread is not None and not self._running
+        if restart:
+            # worker already drained the queue and exited
+            self._spawn()
+
+    def start(self):
+        if self._thread is None:
+            self._spawn()
+        return self
+
+    def _spawn(self):
+        with self._cond:
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="asset-loader", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._queue:
+                    self._running = False
+                    return
+                _prio, _seq, name, fn, args = heapq.heappop(self._queue)
+            try:
+                value = fn(*args)
+            except Exception as e:
+                log.error("asset", "failed to load %s: %s", name, e)
+                value = None
+            with self._cond:
+                self._results[name] = value
+                self._finished.append(name)
+                self._done += 1
+                self._cond.notify_all()
+
+    def ready(self, *names):
+        """True once every named job (or every queued job, with no names) has run."""
+        with self._cond:
+            if not names:
+                return self._done == self._total
+            return all(n in self._results for n in names)
+
+    def get(self, name, default=None):
+        with self._cond:
+            return self._results.get(name, default)
+
+    def take_finished(self):
+        """Names of jobs completed since the last call (main thread applies them)."""
+        with self._cond:
+            names, self._finished = self._finished, []
+        return names
+
+    def progress(self):
+        with self._cond:
+            return self._done / float(self._total) if self._total else 1.0
+
+    def wait(self, *names, timeout=None):
+        """Block until ready(*names); returns False on timeout. Starts the worker if needed."""
+        self.start()
+        with self._cond:
+            return self._cond.wait_for(lambda: (all(n in self._results for n in names) if names
+                                                else self._done == self._total), timeout)
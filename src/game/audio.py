@@ -0,0 +1,219 @@
+"""Preloaded sound bank: every effect decoded once, mixer channels reserved per category.
+
+Each category (pull taps, specials, impacts, ui) owns its own reserved
+channels, so tap spam can't take the channel an explosion or the win jingle
+needs. When all of a category's voices are busy the oldest one is stolen.
+"""
+import threading
+
+import pygame
+
+from game.utils import load_sound, load_music
+from game.eventlog import log
+
+# category -> number of reserved voices
+CATEGORIES = {
+    "pull": 3,      # rapid taps: cap at 3 overlapping pulls, steal the oldest
+    "special": 2,   # clone smoke
+    "impact": 2,    # bomb explosions
+    "ui": 1,        # menu select / win jingle
+    "music": 2,     # MusicPlayer: outgoing + incoming track during a crossfade
+}
+
+# name -> (file, category, volume)
+EFFECTS = {
+    "pull": ("pull.wav", "pull", 0.6),
+    "win": ("win.wav", "ui", 0.7),
+    "select": ("select.wav", "ui", 1.0),
+    "clone": ("clone-smoke.wav", "special", 1.0),
+    "explosion": ("explosion.wav", "impact", 1.0),
+}
+
+
+class SoundBank:
+    def __init__(self, effects=None, categories=None):
+        self.effects = dict(effects or EFFECTS)
+        self.categories = dict(categories or CATEGORIES)
+        self.sounds = {}        # name -> pygame.mixer.Sound
+        self.voices = {}        # category -> [pygame.mixer.Channel]
+        self._started = {}      # channel id -> tick it was last (re)started
+        self._clock = 0
+
+    def load(self):
+        """Decode every effect once and reserve mixer channels per category."""
+        for name, (filename, _category, volume) in self.effects.items():
+            snd = load_sound(filename)
+            if snd is None:
+                continue
+            try:
+                snd.set_volume(volume)
+            except Exception:
+                pass
+            self.sounds[name] = snd
+        self._reserve_channels()
+        return self
+
+    def _reserve_channels(self):
+        try:
+            if not pygame.mixer.get_init():
+                return
+            reserved = sum(self.categories.values())
+            # keep a few unreserved channels for anything still using Sound.play()
+            if pygame.mixer.get_num_channels() < reserved + 4:
+                pygame.mixer.set_num_channels(reserved + 4)
+            pygame.mixer.set_reserved(reserved)
+            index = 0
+            for category, count in self.categories.items():
+                self.voices[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+                index += count
+        except Exception:
+            self.voices = {}
+
+    def get(self, name):
+        return self.sounds.get(name)
+
+    def play(self, name):
+        """Play effect `name` on its category's voices; returns the channel or None."""
+        snd = self.sounds.get(name)
+        if snd is None:
+            return None
+        voices = self.voices.get(self.effects[name][1])
+        try:
+            if not voices:
+                return snd.play()
+            self._clock += 1
+            channel = None
+            for ch in voices:
+                if not ch.get_busy():
+                    channel = ch
+                    break
+            if channel is None:
+                # all voices busy: steal the one that started longest ago
+                channel = min(voices, key=lambda ch: self._started.get(id(ch), 0))
+            channel.play(snd)
+            self._started[id(channel)] = self._clock
+            return channel
+        except Exception:
+            return None
+
+    def stop(self, category=None):
+        for cat, voices in self.voices.items():
+            if category is None or cat == category:
+                for ch in voices:
+                    ch.stop()
+
+
+class MusicPlayer:
+    """Background music as preloaded Sounds on two channels, switched by crossfade.
+
+    Tracks are decoded once by a background thread (load_async), so a state
+    change never touches the disk. play() fades the current channel out and
+    the new track in on the other one; SDL's mixer does the ramp, so nothing
+    here blocks the game loop. A track requested before it has finished
+    loading starts as soon as the loader gets to it.
+    """
+    def __init__(self, channels=None, fade_ms=600, bank=None):
+        self.fade_ms = fade_ms
+        self.channels = [ch for ch in channels or () if ch is not None]
+        self.bank = bank        # take the bank's "music" voices once it has reserved them
+        self.tracks = {}        # name -> pygame.mixer.Sound
+        self.volumes = {}       # name -> target volume
+        self.current = None     # name of the track playing / fading in
+        self._active = 0        # index into self.channels of the current track
+        self._wanted = None     # name requested before it was loaded
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @classmethod
+    def for_bank(cls, bank, fade_ms=600):
+        """Use the bank's reserved "music" channels (the bank may still be loading)."""
+        return cls(bank.voices.get("music"), fade_ms=fade_ms, bank=bank)
+
+    def load(self, name, filename, volume=1.0):
+        """Decode one track now (blocking); filename is looked up with load_music."""
+        path = load_music(filename) if filename else None
+        snd = None
+        if path:
+            try:
+                snd = pygame.mixer.Sound(path)
+            except Exception as e:
+                log.warning("audio", "failed to load music %s (%s): %s", name, path, e)
+        with self._lock:
+            self.volumes[name] = volume
+            if snd is not None:
+                self.tracks[name] = snd
+            start = snd is not None and self._wanted == name
+            if start:
+                self._wanted = None
+        if start:
+            self.play(name)
+        return snd
+
+    def load_all(self, tracks):
+        """Decode tracks {name: (filename, volume)} (blocking)."""
+        for name, (filename, volume) in tracks.items():
+            self.load(name, filename, volume)
+        return self
+
+    def load_async(self, tracks):
+        """Decode tracks {name: (filename, volume)} on a background thread."""
+        self._thread = threading.Thread(target=self.load_all, args=(tracks,), name="music-loader", daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def play(self, name, fade_ms=None):
+        """Crossfade to track `name` (looping); no-op if it's already current."""
+        fade = self.fade_ms if fade_ms is None else fade_ms
+        with self._lock:
+            snd = self.tracks.get(name)
+            if name == self.current and snd is not None:
+                return
+            if snd is None:
+                # not decoded yet (or missing): fade out what's playing, start it when loaded
+                self._wanted = name
+                self._fade_out_current(fade)
+                self.current = None
+                return
+            self._wanted = None
+            self._fade_out_current(fade)
+            if not self.channels and self.bank is not None:
+                self.channels = [ch for ch in self.bank.voices.get("music") or () if ch is not None]
+            try:
+                if self.channels:
+                    self._active = (self._active + 1) % len(self.channels)
+                    ch = self.channels[self._active]
+                    ch.set_volume(self.volumes.get(name, 1.0))
+                    ch.play(snd, loops=-1, fade_ms=fade)
+                else:
+                    snd.set_volume(self.volumes.get(name, 1.0))
+                    ch = snd.play(loops=-1, fade_ms=fade)
+                    # None: every mixer channel is busy; don't keep it, the next play() tries again
+                    if ch is None:
+                        log.warning("audio", "no free channel for music %s", name)
+                        self.current = None
+                        return
+                    self.channels = [ch]
+                    self._active = 0
+            except Exception as e:
+                log.warning("audio", "failed to play music %s: %s", name, e)
+            self.current = name
+
+    def _fade_out_current(self, fade):
+        if self.current is None or not self.channels:
+            return
+        ch = self.channels[self._active]
+        try:
+            if ch is not None:
+                ch.fadeout(fade) if fade else ch.stop()
+        except Exception:
+            pass
+
+    def stop(self, fade_ms=None):
+        with self._lock:
+            self._wanted = None
+            self._fade_out_current(self.fade_ms if fade_ms is None else fade_ms)
+            self.current = None
@@ -0,0 +1,247 @@
+"""Batched AI inference for many concurrent matches.
+
+BatchAI keeps the AI parameters of N AI-controlled players as NumPy arrays
+and makes every burst/pause/clone/bomb decision for one frame in a single
+vectorized call, with the same rules as PlayerState.ai_act plus Game.run's
+random clone/bomb roll. Randomness comes from a counter-based hash
+(splitmix64) keyed per slot, so each match gets its own reproducible stream
+no matter how many other matches share the batch.
+
+MatchPool runs a list of game.sim.Match instances whose AI sides are driven
+by one BatchAI:
+
+    pool = MatchPool([Match(left=ScriptedController(log), seed=s) for s in range(5000)])
+    pool.run()
+
+Run from src/:  python -m game.batch_ai --matches 2000   (prints throughput)
+"""
+import argparse
+import time
+
+import numpy as np
+
+from game.sim import Match, IdleController, AI_ROPE_CENTER, AI_START_PAUSE
+
+DRAWS_PER_FRAME = 8
+THRESHOLD = 10
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def _uniform(keys, counters):
+    """splitmix64(key + counter * golden) -> doubles in [0, 1); same shape as counters."""
+    z = keys + counters * _GOLDEN
+    z = (z ^ (z >> np.uint64(30))) * _MIX1
+    z = (z ^ (z >> np.uint64(27))) * _MIX2
+    z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def stream_key(seed, slot=0):
+    """64-bit RNG stream key for (match seed, slot within the match)."""
+    mask = 0xFFFFFFFFFFFFFFFF
+    z = (seed * 0x9E3779B97F4A7C15 + slot + 1) & mask
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+    return z ^ (z >> 31)
+
+
+class BatchAI:
+    """Struct-of-arrays AI parameters plus one RNG stream per slot."""
+    def __init__(self, players, keys, rope_center, specials=True):
+        n = len(players)
+        self.n = n
+        # one center per slot (matches may differ in width), or one for all
+        self.rope_center = np.broadcast_to(np.asarray(rope_center, dtype=np.float64), (n,))
+        self.specials = specials
+        f = lambda attr: np.array([getattr(p, attr) for p in players], dtype=np.float64)
+        i = lambda attr, k: np.array([getattr(p, attr)[k] for p in players], dtype=np.int64)
+        self.is_left = np.array([p.side == "left" for p in players], dtype=bool)
+        self.aggressiveness = f("ai_aggressiveness")
+        self.bias_idle = np.array([p.ai_respond_bias[0] for p in players], dtype=np.float64)
+        self.bias_active = np.array([p.ai_respond_bias[1] for p in players], dtype=np.float64)
+        self.burst_lo, self.burst_hi = i("ai_burst_frames", 0), i("ai_burst_frames", 1)
+        self.pause_lo, self.pause_hi = i("ai_pause_frames", 0), i("ai_pause_frames", 1)
+        self.opportunistic = f("ai_opportunistic_chance")
+        self.clone_wish = f("ai_clone_wish")
+        self.bomb_wish = f("ai_bomb_wish")
+        self.clone_chance = f("ai_clone_chance")
+        self.bomb_chance = f("ai_bomb_chance")
+        self.keys = np.asarray(keys, dtype=np.uint64).reshape(n)
+        self.counters = np.zeros(n, dtype=np.uint64)
+        self._offsets = np.arange(DRAWS_PER_FRAME, dtype=np.uint64)
+
+    @staticmethod
+    def observe(players, opponents, rope_pos):
+        """Gather the per-frame observation arrays for the given slots."""
+        return {
+            "rope_pos": np.asarray(rope_pos, dtype=np.float64),
+            "opponent_pull": np.array([o.pull for o in opponents], dtype=np.float64),
+            "freeze": np.array([p.freeze_timer for p in players], dtype=np.int64),
+            "pause": np.array([p.ai_pause_timer for p in players], dtype=np.int64),
+            "burst": np.array([p.ai_burst_timer for p in players], dtype=np.int64),
+            "cooldown": np.array([p.clone_cooldown_timer for p in players], dtype=np.int64),
+            "clone_used": np.array([p.clone_used for p in players], dtype=bool),
+            "clone_active": np.array([p.clone_active for p in players], dtype=bool),
+            "bomb_used": np.array([p.bomb_used for p in players], dtype=bool),
+        }
+
+    def decide(self, obs, active=None):
+        """One frame of decisions for every slot (or the `active` index array).
+
+        Returns arrays: burst, pause (new timer values), wants_clone, wants_bomb
+        (ai_act's flags) and clone, bomb (Game.run's post-update special roll).
+        """
+        sel = slice(None) if active is None else active
+        counters = self.counters[sel]
+        u = _uniform(self.keys[sel][:, None], counters[:, None] + self._offsets[None, :])
+        self.counters[sel] = counters + np.uint64(DRAWS_PER_FRAME)
+
+        free = obs["freeze"] == 0
+        pause = np.where(free & (obs["pause"] > 0), obs["pause"] - 1, obs["pause"])
+        rope_pos = obs["rope_pos"]
+        center = self.rope_center[sel]
+        cond = np.where(self.is_left[sel], rope_pos > center + THRESHOLD, rope_pos < center - THRESHOLD)
+        opp_idle = obs["opponent_pull"] == 0
+        bias = np.where(opp_idle, self.bias_idle[sel], self.bias_active[sel])
+        chance = np.minimum(1.0, self.aggressiveness[sel] + bias)
+
+        respond = free & (pause == 0) & cond & (u[:, 0] < chance)
+        opportunistic = free & ~respond & opp_idle & (u[:, 3] < self.opportunistic[sel])
+        start = respond | opportunistic
+
+        blo, bhi = self.burst_lo[sel], self.burst_hi[sel]
+        plo, phi = self.pause_lo[sel], self.pause_hi[sel]
+        burst = np.where(start, blo + (u[:, 1] * (bhi - blo + 1)).astype(np.int64), obs["burst"])
+        pause = np.where(start, plo + (u[:, 2] * (phi - plo + 1)).astype(np.int64), pause)
+
+        rest = free & ~start
+        wants_clone = rest & ~obs["clone_used"] & ~obs["clone_active"] & (u[:, 4] < self.clone_wish[sel])
+        wants_bomb = rest & ~obs["bomb_used"] & (u[:, 5] < self.bomb_wish[sel])
+
+        # Game.run rolls specials after the update: freeze/cooldown one frame on
+        freeze_after = np.maximum(obs["freeze"] - 1, 0)
+        cooldown_after = np.maximum(obs["cooldown"] - 1, 0)
+        if self.specials:
+            clone = ~obs["clone_used"] & (cooldown_after == 0) & (freeze_after == 0) & (u[:, 6] < self.clone_chance[sel])
+            bomb = ~obs["bomb_used"] & (freeze_after == 0) & (u[:, 7] < self.bomb_chance[sel])
+        else:
+            clone = bomb = np.zeros(len(pause), dtype=bool)
+        return {"burst": burst, "pause": pause, "wants_clone": wants_clone, "wants_bomb": wants_bomb,
+                "clone": clone, "bomb": bomb, "frozen": ~free}
+
+
+class _BatchedController(IdleController):
+    """Per-slot controller: applies the pool's precomputed post-update specials."""
+    def __init__(self):
+        self.clone = False
+        self.bomb = False
+
+    def after_update(self, match, player, opponent):
+        if self.clone and not player.clone_used:
+            player.activate_clone()
+        if self.bomb and not player.bomb_used and player.freeze_timer == 0:
+            match.spawn_bomb(player, opponent)
+        self.clone = self.bomb = False
+
+    def quiet_ticks(self, match, player, opponent):
+        return 0
+
+
+class MatchPool:
+    """Step many headless matches in lockstep with one BatchAI for all AI sides.
+
+    The sides named in ai_sides are taken over by the batch; the caller builds
+    each Match with the other side's controller already set.
+    """
+    def __init__(self, matches, ai_sides=("right",), rope_center=AI_ROPE_CENTER):
+        self.matches = list(matches)
+        self.slots = []        # (match index, player, opponent, controller)
+        keys = []
+        centers = []
+        for mi, m in enumerate(self.matches):
+            for side in ai_sides:
+                player = m.left if side == "left" else m.right
+                opponent = m.right if side == "left" else m.left
+                ctrl = _BatchedController()
+                m.controllers[side] = ctrl
+                player.ai_pause_timer = AI_START_PAUSE
+                seed = m.rng.getrandbits(64)
+                keys.append(stream_key(seed, 0 if side == "left" else 1))
+                centers.append(m.rope.center if rope_center is None else rope_center)
+                self.slots.append((mi, player, opponent, ctrl))
+        self.ai = BatchAI([s[1] for s in self.slots], keys, rope_center=centers)
+
+    def step(self):
+        """One frame for every unfinished match. Returns how many are still running."""
+        live = [k for k, s in enumerate(self.slots) if not self.matches[s[0]].game_over]
+        if not live:
+            return 0
+        slots = [self.slots[k] for k in live]
+        players = [s[1] for s in slots]
+        obs = BatchAI.observe(players, [s[2] for s in slots], [self.matches[s[0]].rope.pos for s in slots])
+        d = self.ai.decide(obs, np.array(live, dtype=np.int64))
+
+        burst, pause = d["burst"].tolist(), d["pause"].tolist()
+        frozen = d["frozen"].tolist()
+        wants_clone, wants_bomb = d["wants_clone"].tolist(), d["wants_bomb"].tolist()
+        clone, bomb = d["clone"].tolist(), d["bomb"].tolist()
+        for j, (mi, player, opponent, ctrl) in enumerate(slots):
+            if not frozen[j]:
+                player.ai_burst_timer = burst[j]
+                player.ai_pause_timer = pause[j]
+                if wants_clone[j]:
+                    player.ai_wants_clone = True
+                if wants_bomb[j]:
+                    player.ai_wants_bomb = True
+            ctrl.clone = clone[j]
+            ctrl.bomb = bomb[j]
+
+        running = 0
+        for m in self.matches:
+            if not m.game_over:
+                m.step()
+                running += not m.game_over
+        return running
+
+    def run(self, max_ticks=60 * 60 * 2):
+        for _ in range(max_ticks):
+            if not self.step():
+                break
+        return [m.winner for m in self.matches]
+
+
+def main(argv=None):
+    from game.sim import ScriptedController
+    parser = argparse.ArgumentParser(description="Batched AI throughput check.")
+    parser.add_argument("--matches", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args(argv)
+
+    matches = [Match(left=ScriptedController([(t, "pull") for t in range(0, args.frames, 9)]), seed=s)
+               for s in range(args.matches)]
+    pool = MatchPool(matches)
+    start = time.perf_counter()
+    frames = 0
+    for _ in range(args.frames):
+        live = sum(not m.game_over for m in pool.matches)
+        if not pool.step():
+            break
+        frames += live
+    elapsed = time.perf_counter() - start
+
+    obs = BatchAI.observe([s[1] for s in pool.slots], [s[2] for s in pool.slots],
+                          [pool.matches[s[0]].rope.pos for s in pool.slots])
+    t0 = time.perf_counter()
+    for _ in range(100):
+        pool.ai.decide(obs)
+    decide_us = (time.perf_counter() - t0) / 100 / max(1, pool.ai.n) * 1e6
+
+    print(f"[batch_ai] {args.matches} matches, {frames} match-frames in {elapsed:.2f}s "
+          f"({frames / elapsed:.0f} match-frames/s); decide: {decide_us:.3f} us per AI")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Headless frame capture: the real draw paths rendered offscreen, read as NumPy views.
+
+FrameCapture opens the display with SDL's dummy video driver, builds a Game
+(assets loaded synchronously, random streams seeded) and steps it with
+Game.run(max_frames=1) - so the menu, gameplay and game-over frames come out
+of draw_menu / draw_playfield / draw_game_over exactly as in the game.
+
+frame() is pygame.surfarray.pixels3d of the display: a (width, height, 3)
+uint8 view of the surface memory, no copy. The view keeps the display
+locked, so drop it before stepping again (step() raises if it's still alive):
+
+    cap = FrameCapture()
+    px = cap.scene("gameplay")
+    assert compare(px, "golden/gameplay-800x480.png") == 0
+    del px
+
+With backend="texture" (or "texture-software") the game draws through a
+game.texrender.TextureScreen on a hidden SDL window instead, and frame() is
+a view of the frame read back from the renderer (a copy, so no lock).
+
+Run from src/:  python -m game.capture --golden ../tests/golden --update    (write the golden frames)
+                python -m game.capture --golden ../tests/golden             (check; exit 1 on a mismatch)
+                python -m game.capture --bench 600                           (gameplay frames per second)
+                python -m game.capture --bench 600 --backend texture         (same scenes, SDL2 renderer)
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from game.view import LOGICAL_SIZE, Viewport
+
+SCENES = ("menu", "gameplay", "game_over")
+GAMEPLAY_FRAMES = 60    # frames of scripted play before a gameplay capture
+TOLERANCE = 2           # per-channel difference still counted as a match
+
+
+class FrameCapture:
+    def __init__(self, size=LOGICAL_SIZE, mode="native", seed=0, backend="surface"):
+        """size is the physical display (the logical canvas stays 800x480); mode as in game.view."""
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        from game.core import Game
+        pygame.display.init()
+        pygame.font.init()
+        self.texture = None
+        view = Viewport(size, LOGICAL_SIZE, mode=mode)
+        if backend == "surface":
+            self.display = pygame.display.set_mode(view.physical)
+            screen = view.target(self.display)
+        else:
+            from game.texrender import TextureScreen
+            view = Viewport(size, LOGICAL_SIZE)     # always native, see game.texrender
+            screen = self.texture = TextureScreen(view.physical, software=backend == "texture-software",
+                                                  hidden=True)
+            self.display = pygame.display.get_surface()
+        self.game = Game(screen, LOGICAL_SIZE[0], LOGICAL_SIZE[1], ai=True, view=view)
+        self.game.ai_enabled = True
+        self.seed = seed
+        self.frames = 0
+
+    def close(self):
+        if self.texture is not None:
+            self.texture.close()
+        pygame.display.quit()
+
+    def _seed(self):
+        # the 1P AI, its specials and the particles are the only random streams
+        random.seed(self.seed)
+        self.game.particles.seed(self.seed)
+
+    def step(self, keys=()):
+        """One full game frame (events, update, draw); keys are pressed at its start."""
+        if self.display.get_locked():
+            raise RuntimeError("a frame view still locks the display; drop it before stepping")
+        for key in keys:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+        self.game.run(max_frames=1)
+        self.frames += 1
+
+    def frame(self):
+        """The last frame as a (width, height, 3) view of the display (no copy)."""
+        if self.texture is not None:
+            return pygame.surfarray.pixels3d(self.texture.to_surface())
+        return pygame.surfarray.pixels3d(self.display)
+
+    def play(self, frames):
+        """Scripted 1P gameplay: tap A every 10 frames, clone at 20, bomb at 30."""
+        for i in range(frames):
+            keys = []
+            if i % 10 == 0:
+                keys.append(pygame.K_a)
+            if i == 20:
+                keys.append(pygame.K_f)
+            if i == 30:
+                keys.append(pygame.K_d)
+            self.step(keys)
+
+    def scene(self, name, frames=GAMEPLAY_FRAMES):
+        """Render one of SCENES from a fresh round and return its frame view."""
+        game = self.game
+        game.reset()
+        self._seed()
+        if name == "menu":
+            self.step()
+        elif name in ("gameplay", "game_over"):
+            game.start()
+            self.play(frames)
+            if name == "game_over":
+                # pull the rope over the line; the next frame ends the match
+                game.rope.pos = game.rope.min_x
+                self.step()
+        else:
+            raise ValueError(f"unknown scene {name!r}; expected one of {SCENES}")
+        return self.frame()
+
+
+def save_golden(pixels, path):
+    pygame.image.save(pygame.surfarray.make_surface(pixels), path)
+
+
+def compare(pixels, golden_path, tolerance=TOLERANCE):
+    """Number of pixels off from the golden image by more than tolerance in a channel (0 = match)."""
+    golden = pygame.surfarray.pixels3d(pygame.image.load(golden_path))
+    if golden.shape != pixels.shape:
+        return pixels.shape[0] * pixels.shape[1]
+    diff = np.abs(pixels.astype(np.int16) - golden)
+    return int(np.count_nonzero((diff > tolerance).any(axis=2)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless frame capture: golden-image checks and render fps.")
+    parser.add_argument("--golden", help="directory of golden frames (<scene>-<WxH>.png)")
+    parser.add_argument("--update", action="store_true", help="write the golden frames instead of checking")
+    parser.add_argument("--bench", type=int, default=0, help="render this many gameplay frames and report fps")
+    parser.add_argument("--size", default="800x480", help="display size (WxH)")
+    parser.add_argument("--mode", default="native", choices=("native", "canvas"))
+    parser.add_argument("--backend", default="surface", choices=("surface", "texture", "texture-software"))
+    parser.add_argument("--tolerance", type=int, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    cap = FrameCapture((w, h), args.mode, backend=args.backend)
+    failed = 0
+    if args.golden:
+        os.makedirs(args.golden, exist_ok=True)
+        for name in SCENES:
+            path = os.path.join(args.golden, f"{name}-{w}x{h}.png")
+            pixels = cap.scene(name)
+            if args.update:
+                save_golden(pixels, path)
+                print(f"[capture] wrote {path}")
+            elif not os.path.exists(path):
+                print(f"[capture] {name}: no golden frame at {path}")
+                failed += 1
+            else:
+                bad = compare(pixels, path, args.tolerance)
+                print(f"[capture] {name}: {'ok' if not bad else f'{bad} pixels differ'}")
+                failed += bad > 0
+            del pixels
+
+    if args.bench:
+        cap.scene("gameplay", frames=0)
+        step_t = view_t = 0.0
+        for i in range(args.bench):
+            if cap.game.game_over:
+                cap.game.reset()
+                cap.game.start()
+            t0 = time.perf_counter()
+            cap.step([pygame.K_a] if i % 5 == 0 else ())
+            t1 = time.perf_counter()
+            pixels = cap.frame()
+            checksum = int(pixels[::97, ::89].sum())     # touch the view like a test would
+            del pixels
+            view_t += time.perf_counter() - t1
+            step_t += t1 - t0
+        n = args.bench
+        print(f"[capture] {n} gameplay frames at {w}x{h} ({args.backend}, {args.mode}): {n / step_t:.0f} fps "
+              f"({step_t / n * 1000:.2f} ms/frame), frame view {view_t / n * 1e6:.1f} us (checksum {checksum})")
+    cap.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
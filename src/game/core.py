@@ -2,52 +2,25 @@ import sys
 import pygame
 from .player import Player
 from .rope import Rope
-from .utils import load_image, load_sound, load_music
-from game.projectile import Bomb
+from .utils import load_image, load_scaled
+from .view import Viewport
+from .render import RenderQueue, primitive
+from .particles import ParticleSystem
+from .effects import EffectManager, FRAME_MS
+from .team import Team, MAX_TEAM_SIZE
+from .telemetry import BOMB_SPAWN, BOMB_IMPACT
+from .replay import save_replay
+from .eventlog import log
+from game.projectile import launch_bomb, hitbox
 import random
 import os
-import pygame
 
-# Minimal SpriteEffect implementation used by spawn_effect.
-# Provides update(), draw() and finished flag so effects list in Game works.
-class SpriteEffect:
-    def __init__(self, x, y, frames, frame_rate=12):
-        # x,y are screen coordinates (center)
-        self.x = int(x)
-        self.y = int(y)
-        # store frames (list of pygame.Surface)
-        self.frames = list(frames) if frames is not None else []
-        # frame_rate is number of game ticks per frame (must be >=1)
-        try:
-            self.frame_rate = max(1, int(frame_rate))
-        except Exception:
-            self.frame_rate = 12
-        self._tick = 0
-        self._index = 0
-        self.finished = False
+SLOW_FRAME_MS = 50      # frames taking longer are logged (game.eventlog category "frame")
 
-    def update(self):
-        if self.finished or not self.frames:
-            return
-        self._tick += 1
-        if self._tick >= self.frame_rate:
-            self._tick = 0
-            self._index += 1
-            if self._index >= len(self.frames):
-                # mark finished and clamp index to last frame
-                self.finished = True
-                self._index = max(0, len(self.frames) - 1)
-
-    def draw(self, surface):
-        if not self.frames or surface is None:
-            return
-        try:
-            img = self.frames[self._index]
-            rect = img.get_rect(center=(self.x, self.y))
-            surface.blit(img, rect)
-        except Exception:
-            # safe no-op on any drawing error
-            pass
+# spectator mode (AI vs AI): speed is match ticks per displayed frame
+MAX_SPEED = 32
+SPECTATE_HOLD_FRAMES = 45               # displayed frames the result stays up before the next match
+FAST_SFX = ("clone", "explosion", "win")  # the only sounds played above 1x, once per frame each
 
 def load_sequence(folder_name, pad=3):
     """Load frames named folder_name/frame_###.png from sprites folder."""
@@ -63,30 +36,28 @@ def load_sequence(folder_name, pad=3):
     return frames
 
 class Game:
-    def __init__(self, screen, width, height, ai=False):
+    def __init__(self, screen, width, height, ai=False, sounds=None, music=None, assets=None, view=None):
         self.screen = screen
+        # width/height are the logical canvas all rules and layout use; the
+        # game.view.Viewport maps it onto the physical display
         self.width = width
         self.height = height
-
-        # try common filename variants for the menu background
-        bg_candidates = ["homepage bg.jpg", "homepage-bg.jpg", "homepage_bg.jpg", "homepage.jpg"]
-        self.menu_bg = None
-        for name in bg_candidates:
-            img = load_image(name)
-            if img:
-                self.menu_bg = img
-                print(f"[debug] menu background loaded: {name}")
-                break
-        if self.menu_bg:
-            try:
-                self.menu_bg = pygame.transform.smoothscale(self.menu_bg, (self.width, self.height))
-            except Exception:
-                self.menu_bg = pygame.transform.scale(self.menu_bg, (self.width, self.height))
-        else:
-            print("[debug] menu background not found; checked:", bg_candidates)
+        self.view = view or Viewport((width, height), (width, height))
+        # gameplay sprites are gathered here and submitted in batches (see draw_playfield)
+        self.render_queue = RenderQueue()
+        # preloaded game.audio.MusicPlayer (set by main.py); _set_music crossfades through it
+        self.music = music
+        # optional game.assets.AssetLoader: images are decoded on its worker thread
+        # and picked up by _poll_assets(); without one everything loads right here
+        self.assets = assets
+        self._start_pending = False
+        load_now = assets is None
+
+        self.menu_bg = self._load_menu_bg() if load_now else None
 
         # -------- Determination font (robust lookup + debug) --------
         pygame.font.init()
+        fs = self.view.px     # font sizes are in logical pixels too
         font_candidates = [
             os.path.join(os.path.dirname(__file__), "..", "assets", "fonts", "determination.ttf"),
             os.path.join(os.path.dirname(__file__), "..", "..", "src", "assets", "fonts", "determination.ttf"),
@@ -104,26 +75,26 @@ class Game:
         if font_path:
             try:
                 # even smaller sizes
-                self.menu_font = pygame.font.Font(font_path, 28)
-                self.menu_small_font = pygame.font.Font(font_path, 14)
-                self.menu_hint_font = pygame.font.Font(font_path, 12)
-                self.menu_label_font = pygame.font.Font(font_path, 12)
-                self.determination_hint_font = pygame.font.Font(font_path, 10)
-                print(f"[debug] loaded determination.ttf from: {font_path}")
+                self.menu_font = pygame.font.Font(font_path, fs(28))
+                self.menu_small_font = pygame.font.Font(font_path, fs(14))
+                self.menu_hint_font = pygame.font.Font(font_path, fs(12))
+                self.menu_label_font = pygame.font.Font(font_path, fs(12))
+                self.determination_hint_font = pygame.font.Font(font_path, fs(10))
+                log.debug("asset", "loaded determination.ttf from %s", font_path)
             except Exception as e:
-                print(f"[debug] failed to load determination.ttf from {font_path}: {e}")
-                self.menu_font = pygame.font.SysFont(None, 28)
-                self.menu_small_font = pygame.font.SysFont(None, 14)
-                self.menu_hint_font = pygame.font.SysFont(None, 12)
-                self.menu_label_font = pygame.font.SysFont(None, 12)
-                self.determination_hint_font = pygame.font.SysFont(None, 10)
+                log.warning("asset", "failed to load determination.ttf from %s: %s", font_path, e)
+                self.menu_font = pygame.font.SysFont(None, fs(28))
+                self.menu_small_font = pygame.font.SysFont(None, fs(14))
+                self.menu_hint_font = pygame.font.SysFont(None, fs(12))
+                self.menu_label_font = pygame.font.SysFont(None, fs(12))
+                self.determination_hint_font = pygame.font.SysFont(None, fs(10))
         else:
-            print("[debug] determination.ttf not found. Checked:", font_candidates)
-            self.menu_font = pygame.font.SysFont(None, 28)
-            self.menu_small_font = pygame.font.SysFont(None, 14)
-            self.menu_hint_font = pygame.font.SysFont(None, 12)
-            self.menu_label_font = pygame.font.SysFont(None, 12)
-            self.determination_hint_font = pygame.font.SysFont(None, 10)
+            log.warning("asset", "determination.ttf not found; checked %s", font_candidates)
+            self.menu_font = pygame.font.SysFont(None, fs(28))
+            self.menu_small_font = pygame.font.SysFont(None, fs(14))
+            self.menu_hint_font = pygame.font.SysFont(None, fs(12))
+            self.menu_label_font = pygame.font.SysFont(None, fs(12))
+            self.determination_hint_font = pygame.font.SysFont(None, fs(10))
         # ------------------------------------------------------------
 
         # create clock and players first so we can align rope to their center
@@ -134,23 +105,23 @@ class Game:
         player_height = 120
         left_margin = 100
         right_margin = width - 100 - player_width
-        self.left = Player(left_margin, self.height // 2 + 20, player_width, player_height, 'left', 'boy-push.png', 'boy-pull.png')
-        self.right = Player(right_margin, self.height // 2 + 20, player_width, player_height, 'right', 'girl-push.png', 'girl-pull.png')
+        self.left = Player(left_margin, self.height // 2 + 20, player_width, player_height, 'left', 'boy-push.png', 'boy-pull.png', load=load_now, view=self.view)
+        self.right = Player(right_margin, self.height // 2 + 20, player_width, player_height, 'right', 'girl-push.png', 'girl-pull.png', load=load_now, view=self.view)
         left_center = left_margin + (self.left.width // 2)
         right_center = self.width - left_center
         self.right.x = int(right_center - (self.right.width // 2))
 
         # create rope and align it to player center
-        self.rope = Rope(self.width, self.height)
+        self.rope = Rope(self.width, self.height, load=load_now, view=self.view)
         try:
             self.rope.y = self.left.y
         except Exception:
             pass
 
         # fonts doubled for larger window
-        self.font = pygame.font.SysFont(None, 48)
-        self.title_font = pygame.font.SysFont(None, 72)
-        self.small_font = pygame.font.SysFont(None, 28)
+        self.font = pygame.font.SysFont(None, fs(48))
+        self.title_font = pygame.font.SysFont(None, fs(72))
+        self.small_font = pygame.font.SysFont(None, fs(28))
         self.game_over = False
         self.winner = None
 
@@ -174,40 +145,144 @@ class Game:
             pass
 
         # load gameplay background (put file at src/assets/sprites/gameplay-bg.png)
-        self.game_bg = load_image("gameplay-bg.png")
-        if self.game_bg:
-            try:
-                self.game_bg = pygame.transform.smoothscale(self.game_bg, (self.width, self.height))
-            except Exception:
-                pass
+        self.game_bg = self._load_game_bg() if load_now else None
 
         # preload clone smoke frames (folder: src/assets/sprites/clone-smoke/)
-        try:
-            self.clone_smoke_frames = load_sequence("clone-smoke")
-        except Exception:
-            self.clone_smoke_frames = []
+        self.clone_smoke_frames = []
+        if load_now:
+            try:
+                self.clone_smoke_frames = load_sequence("clone-smoke")
+            except Exception:
+                self.clone_smoke_frames = []
 
-        # active particle/effect list
-        self.effects = []
+        # sprite-sequence effects (clone smoke, explosions): one pool shared with the players
+        self.effects = EffectManager()
+        self.left.effects = self.effects
+        self.right.effects = self.effects
 
         # active projectiles (bombs)
         self.projectiles = []
 
-        clone_sound = load_sound("clone-smoke.wav")
-        if clone_sound:
-            clone_sound.set_volume(0.9)
+        # explosion, clone and pull particles (game.particles); the players emit into it too
+        self.particles = ParticleSystem(view=self.view)
+        self.left.particles = self.particles
+        self.right.particles = self.particles
+
+        # team matches: game.team.Team squads behind each Player (see set_team_size)
+        self.left_team = None
+        self.right_team = None
 
-        # attach clone sound to this Game instance instead of creating a nested Game
-        self.clone_sound = clone_sound
+        # preloaded game.audio.SoundBank (set by main.py); the old per-sound
+        # attributes (pull_sound, clone_sound, ...) still work when it's None
+        self.sounds = sounds
 
         self.running = True  # add this line
 
+        # optional live win-chance meter (game.winprob.WinProbability, set by main.py)
+        self.win_meter = None
+        self.win_meter_every = 15     # frames between snapshots handed to the meter
+        self._win_meter_frame = 0
+
+        # optional per-tick recorder (game.telemetry.TelemetryWriter, set by main.py)
+        self.telemetry = None
+
+        # optional results ledger (game.ledger.Ledger, set by main.py); the AI
+        # side is rated as "ai:<ai_label>" so each difficulty preset has a rating;
+        # spectated AI-vs-AI matches aren't recorded
+        self.ledger = None
+        self.ai_label = "default"
+        self.match_ticks = 0
+
+        # optional replay recording (directory set by main.py): each round is
+        # seeded and its key presses logged per side, see game.replay
+        self.replays = None
+        self.round_seed = None
+        self.input_log = None
+
+        # spectator mode (see spectate()): both sides AI, speed ticks per displayed
+        # frame. Rules and Player timers still step once per tick; effects,
+        # particles and the menu flicker advance once per displayed frame
+        self.spectating = False
+        self.speed = 1
+        self.spectate_hold = SPECTATE_HOLD_FRAMES   # None: stay on the result (replay export)
+        self.spectated_matches = 0
+        self._hold_frames = 0
+        self._render_tick = True    # False on the ticks of a frame that won't be drawn
+        self._frame_sfx = set()
+
+        if assets is not None:
+            self._queue_assets(assets)
+
+    def _load_menu_bg(self):
+        # try common filename variants for the menu background
+        bg_candidates = ["homepage bg.jpg", "homepage-bg.jpg", "homepage_bg.jpg", "homepage.jpg"]
+        menu_bg = None
+        for name in bg_candidates:
+            # scaled to the window and cached on disk in that form
+            img = load_scaled(name, self.view.size(self.width, self.height))
+            if img:
+                menu_bg = img
+                log.debug("asset", "menu background loaded: %s", name)
+                break
+        if not menu_bg:
+            log.warning("asset", "menu background not found; checked %s", bg_candidates)
+        return menu_bg
+
+    def _load_game_bg(self):
+        return load_scaled("gameplay-bg.png", self.view.size(self.width, self.height))
+
+    def _queue_assets(self, assets):
+        """Queue image decoding on the loader: menu first, gameplay streaming in behind it.
+
+        Players and rope load into their own (not yet drawn) objects; gameplay
+        doesn't start until the loader is done, see _request_start().
+        """
+        from .assets import MENU
+        from .projectile import bomb_image, BOMB_SIZE
+        assets.add("menu_bg", self._load_menu_bg, priority=MENU)
+        assets.add("game_bg", self._load_game_bg)
+        assets.add("left", self.left.load_sprites)
+        assets.add("right", self.right.load_sprites)
+        assets.add("rope", self.rope.load_images)
+        assets.add("clone_smoke", load_sequence, "clone-smoke")
+        assets.add("bomb", bomb_image, self.view.size(BOMB_SIZE, BOMB_SIZE))
+
+    def _poll_assets(self):
+        """Main thread: take over whatever the loader finished since last frame."""
+        assets = getattr(self, "assets", None)
+        if assets is None:
+            return
+        for name in assets.take_finished():
+            if name == "menu_bg":
+                self.menu_bg = assets.get(name)
+            elif name == "game_bg":
+                self.game_bg = assets.get(name)
+            elif name == "clone_smoke":
+                self.clone_smoke_frames = assets.get(name) or []
+        if self._start_pending and assets.ready():
+            self._start_pending = False
+            self.start()
+
+    def _request_start(self):
+        """Start now if gameplay assets are in, otherwise as soon as they are."""
+        assets = getattr(self, "assets", None)
+        if assets is None or assets.ready():
+            self.start()
+        else:
+            self._start_pending = True
+
     def _set_music(self, which):
         """Set background music for 'menu' or 'gameplay' reliably.
 
-        Stops any playing pygame.mixer.music and any previously played Sound object
-        before starting the requested track to avoid overlap.
+        With a MusicPlayer this is a non-blocking crossfade between preloaded
+        tracks. Otherwise it stops any playing pygame.mixer.music and any
+        previously played Sound object before starting the requested track.
         """
+        player = getattr(self, "music", None)
+        if player is not None:
+            player.play(which)
+            return
+
         try:
             music_obj = getattr(self, f"{which}_music", None)
         except Exception:
@@ -246,7 +321,7 @@ class Game:
                 pygame.mixer.music.play(-1)
                 self._playing_music_mode = "mixer"
             except Exception as e:
-                print(f"[music] failed to load/play {which} ({music_obj}): {e}")
+                log.warning("audio", "failed to load/play %s music (%s): %s", which, music_obj, e)
             return
 
         # Otherwise assume it's a pygame.mixer.Sound — play but track it so we can stop later
@@ -260,10 +335,20 @@ class Game:
             self._playing_music_sound = music_obj
             self._playing_music_mode = "sound"
         except Exception as e:
-            print(f"[music] failed to play Sound for {which}: {e}")
+            log.warning("audio", "failed to play Sound for %s music: %s", which, e)
 
-    def _maybe_play_select_sound(self):
-        snd = getattr(self, "select_sound", None)
+    def _play_sfx(self, name):
+        """Play effect `name` through the sound bank, or the legacy `<name>_sound` attribute."""
+        if self.spectating and self.speed > 1:
+            # fast-forward: only the big moments, each at most once per displayed frame
+            if name not in FAST_SFX or name in self._frame_sfx:
+                return
+            self._frame_sfx.add(name)
+        bank = getattr(self, "sounds", None)
+        if bank is not None:
+            bank.play(name)
+            return
+        snd = getattr(self, f"{name}_sound", None)
         if snd is None:
             return
         try:
@@ -271,14 +356,24 @@ class Game:
         except Exception:
             pass
 
+    def _maybe_play_select_sound(self):
+        self._play_sfx("select")
+
     def start(self):
         """Start the game (used by tests)."""
+        # recorded rounds are seeded so game.replay can play them back exactly
+        if self.replays is not None:
+            self.round_seed = random.randrange(1 << 32)
+        if self.round_seed is not None:
+            self._seed_round(self.round_seed)
+            self.input_log = {"left": [], "right": []}
         # set the state the tests expect
         self.state = "running"
         # reset gameplay state when starting a new round
         self.game_over = False
         self.winner = None
-        self.rope = Rope(self.width, self.height)
+        # reuse the loaded rope sprites; only the rules state starts over
+        self.rope.recenter()
 
         # align rope with player center on start
         try:
@@ -286,55 +381,34 @@ class Game:
         except Exception:
             pass
 
-        # reset clone state so players get their one chance this round
-        try:
-            self.left.clone_active = False
-            self.left.clone_timer = 0
-            self.left.clone_used = False
-            self.right.clone_active = False
-            self.right.clone_timer = 0
-            self.right.clone_used = False
-        except Exception:
-            pass
-
-        # clear pulls and previous-pull trackers
-        self.left.pull = 0
-        self.right.pull = 0
+        # reset clone state, pulls and timers, then apply the canonical round
+        # rules (PULL_POWER, TAP_DURATION, stamina) to both sides
+        self.left.begin_round()
+        self.right.begin_round()
+        if self.left_team is not None:
+            self.left_team.begin_round()
+            self.right_team.begin_round()
+            # a human leader's squad pulls on the leader's taps; the 1P AI's squad is AI too
+            self.left_team.ai_enabled = self.spectating
+            self.right_team.ai_enabled = bool(self.ai_enabled)
+
+        # clear previous-pull trackers
         self.left_prev_pull = 0
         self.right_prev_pull = 0
-
-        # reset player timers so no leftover tap/AI burst triggers a forced start
-        self.left.tap_timer = 0
-        self.right.tap_timer = 0
-        self.left.ai_burst_timer = 0
-        self.right.ai_burst_timer = 0
-        self.left.ai_pause_timer = 0
-        self.right.ai_pause_timer = 0
-
-        # --- enforce strict symmetry so each tap moves the rope equally ---
-        # make each pull half strength to increase difficulty
-        PULL_POWER = 3          # single canonical pull strength for both sides (halved)
-        TAP_DURATION = 6        # frames a tap lasts
-        MAX_STAMINA = 100.0
-        STAMINA_DRAIN = 1.5
-        STAMINA_REGEN = 0.8
-
-        self.left.pull_strength = PULL_POWER
-        self.right.pull_strength = PULL_POWER
-        self.left.tap_duration = TAP_DURATION
-        self.right.tap_duration = TAP_DURATION
-        self.left.max_stamina = MAX_STAMINA
-        self.right.max_stamina = MAX_STAMINA
-        self.left.stamina = MAX_STAMINA
-        self.right.stamina = MAX_STAMINA
-        self.left.stamina_drain = STAMINA_DRAIN
-        self.right.stamina_drain = STAMINA_DRAIN
-        self.left.stamina_regen = STAMINA_REGEN
-        self.right.stamina_regen = STAMINA_REGEN
+        self.particles.clear()
+        # the clone smoke is spawned once per activation, so once per round
+        self.left.clone_effect_spawned = False
+        self.right.clone_effect_spawned = False
 
         # give AI a short initial pause so it doesn't burst immediately on game start
         if self.ai_enabled:
             self.right.ai_pause_timer = 12  # ~0.2s at 60fps; increase if needed
+        if self.spectating:
+            self.left.ai_pause_timer = 12
+
+        self.match_ticks = 0
+        if self.telemetry is not None:
+            self.telemetry.begin_match()
 
         # switch to gameplay music if available
         try:
@@ -342,6 +416,46 @@ class Game:
         except Exception:
             pass
 
+    def spectate(self, speed=1):
+        """AI vs AI spectator mode: matches start on their own, speed ticks per displayed frame."""
+        self.spectating = True
+        self.ai_enabled = True
+        self.set_speed(speed)
+
+    def set_speed(self, speed):
+        self.speed = max(1, min(int(speed), MAX_SPEED))
+        log.info("game", "spectator speed %dx", self.speed)
+
+    def _ai_sides(self):
+        """(player, opponent) pairs the AI drives: the right side in 1P, both when spectating."""
+        if self.spectating:
+            return ((self.left, self.right), (self.right, self.left))
+        if getattr(self, "ai_enabled", False):
+            return ((self.right, self.left),)
+        return ()
+
+    def _spectator_frame(self):
+        """Start the first match, and the next one once a result has been up for a while."""
+        if self.state == "waiting":
+            if not self._start_pending:
+                self._request_start()
+        elif self.game_over and self.spectate_hold is not None:
+            self._hold_frames += 1
+            if self._hold_frames >= self.spectate_hold:
+                self._hold_frames = 0
+                self._next_round()
+
+    def _next_round(self):
+        # reset() without the trip through the menu (and its music)
+        self.projectiles = []
+        self.effects.clear()
+        self.left.reset()
+        self.right.reset()
+        if self.left_team is not None:
+            self.left_team.reset()
+            self.right_team.reset()
+        self.start()
+
     def end(self):
         """End the current game (used by tests)."""
         self.game_over = True
@@ -355,7 +469,7 @@ class Game:
             self.winner = None
             self.state = "waiting"  # return to menu
             try:
-                self.rope.reset()
+                self.rope.recenter()
             except Exception:
                 pass
             try:
@@ -366,6 +480,9 @@ class Game:
                 self.right.reset()
             except Exception:
                 pass
+            if self.left_team is not None:
+                self.left_team.reset()
+                self.right_team.reset()
 
             # reset bomb and freeze states
             try:
@@ -381,7 +498,8 @@ class Game:
 
             # reset projectiles and effects
             self.projectiles = []
-            self.effects = []
+            self.effects.clear()
+            self.particles.clear()
 
             # switch back to menu music
             try:
@@ -394,8 +512,13 @@ class Game:
             self.state = "waiting"
 
     def draw_menu(self):
+        # layout below is in physical pixels: (ox, oy) is the canvas origin, pw x ph its size
+        view = self.view
+        ox, oy = view.pt(0, 0)
+        pw, ph = view.size(self.width, self.height)
         if getattr(self, "menu_bg", None):
-            self.screen.blit(self.menu_bg, (0, 0))
+            view.clear_bars(self.screen)
+            self.screen.blit(self.menu_bg, (ox, oy))
         else:
             self.screen.fill((20, 30, 40))
 
@@ -407,13 +530,13 @@ class Game:
         s1 = self.menu_small_font.render(t1, True, (255, 255, 255))
         s2 = self.menu_small_font.render(t2, True, (255, 255, 255))
 
-        spacing = 40
+        spacing = view.px(40)
         total_w = s1.get_width() + spacing + s2.get_width()
-        left_shift = 15
-        start_x = (self.width - total_w) // 2 - left_shift
-        start_x = max(10, start_x)
-        bottom_margin = 20
-        y = self.height - bottom_margin - s1.get_height()
+        left_shift = view.px(15)
+        start_x = ox + (pw - total_w) // 2 - left_shift
+        start_x = max(ox + view.px(10), start_x)
+        bottom_margin = view.px(20)
+        y = oy + ph - bottom_margin - s1.get_height()
 
         # Blit the 1P / 2P labels (replace with flicker-aware blit)
         s2_x = start_x + s1.get_width() + spacing
@@ -442,17 +565,17 @@ class Game:
         left_lines = ["A = Pull", "D = Bomb", "F = Clone"]
         right_lines = ["L = Pull", "J = Bomb", "H = Clone"]
         hint_color = (200, 200, 200)
-        v_spacing = 4
+        v_spacing = view.px(4)
 
         # render left hint surfaces with smaller font and align to left window edge (x=10)
         left_surfs = [self.menu_hint_font.render(t, True, hint_color) for t in left_lines]
         left_max_w = max(s.get_width() for s in left_surfs)
-        left_x = 10  # flush to left frame with 10px padding
+        left_x = ox + view.px(10)  # flush to left frame with 10px padding
 
         # render right hint surfaces and align to right window edge (width - pad)
         right_surfs = [self.menu_hint_font.render(t, True, hint_color) for t in right_lines]
         right_max_w = max(s.get_width() for s in right_surfs)
-        right_x = self.width - right_max_w - 10  # flush to right frame with 10px padding
+        right_x = ox + pw - right_max_w - view.px(10)  # flush to right frame with 10px padding
 
         # vertical centering of the stacked hints relative to the label baseline y
         n = len(left_surfs)
@@ -473,39 +596,112 @@ class Game:
             self.screen.blit(surf, (right_x, ty))
             ty += line_h + v_spacing
 
+        self.draw_loading_bar()
+
+    def draw_loading_bar(self):
+        """Thin progress bar along the top while gameplay assets stream in."""
+        assets = getattr(self, "assets", None)
+        if assets is None or assets.ready():
+            return
+        view = self.view
+        bar_h = 4
+        primitive(self.screen, pygame.draw.rect, (40, 40, 40), view.rect(0, 0, self.width, bar_h))
+        primitive(self.screen, pygame.draw.rect, (240, 200, 60), view.rect(0, 0, int(self.width * assets.progress()), bar_h))
+        if self._start_pending:
+            label = self.menu_hint_font.render("LOADING...", True, (240, 240, 240))
+            self.screen.blit(label, label.get_rect(midtop=view.pt(self.width // 2, bar_h + 4)))
+
+    def draw_playfield(self, extras=True):
+        """Background -> rope body -> characters -> knot (-> effects -> particles -> bombs), batched.
+
+        Everything is queued in layer order on self.render_queue and submitted
+        with one blits/fblits call per run of sprites.
+        """
+        q = self.render_queue
+        if self.game_bg:
+            self.view.clear_bars(self.screen)
+            q.blit(self.game_bg, self.view.pt(0, 0))
+        else:
+            self.screen.fill((30, 30, 30))
+        self.rope.draw_body(q)
+        if self.left_team is not None:
+            # squads stand behind their leaders
+            self.left_team.draw(q)
+            self.right_team.draw(q)
+        self.left.draw(q)
+        self.right.draw(q)
+        self.rope.draw_knot(q)
+        if extras:
+            # effects on top (smoke), then projectiles (bombs)
+            self.effects.draw(q)
+            self.particles.draw(q)
+            for p in self.projectiles:
+                p.draw(q, self.view)
+        q.flush(self.screen)
+
     def draw_game_over(self):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0,0,0,160))
-        self.screen.blit(overlay, (0,0))
+        view = self.view
+        # made once: a fresh surface every frame would also be a fresh texture upload
+        overlay = getattr(self, "_overlay", None)
+        if overlay is None or overlay.get_size() != view.size(self.width, self.height):
+            overlay = self._overlay = pygame.Surface(view.size(self.width, self.height), pygame.SRCALPHA)
+            overlay.fill((0,0,0,160))
+        self.screen.blit(overlay, view.pt(0, 0))
 
         text = f"{self.winner} wins!"
         txt_surf = self.font.render(text, True, (255,255,255))
-        rect = txt_surf.get_rect(center=(self.width//2, self.height//2 - 20))
+        rect = txt_surf.get_rect(center=view.pt(self.width//2, self.height//2 - 20))
         self.screen.blit(txt_surf, rect)
 
         hint = "Press R to restart or Esc to quit"
         hint_surf = self.small_font.render(hint, True, (200,200,200))
-        hint_rect = hint_surf.get_rect(center=(self.width//2, self.height//2 + 40))
+        hint_rect = hint_surf.get_rect(center=view.pt(self.width//2, self.height//2 + 40))
         self.screen.blit(hint_surf, hint_rect)
 
-    def _maybe_play_pull_sound(self):
-        # safe-play attached pull_sound from main.py if present
-        snd = getattr(self, "pull_sound", None)
-        if snd is None:
+    def draw_win_meter(self):
+        """Thin left-vs-right win-chance bar at the top of the screen."""
+        meter = getattr(self, "win_meter", None)
+        chance = meter.left_chance() if meter is not None else None
+        if chance is None:
             return
-        try:
-            snd.play()
-        except Exception:
-            pass
+        view = self.view
+        bar_w, bar_h = 240, 8
+        x = (self.width - bar_w) // 2
+        y = 10
+        left_w = int(bar_w * chance)
+        primitive(self.screen, pygame.draw.rect, (180, 60, 60), view.rect(x, y, left_w, bar_h))
+        primitive(self.screen, pygame.draw.rect, (60, 90, 180), view.rect(x + left_w, y, bar_w - left_w, bar_h))
+        primitive(self.screen, pygame.draw.rect, (240, 240, 240), view.rect(x, y, bar_w, bar_h), 1)
+        label = self.menu_hint_font.render(f"{int(round(chance * 100))}%  WIN  {int(round((1 - chance) * 100))}%", True, (240, 240, 240))
+        self.screen.blit(label, label.get_rect(midtop=view.pt(self.width // 2, y + bar_h + 2)))
+
+    def draw_spectator_hud(self):
+        view = self.view
+        text = f"AI vs AI  {self.speed}x   match {self.spectated_matches + (0 if self.game_over else 1)}   [ / ] speed"
+        label = self.menu_hint_font.render(text, True, (240, 240, 240))
+        self.screen.blit(label, view.pt(8, self.height - 20))
+
+    def _maybe_play_pull_sound(self):
+        # pull taps share a capped voice pool in the bank, so spam steals instead of piling up
+        self._play_sfx("pull")
 
     def _maybe_play_win_sound(self):
-        snd = getattr(self, "win_sound", None)
-        if snd is None:
+        self._play_sfx("win")
+
+    def _pull_particles(self, player, prev_pull, opponent):
+        """Dust at the feet (and fibers off the knot) when a strong pull starts.
+
+        A pull is strong when it out-pulls the opponent by at least a full
+        pull, i.e. it lands unopposed or clone-doubled.
+        """
+        if player.pull == 0 or prev_pull != 0 or player.pull - opponent.pull < player.pull_strength:
             return
-        try:
-            snd.play()
-        except Exception:
-            pass
+        if not self._render_tick:
+            # fast-forwarded tick: dust from ticks nobody sees would just pile up
+            return
+        scale = 2.0 if player.clone_active else 1.0
+        self.particles.burst("dust", player.x + player.width // 2, player.y + player.height // 2, scale)
+        self.particles.burst("fibers", self.rope.pos, self.rope.y + self.rope.knot_offset, scale)
 
     def spawn_effect(self, x, y, kind="clone-smoke", frame_rate=12, target_h=None):
         """Spawn a short-lived sprite-sequence effect at screen coords (x,y).
@@ -516,52 +712,283 @@ class Game:
             if not frames:
                 return
 
-            # if target height requested, create scaled copies of frames
-            if target_h is not None:
-                scaled = []
-                for f in frames:
-                    fw, fh = f.get_size()
-                    if fh == 0:
-                        scaled.append(f)
-                        continue
-                    scale = float(target_h) / float(fh)
-                    nw = max(1, int(fw * scale))
-                    nh = max(1, int(fh * scale))
-                    try:
-                        scaled.append(pygame.transform.smoothscale(f, (nw, nh)))
-                    except Exception:
-                        scaled.append(f)
-                frames_used = scaled
-            else:
-                frames_used = frames
-
-            eff = SpriteEffect(x, y, frames_used, frame_rate=frame_rate)
-            self.effects.append(eff)
+            # frames are drawn at physical size: scale to the target height (or the view scale)
+            if target_h is None and self.view.drawing_scale != 1.0:
+                target_h = frames[0].get_height()
+            frames_used = frames
+            fh = frames[0].get_height()
+            if target_h is not None and fh:
+                # scaled once per height; every later spawn reuses the pool's copy
+                frames_used = self.effects.scaled("clone-smoke", frames, float(self.view.px(target_h)) / fh)
+
+            cx, cy = self.view.pt(x, y)
+            self.effects.spawn(frames_used, cx, cy, frame_rate * FRAME_MS)
+
+    def set_team_size(self, size, seed=None):
+        """Team match with size pullers per side, leaders included (1 = the classic 1v1)."""
+        size = max(1, min(int(size), MAX_TEAM_SIZE))
+        if size == 1:
+            self.left_team = self.right_team = None
+            return
+        self.left_team = Team("left", size - 1, self.left, self.width, seed=seed)
+        self.right_team = Team("right", size - 1, self.right, self.width, seed=None if seed is None else seed + 1)
+        self.left_team.particles = self.particles
+        self.right_team.particles = self.particles
+
+    def _step_teams(self):
+        """Advance both squads one frame (after the leaders) and launch their bombs."""
+        left, right = self.left_team, self.right_team
+        # each squad's AI sees the other side's whole pull from last frame
+        left_pull = self.left.pull + left.total_pull()
+        right_pull = self.right.pull + right.total_pull()
+        left_throws = left.step(self.rope.pos, right_pull)
+        right_throws = right.step(self.rope.pos, left_pull)
+        if left_throws:
+            self._launch_team_bombs(left, left_throws, [self.right] + right.members())
+        if right_throws:
+            self._launch_team_bombs(right, right_throws, [self.left] + left.members())
+
+    def _launch_team_bombs(self, team, throws, targets):
+        log.debug("ai", "%s squad throws %d bombs at tick %d", team.side, len(throws), self.match_ticks)
+        for bomb in team.launch_bombs(throws, targets):
+            self.projectiles.append(bomb)
+            self._record_bomb(BOMB_SPAWN, team.side, bomb)
 
     def spawn_bomb(self, thrower, target, travel_time_frames=60):
         """Spawn a bomb from thrower aimed at target."""
         if not thrower or not target or getattr(thrower, "bomb_used", False):
             return
-        sx = thrower.x + thrower.width // 2
-        sy = thrower.y - (thrower.height * 0.1)
-        tx = target.x + target.width // 2
-        ty = target.y
-        dx = tx - sx
-        dy = ty - sy
-        T = float(max(10, travel_time_frames))
-        g = 0.4
-        vx = dx / T
-        vy = (dy - 0.5 * g * T * T) / T
-        bomb = Bomb(sx, sy, vx, vy, gravity=g)
+        bomb = launch_bomb(thrower, target, travel_time_frames=travel_time_frames)
         self.projectiles.append(bomb)
         thrower.bomb_used = True
+        self._record_bomb(BOMB_SPAWN, thrower.side, bomb)
+
+    def _seed_round(self, seed):
+        """Seed every random stream of a round: the 1P AI, particles and squads."""
+        random.seed(seed)
+        self.particles.seed(seed)
+        if self.left_team is not None:
+            self.set_team_size(len(self.left_team) + 1, seed=seed)
+
+    def _log_input(self, side, action):
+        if self.input_log is not None and self.state == "running" and not self.game_over:
+            self.input_log[side].append((self.match_ticks, action))
+
+    def _record_result(self):
+        """Queue the finished match on the ledger (rated on its writer thread)."""
+        specials = []
+        for player, team in ((self.left, self.left_team), (self.right, self.right_team)):
+            clones, bombs = int(player.clone_used), int(player.bomb_used)
+            if team is not None:
+                clones += int(team.clone_used.sum())
+                bombs += int(team.bomb_used.sum())
+            specials += [clones, bombs]
+        right_name = f"ai:{self.ai_label}" if self.ai_enabled else "player2"
+        self.ledger.record("player1", right_name, self.winner, ticks=self.match_ticks, specials=specials)
+
+    def _record_bomb(self, kind, side, bomb):
+        if self.telemetry is not None:
+            self.telemetry.event(kind, side, bomb.x, bomb.y)
+
+    def _simulate_tick(self, prev_left, prev_right):
+        """One tick of match rules: AI, players, specials, rope, win check and recorders."""
+        # ---- AI decision step: call ai_act BEFORE update so bursts apply immediately ----
+        for me, other in self._ai_sides():
+            try:
+                rope_pos = self.rope.pos
+                rope_center = self.rope.center
+                # right player in 1-player mode, both sides when spectating
+                if getattr(me, "ai_act", None):
+                    me.ai_act(rope_pos, rope_center, opponent_pull=getattr(other, "pull", 0))
+            except Exception:
+                pass
+
+        # update players
+        self.left.update()
+        self.right.update()
+
+        # Spawn clone effect + sound when a player activates clone (both human & AI)
+        try:
+            for player in (self.left, self.right):
+                if getattr(player, "clone_active", False) and not getattr(player, "clone_effect_spawned", False):
+                    # place effect at the clone's position (match Player.draw clone offset),
+                    # not at the main character center.
+                    try:
+                        center_x = player.x + player.width // 2
+                        offset_x = int(player.width * 0.8)
+                        if getattr(player, "side", "") == "left":
+                            fx = center_x + offset_x - 2
+                        else:
+                            fx = center_x - offset_x + 2
+                        fy = player.y
+
+                        # spawn effect scaled to player height if supported
+                        try:
+                            self.spawn_effect(fx, fy, target_h=player.height)
+                        except TypeError:
+                            self.spawn_effect(fx, fy)
+                    except Exception:
+                        # fallback to player center if anything fails
+                        try:
+                            self.spawn_effect(player.x + player.width // 2, player.y, target_h=player.height)
+                        except Exception:
+                            pass
+
+                    self._play_sfx("clone")
+                    player.clone_effect_spawned = True
+        except Exception:
+            pass
+
+        # DEBUG: compare pull values, strengths, stamina and timers
+        try:
+            # gather debug info without printing to avoid spamming tests;
+            # keep as a local tuple so the block is not empty and safe to run.
+            left_info = (self.left.pull, getattr(self.left, "pull_strength", None), getattr(self.left, "stamina", None))
+            right_info = (self.right.pull, getattr(self.right, "pull_strength", None), getattr(self.right, "stamina", None))
+            # assign to a temporary variable to avoid lint warnings
+            _debug_snapshot = (left_info, right_info)
+        except Exception:
+            pass
+
+        # --- SIMPLE AI RANDOM ACTIONS (1-player and spectating) ---
+        for me, other in self._ai_sides():
+            if getattr(me, "ai_policy", None) is not None:
+                # a table policy picks its own specials; ai_act clones directly and flags bombs
+                if getattr(me, "ai_wants_bomb", False):
+                    me.ai_wants_bomb = False
+                    try:
+                        if not getattr(me, "bomb_used", False) and getattr(me, "freeze_timer", 0) == 0:
+                            log.debug("ai", "%s policy bomb at tick %d", me.side, self.match_ticks)
+                            self.spawn_bomb(me, other, travel_time_frames=60)
+                    except Exception:
+                        pass
+            else:
+                try:
+                    # AI random clone
+                    if (not getattr(me, "clone_used", False)
+                            and getattr(me, "clone_cooldown_timer", 0) == 0
+                            and getattr(me, "freeze_timer", 0) == 0
+                            and random.random() < getattr(me, "ai_clone_chance", 0.004)):
+                        try:
+                            if me.activate_clone():
+                                log.debug("ai", "%s clone at tick %d", me.side, self.match_ticks)
+                                fx = me.x + me.width // 2 + (1 if me.side == "left" else -1) * (int(me.width * 0.6) + 5)
+                                fy = me.y
+                                try:
+                                    self.spawn_effect(fx, fy, target_h=me.height)
+                                except Exception:
+                                    pass
+                                self._play_sfx("clone")
+                        except Exception:
+                            pass
+
+                    # AI random bomb
+                    if (not getattr(me, "bomb_used", False)
+                            and getattr(me, "freeze_timer", 0) == 0
+                            and random.random() < getattr(me, "ai_bomb_chance", 0.002)):
+                        try:
+                            log.debug("ai", "%s bomb at tick %d", me.side, self.match_ticks)
+                            self.spawn_bomb(me, other, travel_time_frames=60)
+                        except Exception:
+                            pass
+
+                except Exception:
+                    pass
+        # --- end AI random actions ---
+
+        # play pull-start sound if someone just started pulling
+        if self.left.pull > 0 and prev_left == 0:
+            self._maybe_play_pull_sound()
+        if self.right.pull > 0 and prev_right == 0:
+            self._maybe_play_pull_sound()
+        self._pull_particles(self.left, prev_left, self.right)
+        self._pull_particles(self.right, prev_right, self.left)
+
+        # apply pulls to rope
+        left_pull, right_pull = self.left.pull, self.right.pull
+        if self.left_team is not None:
+            self._step_teams()
+            left_pull += self.left_team.total_pull()
+            right_pull += self.right_team.total_pull()
+        self.rope.apply_pull(left_pull, right_pull)
+
+        # check win condition...
+        if self.rope.pos <= self.rope.min_x:
+            self.game_over = True
+            self.winner = "Left team"
+            self._maybe_play_win_sound()
+        elif self.rope.pos >= self.rope.max_x:
+            self.game_over = True
+            self.winner = "Right team"
+            self._maybe_play_win_sound()
+
+        # hand the win-chance meter a fresh snapshot every few frames
+        if self.win_meter is not None and not self.game_over:
+            self._win_meter_frame += 1
+            if self._win_meter_frame >= self.win_meter_every:
+                self._win_meter_frame = 0
+                self.win_meter.submit(self)
+
+        # per-tick telemetry (buffered; written on a background thread)
+        self.match_ticks += 1
+        if self.telemetry is not None:
+            self.telemetry.record(self)
+            if self.game_over:
+                self.telemetry.end_match(self.winner)
+        if self.game_over:
+            log.info("game", "%s wins after %d ticks", self.winner, self.match_ticks)
+            if self.spectating:
+                self.spectated_matches += 1
+        if self.game_over and self.ledger is not None and not self.spectating:
+            self._record_result()
+        if self.game_over and self.replays is not None:
+            save_replay(self, self.replays)
+
+    def _update_projectiles(self):
+        """Move bombs one tick and resolve their hits."""
+        for p in list(self.projectiles):
+            p.update()
+            if p.alive and not p.exploded:
+                r = p.get_rect()
+                if p.vx > 0:
+                    if p.hits(hitbox(self.right)):
+                        self.right.apply_bomb_hit(freeze_frames=120)
+                        self._play_sfx("explosion")
+                        self._record_bomb(BOMB_IMPACT, "right", p)
+                        p.exploded = True
+                        p.alive = False
+                    elif self.right_team is not None and self.right_team.hit(r, freeze_frames=120, motion=p.motion) >= 0:
+                        self._play_sfx("explosion")
+                        self._record_bomb(BOMB_IMPACT, "right", p)
+                        p.exploded = True
+                        p.alive = False
+                else:
+                    if p.hits(hitbox(self.left)):
+                        self.left.apply_bomb_hit(freeze_frames=120)
+                        self._play_sfx("explosion")
+                        self._record_bomb(BOMB_IMPACT, "left", p)
+                        p.exploded = True
+                        p.alive = False
+                    elif self.left_team is not None and self.left_team.hit(r, freeze_frames=120, motion=p.motion) >= 0:
+                        self._play_sfx("explosion")
+                        self._record_bomb(BOMB_IMPACT, "left", p)
+                        p.exploded = True
+                        p.alive = False
+            if not p.alive or p.offscreen(self.width, self.height):
+                try:
+                    self.projectiles.remove(p)
+                except Exception:
+                    pass
 
-    def run(self):
+    def run(self, max_frames=None):
+        """Main loop; max_frames stops it after that many frames (startup benchmark)."""
         clock = pygame.time.Clock()
+        frames = 0
         while self.running:
             # capture previous pulls for sound detection
             prev_left = self.left.pull
             prev_right = self.right.pull
+            self._frame_sfx.clear()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -572,6 +999,20 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         pygame.quit()
                         sys.exit()
+                    if event.key == pygame.K_F12:
+                        # on-demand diagnostics: write the event ring to disk
+                        try:
+                            log.info("game", "events dumped to %s", log.dump())
+                        except OSError as e:
+                            log.warning("game", "event dump failed: %s", e)
+
+                    if self.spectating:
+                        # the AI plays both sides; keys only change the speed
+                        if event.key in (pygame.K_RIGHTBRACKET, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                            self.set_speed(self.speed * 2)
+                        elif event.key in (pygame.K_LEFTBRACKET, pygame.K_MINUS, pygame.K_KP_MINUS):
+                            self.set_speed(self.speed // 2)
+                        continue
 
                     if self.state == "waiting":
                         # CHANGED: start flicker + sound, delay actual start until flicker finishes
@@ -587,7 +1028,7 @@ class Game:
                             self._maybe_play_select_sound()
                         elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                             # Enter starts immediately using current ai flag
-                            self.start()
+                            self._request_start()
                     elif self.game_over:
                         if event.key == pygame.K_r:
                             self.reset()
@@ -597,38 +1038,45 @@ class Game:
                     else:
                         # gameplay keydown -> trigger tap pulls (single press)
                         if event.key == pygame.K_a:
+                            self._log_input("left", "pull")
                             self.left.press_pull()
+                            if self.left_team is not None:
+                                self.left_team.press()
                         if event.key == pygame.K_l and not self.ai_enabled:
                             # only allow right human pull if not using AI
+                            self._log_input("right", "pull")
                             self.right.press_pull()
+                            if self.right_team is not None:
+                                self.right_team.press()
                         # left clone special (F)
                         if event.key == pygame.K_f:
+                            self._log_input("left", "clone")
                             try:
                                 if self.left.activate_clone():
                                     # spawn smoke in front of left player
                                     fx = self.left.x + self.left.width // 2 + int(self.left.width * 0.6) + 5
                                     fy = self.left.y
                                     self.spawn_effect(fx, fy, target_h=self.left.height)
-                                    if getattr(self, "clone_sound", None):
-                                        self.clone_sound.play()
+                                    self._play_sfx("clone")
                             except Exception:
                                 pass
 
                         # right clone special (H)
                         if event.key == pygame.K_h:
+                            self._log_input("right", "clone")
                             try:
                                 if self.right.activate_clone():
                                     # spawn smoke in front of right player
                                     fx = self.right.x + self.right.width // 2 - int(self.right.width * 0.6) - 5
                                     fy = self.right.y
                                     self.spawn_effect(fx, fy, target_h=self.right.height)
-                                    if getattr(self, "clone_sound", None):
-                                        self.clone_sound.play()
+                                    self._play_sfx("clone")
                             except Exception:
                                 pass
 
                     # bomb throw: D -> left throws to right; J -> right throws to left
                     if event.key == pygame.K_d:
+                        self._log_input("left", "bomb")
                         try:
                             if not getattr(self.left, "bomb_used", False) and getattr(self.left, "freeze_timer", 0) == 0:
                                 self.spawn_bomb(self.left, self.right, travel_time_frames=60)
@@ -636,6 +1084,7 @@ class Game:
                             pass
 
                     if event.key == pygame.K_j:
+                        self._log_input("right", "bomb")
                         try:
                             if not getattr(self.right, "bomb_used", False) and getattr(self.right, "freeze_timer", 0) == 0:
                                 self.spawn_bomb(self.right, self.left, travel_time_frames=60)
@@ -653,130 +1102,29 @@ class Game:
                         self.ai_enabled = False
                     # clear selection state and actually start the game
                     self.menu_selected_choice = None
-                    self.start()
+                    self._request_start()
+
+            # pick up assets the loader thread finished (and a start waiting on them)
+            self._poll_assets()
+            if self.spectating:
+                self._spectator_frame()
 
             keys = pygame.key.get_pressed()  # still available if needed elsewhere
 
             if self.state == "waiting":
                 self.draw_menu()
-            elif not self.game_over:
-                # ---- AI decision step: call ai_act BEFORE update so bursts apply immediately ----
-                if getattr(self, "ai_enabled", False):
-                    try:
-                        rope_pos = getattr(self.rope, "pos", 0.5)
-                        rope_center = 0.5
-                        # call ai_act on right player (1-player mode)
-                        if getattr(self.right, "ai_act", None):
-                            self.right.ai_act(rope_pos, rope_center, opponent_pull=getattr(self.left, "pull", 0))
-                    except Exception:
-                        pass
-
-                # update players
-                self.left.update()
-                self.right.update()
-
-                # Spawn clone effect + sound when a player activates clone (both human & AI)
-                try:
-                    for player in (self.left, self.right):
-                        if getattr(player, "clone_active", False) and not getattr(player, "clone_effect_spawned", False):
-                            # place effect at the clone's position (match Player.draw clone offset),
-                            # not at the main character center.
-                            try:
-                                center_x = player.x + player.width // 2
-                                offset_x = int(player.width * 0.8)
-                                if getattr(player, "side", "") == "left":
-                                    fx = center_x + offset_x - 2
-                                else:
-                                    fx = center_x - offset_x + 2
-                                fy = player.y
-
-                                # spawn effect scaled to player height if supported
-                                try:
-                                    self.spawn_effect(fx, fy, target_h=player.height)
-                                except TypeError:
-                                    self.spawn_effect(fx, fy)
-                            except Exception:
-                                # fallback to player center if anything fails
-                                try:
-                                    self.spawn_effect(player.x + player.width // 2, player.y, target_h=player.height)
-                                except Exception:
-                                    pass
-
-                            if getattr(self, "clone_sound", None):
-                                try:
-                                    self.clone_sound.play()
-                                except Exception:
-                                    pass
-                            player.clone_effect_spawned = True
-                except Exception:
-                    pass
-
-                # DEBUG: compare pull values, strengths, stamina and timers
-                try:
-                    # gather debug info without printing to avoid spamming tests;
-                    # keep as a local tuple so the block is not empty and safe to run.
-                    left_info = (self.left.pull, getattr(self.left, "pull_strength", None), getattr(self.left, "stamina", None))
-                    right_info = (self.right.pull, getattr(self.right, "pull_strength", None), getattr(self.right, "stamina", None))
-                    # assign to a temporary variable to avoid lint warnings
-                    _debug_snapshot = (left_info, right_info)
-                except Exception:
-                    pass
-
-                # --- SIMPLE AI RANDOM ACTIONS (1-player only) ---
-                if getattr(self, "ai_enabled", False):
-                    try:
-                        # AI random clone
-                        if (not getattr(self.right, "clone_used", False)
-                                and getattr(self.right, "clone_cooldown_timer", 0) == 0
-                                and getattr(self.right, "freeze_timer", 0) == 0
-                                and random.random() < 0.004):
-                            try:
-                                if self.right.activate_clone():
-                                    fx = self.right.x + self.right.width // 2 - int(self.right.width * 0.6) - 5
-                                    fy = self.right.y
-                                    try:
-                                        self.spawn_effect(fx, fy, target_h=self.right.height)
-                                    except Exception:
-                                        pass
-                                    if getattr(self, "clone_sound", None):
-                                        try:
-                                            self.clone_sound.play()
-                                        except Exception:
-                                            pass
-                            except Exception:
-                                pass
-
-                        # AI random bomb
-                        if (not getattr(self.right, "bomb_used", False)
-                                and getattr(self.right, "freeze_timer", 0) == 0
-                                and random.random() < 0.002):
-                            try:
-                                self.spawn_bomb(self.right, self.left, travel_time_frames=60)
-                            except Exception:
-                                pass
-
-                    except Exception:
-                        pass
-                # --- end AI random actions ---
-
-                # play pull-start sound if someone just started pulling
-                if self.left.pull > 0 and prev_left == 0:
-                    self._maybe_play_pull_sound()
-                if self.right.pull > 0 and prev_right == 0:
-                    self._maybe_play_pull_sound()
-
-                # apply pulls to rope
-                self.rope.apply_pull(self.left.pull, self.right.pull)
-
-                # check win condition...
-                if self.rope.pos <= self.rope.min_x:
-                    self.game_over = True
-                    self.winner = "Left team"
-                    self._maybe_play_win_sound()
-                elif self.rope.pos >= self.rope.max_x:
-                    self.game_over = True
-                    self.winner = "Right team"
-                    self._maybe_play_win_sound()
+            else:
+                # spectating runs several ticks per displayed frame; only the last is drawn
+                ticks = self.speed if self.spectating and self.state == "running" else 1
+                for i in range(ticks):
+                    if i:
+                        prev_left, prev_right = self.left.pull, self.right.pull
+                    self._render_tick = i == ticks - 1
+                    if not self.game_over:
+                        self._simulate_tick(prev_left, prev_right)
+                    if self._render_tick or self.game_over:
+                        break
+                    self._update_projectiles()
 
             # draw: use background during gameplay, menu draws with draw_menu()
             if self.state == "waiting":
@@ -784,144 +1132,31 @@ class Game:
                 self.draw_menu()
             elif self.game_over:
                 # final frame: keep background visible behind game over overlay
-                if self.game_bg:
-                    self.screen.blit(self.game_bg, (0, 0))
-                else:
-                    self.screen.fill((30, 30, 30))
-                self.rope.draw_body(self.screen)
-                self.left.draw(self.screen)
-                self.right.draw(self.screen)
-                self.rope.draw_knot(self.screen)
+                self.draw_playfield(extras=False)
                 self.draw_game_over()
             else:
-                # gameplay: background -> rope body -> characters -> knot on top
-                if self.game_bg:
-                    self.screen.blit(self.game_bg, (0, 0))
-                else:
-                    self.screen.fill((30, 30, 30))
-                self.rope.draw_body(self.screen)
-                self.left.draw(self.screen)
-                self.right.draw(self.screen)
-                self.rope.draw_knot(self.screen)
-
-                # draw effects on top (smoke)
-                for e in self.effects:
-                    e.draw(self.screen)
-
-                # draw projectiles (bombs) - invisible for now
-                for p in self.projectiles:
-                    p.draw(self.screen)
-
-            # update effects
-            for e in self.effects:
-                e.update()
-            # remove finished
-            self.effects = [e for e in self.effects if not e.finished]
-
-            # update projectiles and handle collisions
-            for p in list(self.projectiles):
-                p.update()
-                if p.alive and not p.exploded:
-                    r = p.get_rect()
-                    if p.vx > 0:
-                        target = pygame.Rect(self.right.x, self.right.y - self.right.height, self.right.width, self.right.height)
-                        if r.colliderect(target):
-                            self.right.apply_bomb_hit(freeze_frames=120)
-                            if getattr(self, "explosion_sound", None):
-                                self.explosion_sound.play()
-                            p.exploded = True
-                            p.alive = False
-                    else:
-                        target = pygame.Rect(self.left.x, self.left.y - self.left.height, self.left.width, self.left.height)
-                        if r.colliderect(target):
-                            self.left.apply_bomb_hit(freeze_frames=120)
-                            if getattr(self, "explosion_sound", None):
-                                self.explosion_sound.play()
-                            p.exploded = True
-                            p.alive = False
-                if not p.alive or p.offscreen(self.width, self.height):
-                    try:
-                        self.projectiles.remove(p)
-                    except Exception:
-                        pass
+                self.draw_playfield()
+                self.draw_win_meter()
+            if self.spectating and self.state != "waiting":
+                self.draw_spectator_hud()
 
-            # (display flip / tick follows)
-            pygame.display.flip()
-            clock.tick(60)  # cap at 60 FPS
-
-class Projectile:
-    def __init__(self, x, y, vx, vy):
-        import os
-        import pygame
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.alive = True
-        self.exploded = False
-        self._image_name = None
-        self.image = None
-
-        # candidates to try
-        sprites_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets", "sprites"))
-        candidates = [
-            os.path.join(sprites_dir, "bomb.png"),
-            os.path.join(sprites_dir, "bomb0.png"),
-            os.path.join(sprites_dir, "projectile.png"),
-            os.path.join(sprites_dir, "missile.png"),
-            "bomb.png",
-        ]
+            # effects and particles advance once per displayed frame
+            self.effects.update()
+            self.particles.update()
 
-        # try each candidate and print debug info about existence + load error
-        for path in candidates:
-            try:
-                exists = os.path.exists(path)
-            except Exception:
-                exists = False
-            print(f"[debug] Projectile: trying path={path} exists={exists}")
-            if not exists:
-                continue
-            try:
-                img = pygame.image.load(path)
-                try:
-                    img = img.convert_alpha()
-                except Exception:
-                    img = img.convert()
-                self.image = img
-                self._image_name = path
-                print(f"[debug] Projectile: loaded image {path}")
-                break
-            except Exception as e:
-                print(f"[debug] Projectile: failed to load {path}: {e}")
-
-        # fallback: try helper load_image (may search by basename)
-        if not self.image:
-            try:
-                img = load_image("bomb.png")
-                if img:
-                    self.image = img
-                    self._image_name = "bomb.png (via load_image)"
-                    print(f"[debug] Projectile: loaded bomb.png via load_image")
-            except Exception as e:
-                print(f"[debug] Projectile: load_image raised: {e}")
-
-        # final fallback placeholder
-        if not self.image:
-            print("[debug] Projectile: using placeholder gray circle")
-            surf = pygame.Surface((16, 16), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (180, 180, 180), (8, 8), 6)
-            self.image = surf
-            self._image_name = "<placeholder>"
+            self._update_projectiles()
 
-        # set rect centered on spawn pos
-        try:
-            self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
-        except Exception:
-            self.rect = pygame.Rect(int(self.x), int(self.y), 12, 12)
-
-# helper used in debug print to avoid NameError if not defined elsewhere
-def _safe(s):
-    try:
-        return s
-    except Exception:
-        return "<unknown>"
\ No newline at end of file
+            # (display flip / tick follows)
+            # canvas mode: scale the logical frame onto the display once
+            present = getattr(self.screen, "present", None)     # game.texrender.TextureScreen
+            if present is not None:
+                present()
+            else:
+                self.view.present(self.screen, pygame.display.get_surface())
+                pygame.display.flip()
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                return
+            dt = clock.tick(60)  # cap at 60 FPS
+            if dt > SLOW_FRAME_MS:
+                log.info("frame", "slow frame: %d ms (state %s)", dt, self.state)
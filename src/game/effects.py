@@ -1,5 +1,20 @@
+"""Sprite-sequence effects (explosions, clone smoke) and the pool that runs them.
+
+Every effect is a slot of one EffectManager, shared by the Game and its
+players. Slots are preallocated; spawn() takes one off the free list,
+update() advances the live ones and hands finished slots straight back, so a
+frame costs the same per live effect and allocates nothing. Time is the
+manager's own clock, advanced once per displayed frame (update(dt)), not a
+pygame.time.get_ticks() read per effect: effects stay in step with the frames
+that show them, at any spectator speed and in headless captures.
+
+Frames and positions are in physical pixels (the Viewport has been applied).
+"""
 import pygame
 from .utils import load_image
+from .eventlog import log
+
+FRAME_MS = 1000.0 / 60      # one displayed frame at the 60 fps the game is capped to
 
 def load_sequence(name, num_frames):
     """
@@ -28,102 +43,103 @@ def load_sequence(name, num_frames):
         if found:
             frames.append(found)
         else:
-            print(f"[debug] Failed to load sequence frame for index {i}, tried: {tried}")
-    print(f"[debug] load_sequence('{name}', {num_frames}) -> {len(frames)} frames")
+            log.debug("asset", "no frame %d of sequence %s, tried %s", i, name, tried)
+    log.debug("asset", "load_sequence(%r, %d) -> %d frames", name, num_frames, len(frames))
     return frames
 
-class Anim:
-    """
-    Time-based animation. duration_ms is total animation length in milliseconds.
-    If duration_ms is None, default is 100 ms per frame.
-    """
-    def __init__(self, x, y, frames, duration_ms=None):
-        self.frames = list(frames or [])
-        self.n_frames = len(self.frames)
-        if self.n_frames == 0:
-            self.alive = False
-            self.image = None
-            self.rect = pygame.Rect(int(x), int(y), 0, 0)
-            return
-
-        if not duration_ms or duration_ms <= 0:
-            duration_ms = self.n_frames * 100.0  # default 100 ms/frame
-
-        self.duration_ms = float(duration_ms)
-        self.per_frame_ms = max(1.0, self.duration_ms / float(self.n_frames))
-
-        self.start_time = pygame.time.get_ticks()
-        self.frame_index = 0
-        self.image = self.frames[0]
-        self.center = (int(x), int(y))
-        self.rect = self.image.get_rect(center=self.center)
-        self.alive = True
-
-    def update(self):
-        if not self.alive:
-            return
-        now = pygame.time.get_ticks()
-        elapsed = now - self.start_time
-        idx = int(elapsed // self.per_frame_ms)
-        if idx >= self.n_frames:
-            self.alive = False
-            return
-        if idx != self.frame_index:
-            self.frame_index = idx
-            self.image = self.frames[self.frame_index]
-            self.rect = self.image.get_rect(center=self.center)
+
+class _Effect:
+    __slots__ = ("frames", "x", "y", "frame_ms", "age", "index", "image", "pos", "live")
+
+    def __init__(self):
+        self.frames = ()
+        self.live = -1      # position in EffectManager._live, -1 when free
+
+
+class EffectManager:
+    """Fixed pool of sprite-sequence effects with a free list and a shared clock."""
+    def __init__(self, capacity=64):
+        self.capacity = int(capacity)
+        self._slots = [_Effect() for _ in range(self.capacity)]
+        self._free = list(range(self.capacity - 1, -1, -1))    # stack of free slot indices
+        self._live = []         # slot indices of running effects
+        self._scaled = {}       # (key, scale) -> scaled frame list, see scaled()
+        self.now = 0.0          # ms since the manager was made
+
+    def __len__(self):
+        return len(self._live)
+
+    def clear(self):
+        for i in self._live:
+            self._release_slot(self._slots[i], i)
+        del self._live[:]
+
+    def _release_slot(self, eff, i):
+        eff.frames = ()
+        eff.image = None
+        eff.live = -1
+        self._free.append(i)
+
+    def spawn(self, frames, x, y, frame_ms=100.0):
+        """Play frames centered on physical (x, y), frame_ms each; False if the pool is full or frames empty."""
+        if not frames or not self._free:
+            return False
+        i = self._free.pop()
+        eff = self._slots[i]
+        eff.frames = frames
+        eff.x, eff.y = int(x), int(y)
+        eff.frame_ms = max(1.0, float(frame_ms))
+        eff.age = 0.0
+        eff.index = -1
+        eff.live = len(self._live)
+        self._live.append(i)
+        self._show(eff, 0)
+        return True
+
+    def _show(self, eff, index):
+        eff.index = index
+        img = eff.image = eff.frames[index]
+        w, h = img.get_size()
+        eff.pos = (eff.x - w // 2, eff.y - h // 2)
+
+    def update(self, dt=FRAME_MS):
+        """Advance the clock by dt ms and every live effect with it; finished ones free their slot."""
+        self.now += dt
+        live, slots = self._live, self._slots
+        # backwards, so the swap-remove below only moves effects already updated
+        for k in range(len(live) - 1, -1, -1):
+            i = live[k]
+            eff = slots[i]
+            eff.age += dt
+            index = int(eff.age // eff.frame_ms)
+            if index < len(eff.frames):
+                if index != eff.index:
+                    self._show(eff, index)
+                continue
+            last = live.pop()
+            if last != i:
+                live[k] = last
+                slots[last].live = k
+            self._release_slot(eff, i)
 
     def draw(self, surface):
-        if self.alive and self.image:
-            surface.blit(self.image, self.rect)
-
-class ExplosionAnim(Anim):
-    def __init__(self, x, y, frames, duration_ms=None, scale=None, target_size=None):
-        # compute scale from target_size if provided and scale frames up-front
-        if target_size and frames:
-            fw, fh = frames[0].get_size()
-            if fw > 0 and fh > 0:
-                sx = float(target_size[0]) / fw
-                sy = float(target_size[1]) / fh
-                scale = max(sx, sy)
-        if scale is not None and scale != 1.0 and frames:
-            scaled = []
-            for f in frames:
-                nw = max(1, int(f.get_width() * scale))
-                nh = max(1, int(f.get_height() * scale))
-                try:
-                    nf = pygame.transform.smoothscale(f, (nw, nh))
-                except Exception:
-                    nf = pygame.transform.scale(f, (nw, nh))
-                scaled.append(nf)
-            frames = scaled
-        super().__init__(x, y, frames, duration_ms)
+        # surface is a Surface or a game.render.RenderQueue
+        slots = self._slots
+        surface.blits(((slots[i].image, slots[i].pos) for i in self._live), doreturn=False)
 
-class CloneSmokeAnim(Anim):
-    """
-    Anim subclass forcing 50 ms per frame unless caller supplies explicit duration_ms.
-    """
-    def __init__(self, x, y, frames, per_frame_ms=50, duration_ms=None, scale=None, target_size=None):
-        # same scaling logic as ExplosionAnim
-        if target_size and frames:
-            fw, fh = frames[0].get_size()
-            if fw > 0 and fh > 0:
-                sx = float(target_size[0]) / fw
-                sy = float(target_size[1]) / fh
-                scale = max(sx, sy)
-        if scale is not None and scale != 1.0 and frames:
-            scaled = []
+    def scaled(self, key, frames, scale):
+        """frames smoothscaled by scale, made once per (key, scale) and reused by every spawn."""
+        if not frames or scale == 1.0:
+            return frames
+        cache_key = (key, round(scale, 4))
+        out = self._scaled.get(cache_key)
+        if out is None or len(out) != len(frames):
+            out = []
             for f in frames:
-                nw = max(1, int(f.get_width() * scale))
-                nh = max(1, int(f.get_height() * scale))
+                size = (max(1, int(f.get_width() * scale)), max(1, int(f.get_height() * scale)))
                 try:
-                    nf = pygame.transform.smoothscale(f, (nw, nh))
+                    out.append(pygame.transform.smoothscale(f, size))
                 except Exception:
-                    nf = pygame.transform.scale(f, (nw, nh))
-                scaled.append(nf)
-            frames = scaled
-
-        if duration_ms is None:
-            duration_ms = per_frame_ms * len(frames) if frames else 0
-
-        super().__init__(x, y, frames, duration_ms)
\ No newline at end of file
+                    out.append(pygame.transform.scale(f, size))
+            self._scaled[cache_key] = out
+        return out
@@ -0,0 +1,183 @@
+"""Structured event log: levels and categories, kept in an in-memory ring buffer.
+
+Replaces the debug prints in the asset/audio/AI/frame paths. An event is a
+(time, level, category, message, args) tuple written into a fixed ring of
+CAPACITY slots; the message is only %-formatted when the log is dumped, so
+recording costs a tuple and a list store. Events below the category's level
+return after one dict lookup, and nothing is written to the console unless
+the event is at or above the echo level (WARNING by default).
+
+    from game.eventlog import log
+    log.debug("asset", "loaded %s", filename)
+    if log.enabled(DEBUG, "frame"):          # guard anything costly to build
+        log.debug("frame", "queue %d blits", len(queue))
+
+The ring is dumped to a file on an uncaught exception (install_crash_dump)
+and on demand (log.dump(), F12 in the game, SIGUSR1 where available).
+
+Environment (read by configure_from_env, see main.py):
+    TUG_LOG         recorded levels: "debug", "info" (default), or per category
+                    overrides like "info,asset=debug,ai=debug"
+    TUG_LOG_ECHO    level also written to stderr as it happens ("off" for none)
+    TUG_LOG_FILE    where dumps go (default tug-events.log in the working directory)
+"""
+import itertools
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+LEVEL_NAMES = {v: k.upper() for k, v in LEVELS.items()}
+CATEGORIES = ("asset", "audio", "ai", "frame", "data", "game")
+CAPACITY = 4096
+OFF = 1000                  # above every level: echo disabled
+DUMP_FILE = "tug-events.log"
+
+
+def parse_levels(spec):
+    """"info,asset=debug" -> (INFO, {"asset": DEBUG}); unknown names raise KeyError."""
+    default = INFO
+    overrides = {}
+    for part in filter(None, (p.strip().lower() for p in spec.split(","))):
+        if "=" in part:
+            category, name = part.split("=", 1)
+            overrides[category.strip()] = LEVELS[name.strip()]
+        else:
+            default = LEVELS[part]
+    return default, overrides
+
+
+def format_event(event):
+    t, level, category, msg, args = event
+    try:
+        text = msg % args if args else msg
+    except (TypeError, ValueError):
+        text = f"{msg} {args!r}"
+    stamp = time.strftime("%H:%M:%S", time.localtime(t))
+    return f"{stamp}.{int(t % 1 * 1000):03d} {LEVEL_NAMES.get(level, level):<7} {category:<6} {text}"
+
+
+def _ignore(category, msg, *args):
+    pass
+
+
+class EventLog:
+    def __init__(self, capacity=CAPACITY, level=INFO, echo=WARNING):
+        self.capacity = capacity
+        self._ring = [None] * capacity
+        self._counter = itertools.count()
+        self.recorded = 0               # events recorded so far (the ring keeps the last capacity)
+        self.dump_path = DUMP_FILE
+        self.configure(level, echo=echo)
+
+    def configure(self, level=INFO, categories=None, echo=WARNING, dump_path=None):
+        """Record events at level and up (per-category overrides in categories); echo=None never prints."""
+        threshold = {c: level for c in CATEGORIES}
+        threshold.update(categories or {})
+        self._default = level
+        self._threshold = threshold
+        self.echo = OFF if echo is None else echo
+        # a level nobody records becomes a plain no-op function (no lookup at all)
+        lowest = min(min(threshold.values()), level)
+        for name, value in (("debug", DEBUG), ("info", INFO)):
+            if value < lowest:
+                setattr(self, name, _ignore)
+            else:
+                self.__dict__.pop(name, None)
+        if dump_path:
+            self.dump_path = dump_path
+
+    def configure_from_env(self):
+        try:
+            level, categories = parse_levels(os.environ.get("TUG_LOG", "info"))
+        except KeyError as e:
+            level, categories = INFO, {}
+            self.warning("game", "ignoring TUG_LOG=%r: unknown level %s", os.environ["TUG_LOG"], e)
+        echo = os.environ.get("TUG_LOG_ECHO", "warning").lower()
+        self.configure(level, categories, None if echo == "off" else LEVELS.get(echo, WARNING),
+                       os.environ.get("TUG_LOG_FILE"))
+
+    def enabled(self, level, category):
+        return level >= self._threshold.get(category, self._default)
+
+    def log(self, level, category, msg, *args):
+        if level < self._threshold.get(category, self._default):
+            return
+        event = (time.time(), level, category, msg, args)
+        i = next(self._counter)         # atomic under the GIL: threads never share a slot
+        self._ring[i % self.capacity] = event
+        self.recorded = i + 1
+        if level >= self.echo:
+            sys.stderr.write(format_event(event) + "\n")
+
+    # the level helpers repeat the check so a disabled call costs one lookup
+    # (or nothing: configure() swaps in _ignore when no category wants the level)
+    def debug(self, category, msg, *args):
+        if DEBUG >= self._threshold.get(category, self._default):
+            self.log(DEBUG, category, msg, *args)
+
+    def info(self, category, msg, *args):
+        if INFO >= self._threshold.get(category, self._default):
+            self.log(INFO, category, msg, *args)
+
+    def warning(self, category, msg, *args):
+        self.log(WARNING, category, msg, *args)
+
+    def error(self, category, msg, *args):
+        self.log(ERROR, category, msg, *args)
+
+    def events(self):
+        """Recorded events still in the ring, oldest first."""
+        n = self.recorded
+        if n <= self.capacity:
+            events = self._ring[:n]
+        else:
+            i = n % self.capacity
+            events = self._ring[i:] + self._ring[:i]
+        return [e for e in events if e is not None]
+
+    def clear(self):
+        self._ring = [None] * self.capacity
+        self._counter = itertools.count()
+        self.recorded = 0
+
+    def dump(self, path=None):
+        """Write the ring, oldest first, to path (default dump_path); returns the path."""
+        path = path or self.dump_path
+        events = self.events()
+        with open(path, "w") as f:
+            f.write(f"# {len(events)} of {self.recorded} events, pid {os.getpid()}\n")
+            for event in events:
+                f.write(format_event(event) + "\n")
+        return path
+
+
+log = EventLog()
+
+
+def install_crash_dump(event_log=log):
+    """Dump the ring on uncaught exceptions (main and other threads) and on SIGUSR1."""
+    previous = sys.excepthook
+
+    def on_crash(exc_type, exc, tb):
+        event_log.error("game", "uncaught %s\n%s", exc_type.__name__,
+                        "".join(traceback.format_exception(exc_type, exc, tb)).rstrip())
+        try:
+            path = event_log.dump()
+            sys.stderr.write(f"[eventlog] crash: events dumped to {path}\n")
+        except OSError:
+            pass
+        previous(exc_type, exc, tb)
+
+    def on_thread_crash(args):
+        if args.exc_type is not SystemExit:
+            on_crash(args.exc_type, args.exc_value, args.exc_traceback)
+
+    sys.excepthook = on_crash
+    threading.excepthook = on_thread_crash
+    if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGUSR1, lambda signum, frame: event_log.dump())
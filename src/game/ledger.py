@@ -0,0 +1,326 @@
+"""Match ledger in SQLite plus incremental Glicko ratings.
+
+Ledger.record() is what the game calls when a match ends: it only puts the
+result on a queue. A writer thread owns the database connection; it pulls
+results off in batches (up to BATCH at a time, or whatever arrived within
+FLUSH_S), updates the in-memory ratings of the two sides - O(1) per result,
+no history rescans - and writes the batch's match rows plus the changed
+player rows in one transaction. The in-memory ratings only take the batch's
+updates once that transaction commits, so a failed write changes nothing.
+
+Players are rated with Glicko-1 (an Elo-style rating plus a rating
+deviation that shrinks as a player gets games in). AI difficulty presets
+are rated the same way under names like "ai:hard", so the ladder shows how
+each preset stacks up against people.
+
+Leaderboards read through a separate connection (WAL mode, so reads never
+wait on the writer) and are served by the (kind, rating) index:
+
+    ledger = Ledger("ledger.db")
+    ledger.record("player1", "ai:hard", winner="left", ticks=900, specials=(1, 0, 1, 1))
+    ledger.leaderboard(10)
+
+Run from src/:  python -m game.ledger --db /tmp/ledger.db --results 1000000   (ingest benchmark)
+"""
+import argparse
+import atexit
+import math
+import os
+import queue
+import random
+import sqlite3
+import threading
+import time
+
+from game.eventlog import log
+
+BATCH = 5000            # results per transaction at most
+FLUSH_S = 0.25          # ...or whatever arrived in this long
+MAX_PENDING = 100000    # record() only waits if this many results are still unwritten
+
+# Glicko-1
+START_RATING = 1500.0
+START_RD = 350.0
+MIN_RD = 30.0
+RD_DRIFT = 5.0          # RD regained per game played (uncertainty creeping back)
+_Q = math.log(10) / 400.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    rating REAL NOT NULL,
+    rd REAL NOT NULL,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS players_by_rating ON players (kind, rating DESC);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    left_id INTEGER NOT NULL REFERENCES players (id),
+    right_id INTEGER NOT NULL REFERENCES players (id),
+    winner INTEGER,              -- 0 left, 1 right, NULL none
+    ticks INTEGER NOT NULL,
+    left_clones INTEGER NOT NULL,
+    left_bombs INTEGER NOT NULL,
+    right_clones INTEGER NOT NULL,
+    right_bombs INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_by_time ON matches (played_at);
+CREATE INDEX IF NOT EXISTS matches_by_left ON matches (left_id, played_at);
+CREATE INDEX IF NOT EXISTS matches_by_right ON matches (right_id, played_at);
+"""
+
+
+def player_kind(name):
+    return "ai" if name.startswith("ai:") else "human"
+
+
+def _g(rd):
+    return 1.0 / math.sqrt(1.0 + 3.0 * _Q * _Q * rd * rd / (math.pi * math.pi))
+
+
+def expected(rating, other, other_rd=0.0):
+    """Chance rating beats other (plain Elo expectation when other_rd is 0)."""
+    return 1.0 / (1.0 + 10.0 ** (-_g(other_rd) * (rating - other) / 400.0))
+
+
+def glicko_update(r, rd, other_r, other_rd, score):
+    """One game's Glicko-1 update; score is 1 win, 0 loss, 0.5 draw. Returns (rating, rd)."""
+    rd = min(START_RD, math.sqrt(rd * rd + RD_DRIFT * RD_DRIFT))
+    g = _g(other_rd)
+    e = 1.0 / (1.0 + 10.0 ** (-g * (r - other_r) / 400.0))
+    d2_inv = _Q * _Q * g * g * e * (1.0 - e)
+    denom = 1.0 / (rd * rd) + d2_inv
+    r += _Q / denom * g * (score - e)
+    return r, max(MIN_RD, math.sqrt(1.0 / denom))
+
+
+class Ratings:
+    """In-memory ratings: name -> [id, kind, rating, rd, games, wins]."""
+    def __init__(self):
+        self.players = {}
+        self.dirty = set()
+
+    def get(self, name):
+        p = self.players.get(name)
+        if p is None:
+            p = self.players[name] = [None, player_kind(name), START_RATING, START_RD, 0, 0]
+        return p
+
+    def apply(self, left, right, winner):
+        """Rate one result; winner is "left", "right" or None (a draw). Self-matches are ignored."""
+        if left == right:
+            # both sides would be the same row: the loser's update overwrites the winner's
+            return
+        a, b = self.get(left), self.get(right)
+        s = 1.0 if winner == "left" else 0.0 if winner == "right" else 0.5
+        ra, rda = glicko_update(a[2], a[3], b[2], b[3], s)
+        rb, rdb = glicko_update(b[2], b[3], a[2], a[3], 1.0 - s)
+        a[2], a[3], b[2], b[3] = ra, rda, rb, rdb
+        a[4] += 1
+        b[4] += 1
+        a[5] += s == 1.0
+        b[5] += s == 0.0
+        self.dirty.add(left)
+        self.dirty.add(right)
+
+
+class Ledger:
+    def __init__(self, path, batch=BATCH, flush_s=FLUSH_S):
+        self.path = path
+        self.batch = batch
+        self.flush_s = flush_s
+        self._queue = queue.Queue(MAX_PENDING)
+        self.ratings = Ratings()
+        self.recorded = 0
+        self._ready = threading.Event()
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ledger", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        self._reader = None
+        # commit what's still queued when the game exits through sys.exit()
+        atexit.register(self.close)
+
+    # -- any thread ----------------------------------------------------------
+
+    def record(self, left, right, winner, ticks=0, specials=(0, 0, 0, 0), played_at=None):
+        """Queue one result. winner: "left" / "right" / "Left team" / "Right team" / None.
+
+        specials is (left clones, left bombs, right clones, right bombs). A
+        player can't be rated against itself, so left == right is dropped.
+        """
+        if left == right:
+            log.warning("data", "ledger: not recording %s against itself", left)
+            return
+        if winner in ("Left team", "Right team"):
+            winner = winner.split()[0].lower()
+        self._queue.put((played_at or time.time(), left, right, winner, int(ticks), tuple(specials)))
+
+    def flush(self):
+        """Block until everything queued so far is committed."""
+        self._queue.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _connection(self):
+        if self._reader is None:
+            self._reader = sqlite3.connect(self.path, check_same_thread=False)
+        return self._reader
+
+    def leaderboard(self, limit=10, kind="human"):
+        """Top players of kind ("human" or "ai") by rating: (name, rating, rd, games, wins) rows."""
+        return self._connection().execute(
+            "SELECT name, rating, rd, games, wins FROM players WHERE kind = ? ORDER BY rating DESC LIMIT ?",
+            (kind, limit)).fetchall()
+
+    def history(self, name, limit=20):
+        """Most recent matches of one player, newest first."""
+        db = self._connection()
+        row = db.execute("SELECT id FROM players WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return []
+        pid = row[0]
+        return db.execute(
+            "SELECT * FROM (SELECT played_at, left_id, right_id, winner, ticks FROM matches WHERE left_id = ?"
+            " UNION ALL SELECT played_at, left_id, right_id, winner, ticks FROM matches WHERE right_id = ?)"
+            " ORDER BY played_at DESC LIMIT ?", (pid, pid, limit)).fetchall()
+
+    # -- writer thread ---------------------------------------------------------
+
+    def _open(self):
+        db = sqlite3.connect(self.path)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        for pid, name, kind, rating, rd, games, wins in db.execute(
+                "SELECT id, name, kind, rating, rd, games, wins FROM players"):
+            self.ratings.players[name] = [pid, kind, rating, rd, games, wins]
+        return db
+
+    def _run(self):
+        try:
+            db = self._open()
+        except Exception as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            items = [item]
+            deadline = time.monotonic() + self.flush_s
+            while len(items) < self.batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                items.append(item)
+            try:
+                self._write(db, items)
+            except Exception as e:
+                log.error("data", "ledger: failed to write %d results: %s", len(items), e)
+            for _ in range(len(items) + stop):
+                self._queue.task_done()
+        db.close()
+
+    def _write(self, db, items):
+        # rate the batch on copies of its players: they only replace the live
+        # ratings (and pick up new ids) once the transaction has committed
+        staged = Ratings()
+        names = list(dict.fromkeys(n for it in items for n in (it[1], it[2])))
+        for name in names:
+            p = self.ratings.players.get(name)
+            if p is not None:
+                staged.players[name] = list(p)
+        players = staged.players
+        with db:
+            # new players get their ids first so match rows can reference them
+            for name in names:
+                p = staged.get(name)
+                if p[0] is None:
+                    p[0] = db.execute("INSERT INTO players (name, kind, rating, rd, games, wins, updated)"
+                                      " VALUES (?, ?, ?, ?, 0, 0, 0)", (name, p[1], p[2], p[3])).lastrowid
+            rows = []
+            for played_at, left, right, winner, ticks, specials in items:
+                staged.apply(left, right, winner)
+                w = 0 if winner == "left" else 1 if winner == "right" else None
+                rows.append((played_at, players[left][0], players[right][0], w, ticks) + specials)
+            db.executemany("INSERT INTO matches (played_at, left_id, right_id, winner, ticks,"
+                           " left_clones, left_bombs, right_clones, right_bombs) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                           rows)
+            now = time.time()
+            db.executemany("UPDATE players SET rating = ?, rd = ?, games = ?, wins = ?, updated = ? WHERE id = ?",
+                           [(p[2], p[3], p[4], p[5], now, p[0]) for p in map(players.__getitem__, staged.dirty)])
+        self.ratings.players.update(players)
+        self.recorded += len(items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest synthetic match results into a ledger.")
+    parser.add_argument("--db", required=True, help="SQLite file (created if missing)")
+    parser.add_argument("--results", type=int, default=1000000)
+    parser.add_argument("--players", type=int, default=2000, help="synthetic human players")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    # hidden skills so the ratings have something to find
+    names = [f"player{i}" for i in range(args.players)] + ["ai:easy", "ai:default", "ai:hard"]
+    skill = {n: rng.gauss(1500, 200) for n in names}
+    skill.update({"ai:easy": 1250.0, "ai:default": 1500.0, "ai:hard": 1750.0})
+
+    ledger = Ledger(args.db)
+    start = time.perf_counter()
+    t = time.time() - args.results
+    for i in range(args.results):
+        left, right = rng.sample(names, 2)
+        winner = "left" if rng.random() < expected(skill[left], skill[right]) else "right"
+        ledger.record(left, right, winner, ticks=rng.randint(200, 3000),
+                      specials=(rng.random() < 0.5, rng.random() < 0.3, rng.random() < 0.5, rng.random() < 0.3),
+                      played_at=t + i)
+    queued = time.perf_counter() - start
+    ledger.flush()
+    elapsed = time.perf_counter() - start
+    print(f"[ledger] {args.results} results: queued in {queued:.2f}s, committed in {elapsed:.2f}s "
+          f"({args.results / elapsed:.0f} results/s); db {os.path.getsize(args.db) / 1e6:.1f} MB")
+
+    t0 = time.perf_counter()
+    top = ledger.leaderboard(10)
+    ai = ledger.leaderboard(3, kind="ai")
+    recent = ledger.history(top[0][0]) if top else []
+    query_ms = (time.perf_counter() - t0) * 1000
+    plan = ledger._connection().execute(
+        "EXPLAIN QUERY PLAN SELECT name FROM players WHERE kind = 'human' ORDER BY rating DESC LIMIT 10").fetchall()
+    print(f"[ledger] leaderboard + ai ladder + history in {query_ms:.2f} ms ({plan[0][-1]})")
+    for name, rating, rd, games, wins in top[:5] + ai:
+        print(f"[ledger]   {name:<12} {rating:7.1f} +-{rd:5.1f}  {wins}/{games}  (hidden skill {skill[name]:.0f})")
+    print(f"[ledger] {len(recent)} recent matches for {top[0][0] if top else '-'}")
+    ledger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,628 @@
+"""Matchmaking queue service: rating/latency buckets, widening search windows, a match host.
+
+Clients talk newline-delimited JSON over TCP. One connection may queue
+several tickets (a venue kiosk queues the player at each of its cabinets), so
+every message names its ticket:
+
+    -> {"op": "join", "ticket": "t1", "name": "alice", "rating": 1620, "latency": 38}
+    <- {"op": "queued", "ticket": "t1"}
+    <- {"op": "match", "ticket": "t1", "match": 17, "side": "left", "opponent": "bob",
+        "rating": 1588.0, "latency": 45.0, "waited": 1.42}
+    <- {"op": "result", "ticket": "t1", "match": 17, "winner": "right", "ticks": 1034}
+    -> {"op": "leave", "ticket": "t1"}
+    -> {"op": "stats"}
+
+"rating" may be left out when the server reads a ledger (--db): the player's
+Glicko rating is used, START_RATING for a new name. "latency" is the
+client's ping to the match hosts in ms. Closing the connection drops its
+queued tickets.
+
+Matchmaker is the pairing structure, no I/O. Waiting tickets sit in buckets
+keyed by (rating // RATING_BIN, latency // LATENCY_BIN), each one an
+insertion-ordered dict (FIFO with O(1) removal). A ticket's search window is
+a number of bins either side of its own, widened in steps (WIDEN) the longer
+it waits. A join probes the buckets in its window, nearest rating first, and
+takes the oldest ticket of the first non-empty one; a widening step re-probes
+only the ticket that widened, found through a heap of widening deadlines. So
+a join or a widening costs a bounded number of bucket probes plus an
+O(log n) heap push however many tickets are queued - nothing scans the queue.
+
+Matched pairs go to a MatchHost, which plays each tick's pairs as one
+game.batch_ai.MatchPool (the game.sim rules, with the default AI on both
+sides standing in for the clients' inputs, which aren't networked yet) on a
+worker process and reports the results back. Those results say nothing
+about the players yet, so they're not recorded in the ledger.
+
+Two tickets with the same player name (a kiosk queueing one player at two
+cabinets) are never paired with each other. A bucket holds only a player's
+oldest ticket there; their later ones wait behind it and take its place when
+it goes, so however many tickets one name queues, a search skips at most one
+per bucket.
+
+Run from src/:  python -m game.matchmaker --port 7777 --db /tmp/ledger.db --play
+                python -m game.matchmaker --load 50000 --rate 10000      (load generator, own server)
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import heapq
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import time
+
+from game.eventlog import log
+
+RATING_BIN = 25.0       # rating points per bucket
+LATENCY_BIN = 20.0      # ms per bucket
+# (seconds waited, rating bins, latency bins either side): the search window
+# grows from +-50 rating / +-20 ms to +-1000 / +-200 ms over 20 s; after 30 s
+# (None) anyone queued will do
+WIDEN = ((0.0, 2, 1), (2.0, 4, 2), (5.0, 8, 3), (10.0, 16, 5), (20.0, 40, 10), (30.0, None, None))
+TICK_S = 0.05           # how often widening deadlines are processed (and pairs handed to the host)
+MAX_LINE = 4096         # longest accepted request
+
+
+class Ticket:
+    """One queued player."""
+    __slots__ = ("id", "name", "rating", "latency", "joined", "level", "key", "owner", "tag")
+
+    def __init__(self, id, name, rating, latency, owner=None, tag=None):
+        self.id = id
+        self.name = name
+        self.rating = float(rating)
+        self.latency = float(latency)
+        self.joined = 0.0
+        self.level = 0          # index into WIDEN
+        self.key = (int(self.rating // RATING_BIN), int(self.latency // LATENCY_BIN))
+        self.owner = owner      # connection the ticket came in on (server side)
+        self.tag = tag          # the client's name for the ticket
+
+
+def _window(rating_bins, latency_bins):
+    """Bucket offsets inside a window, nearest rating (then latency) first; None for no limit."""
+    if rating_bins is None:
+        return None
+    offsets = itertools.product(range(-rating_bins, rating_bins + 1), range(-latency_bins, latency_bins + 1))
+    return sorted(offsets, key=lambda o: (abs(o[0]), abs(o[1])))
+
+
+class Matchmaker:
+    def __init__(self, widen=WIDEN):
+        self.widen = widen
+        self._offsets = [_window(r, l) for _, r, l in widen]
+        self.buckets = {}           # (rating bin, latency bin) -> {ticket id: Ticket}, non-empty only,
+                                    # at most one ticket per player name
+        self._behind = {}           # (bucket key, name) -> {ticket id: Ticket}, that player's later
+                                    # tickets in the bucket (present while they have one there)
+        self.tickets = {}           # ticket id -> Ticket, everything queued
+        self._deadlines = []        # heap of (time, ticket id, level reached then)
+        self.peak = 0
+        self.pairs = 0
+        self.searches = 0
+        self.probes = 0
+
+    def __len__(self):
+        return len(self.tickets)
+
+    def join(self, ticket, now):
+        """Queue ticket, or pair it at once: returns (older, newer) or None."""
+        ticket.joined = now
+        ticket.level = 0
+        other = self._find(ticket)
+        if other is not None:
+            self._remove(other)
+            self.pairs += 1
+            return other, ticket
+        self._add(ticket)
+        self._schedule(ticket)
+        return None
+
+    def leave(self, ticket_id):
+        """Drop a queued ticket; returns it (None if it isn't queued)."""
+        ticket = self.tickets.get(ticket_id)
+        if ticket is not None:
+            self._remove(ticket)
+        return ticket
+
+    def expire(self, now):
+        """Widen the windows that are due by now; returns the pairs that made."""
+        pairs = []
+        heap = self._deadlines
+        while heap and heap[0][0] <= now:
+            _, tid, level = heapq.heappop(heap)
+            ticket = self.tickets.get(tid)
+            if ticket is None or ticket.level >= level:
+                continue        # paired or left since
+            ticket.level = level
+            other = self._find(ticket)
+            if other is None:
+                self._schedule(ticket)
+                continue
+            self._remove(ticket)
+            self._remove(other)
+            self.pairs += 1
+            pairs.append((ticket, other) if ticket.joined <= other.joined else (other, ticket))
+        return pairs
+
+    def stats(self):
+        return {"queued": len(self.tickets), "peak": self.peak, "pairs": self.pairs,
+                "buckets": len(self.buckets), "probes_per_search": self.probes / max(1, self.searches)}
+
+    def _add(self, ticket):
+        behind = self._behind.get((ticket.key, ticket.name))
+        if behind is None:
+            bucket = self.buckets.get(ticket.key)
+            if bucket is None:
+                bucket = self.buckets[ticket.key] = {}
+            bucket[ticket.id] = ticket
+            self._behind[ticket.key, ticket.name] = {}
+        else:
+            behind[ticket.id] = ticket
+        self.tickets[ticket.id] = ticket
+        if len(self.tickets) > self.peak:
+            self.peak = len(self.tickets)
+
+    def _remove(self, ticket):
+        del self.tickets[ticket.id]
+        name = ticket.key, ticket.name
+        behind = self._behind[name]
+        if behind.pop(ticket.id, None) is not None:
+            return
+        bucket = self.buckets[ticket.key]
+        del bucket[ticket.id]
+        if behind:
+            # the player's next ticket here moves up into the bucket
+            tid = next(iter(behind))
+            bucket[tid] = behind.pop(tid)
+            return
+        del self._behind[name]
+        if not bucket:
+            del self.buckets[ticket.key]
+
+    def _schedule(self, ticket):
+        level = ticket.level + 1
+        if level < len(self.widen):
+            heapq.heappush(self._deadlines, (ticket.joined + self.widen[level][0], ticket.id, level))
+
+    def _find(self, ticket):
+        """Oldest queued ticket of another player in the nearest bucket of ticket's window (None if there's none)."""
+        self.searches += 1
+        buckets = self.buckets
+        rb, lb = ticket.key
+        offsets = self._offsets[ticket.level]
+        if offsets is None or len(buckets) < len(offsets):
+            # fewer live buckets than window cells (or no window): check those instead;
+            # there are at most as many as rating x latency bins, whatever the queue length
+            self.probes += len(buckets)
+            _, rbins, lbins = self.widen[ticket.level]
+            if rbins is None:
+                rbins = lbins = float("inf")
+            best = best_rank = None
+            for (r, l), bucket in buckets.items():
+                dr, dl = abs(r - rb), abs(l - lb)
+                if dr <= rbins and dl <= lbins and (best_rank is None or (dr, dl) < best_rank):
+                    for other in bucket.values():
+                        if other.name != ticket.name:
+                            best, best_rank = other, (dr, dl)
+                            break
+            return best
+        for dr, dl in offsets:
+            self.probes += 1
+            bucket = buckets.get((rb + dr, lb + dl))
+            if bucket:
+                # skips the ticket itself (in its own bucket when a widening re-probes
+                # it) or its player's oldest ticket: one at most, see _add
+                for other in bucket.values():
+                    if other.name != ticket.name:
+                        return other
+        return None
+
+
+# -- match host ------------------------------------------------------------------
+
+def play_matches(seeds):
+    """Play one headless match per seed, default AI on both sides; [(winner, ticks)]. Runs in a worker."""
+    from game.batch_ai import MatchPool
+    from game.sim import Match
+    matches = [Match(seed=s) for s in seeds]
+    MatchPool(matches, ai_sides=("left", "right")).run()
+    return [(m.winner, m.tick) for m in matches]
+
+
+class MatchHost:
+    """Plays matched pairs with the game rules, a batch per matchmaker tick.
+
+    workers=0 plays on the event loop's default thread pool instead of worker
+    processes (tests, tiny servers).
+    """
+    def __init__(self, workers=1):
+        self._executor = None
+        if workers:
+            # spawn so workers don't inherit the server's sockets
+            ctx = multiprocessing.get_context("spawn")
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+        self._pending = []          # (match id, left ticket, right ticket, done callback)
+        self._tasks = set()
+        self.played = 0
+
+    def submit(self, match_id, left, right, done):
+        """Queue a match; done(match_id, winner, ticks) is called on the loop when it's played."""
+        self._pending.append((match_id, left, right, done))
+
+    def flush(self):
+        """Start playing everything submitted since the last flush."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._play(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _play(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self._executor, play_matches, [m[0] for m in batch])
+        except Exception as e:
+            log.error("game", "match host: failed to play %d matches: %s", len(batch), e)
+            return
+        for (match_id, left, right, done), (winner, ticks) in zip(batch, results):
+            done(match_id, winner, ticks)
+        self.played += len(batch)
+
+    async def drain(self):
+        self.flush()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# -- service -----------------------------------------------------------------
+
+class _Connection:
+    def __init__(self, writer):
+        self.writer = writer
+        self.tickets = {}           # client tag -> ticket id
+        self.closed = False
+
+    def send(self, message):
+        if not self.closed:
+            # no drain(): replies are small and paced by the client's own requests
+            self.writer.write(json.dumps(message).encode() + b"\n")
+
+
+class MatchmakingServer:
+    def __init__(self, host=None, ledger=None, matchmaker=None, tick_s=TICK_S):
+        self.host = host
+        self.ledger = ledger
+        self.matchmaker = matchmaker or Matchmaker()
+        self.tick_s = tick_s
+        self.port = None
+        self._server = None
+        self._ticker = None
+        self._clients = {}          # _Connection -> its handler task
+        self._ids = itertools.count(1)
+        self._match_ids = itertools.count(1)
+        self._started = time.monotonic()
+        self._cpu0 = time.process_time()
+        self.connections = 0
+        self.joins = 0
+        self.join_s = 0.0           # time spent in Matchmaker.join
+
+    async def start(self, address="127.0.0.1", port=0):
+        self._server = await asyncio.start_server(self._client, address, port, limit=MAX_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ticker = asyncio.get_running_loop().create_task(self._tick_loop())
+        log.info("game", "matchmaker listening on %s:%d", address, self.port)
+        return self.port
+
+    async def close(self):
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
+        if self._server is not None:
+            self._server.close()
+            # hang up on the clients and let their handlers finish
+            for conn in list(self._clients):
+                conn.writer.close()
+            await asyncio.gather(*self._clients.values(), return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self.host is not None:
+            await self.host.drain()
+
+    def stats(self):
+        s = self.matchmaker.stats()
+        s.update(connections=self.connections, joins=self.joins,
+                 join_us=self.join_s * 1e6 / max(1, self.joins),
+                 cpu=time.process_time() - self._cpu0, uptime=time.monotonic() - self._started,
+                 played=self.host.played if self.host is not None else 0)
+        return s
+
+    async def _tick_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.tick_s)
+            for left, right in self.matchmaker.expire(loop.time()):
+                self._matched(left, right, loop.time())
+            if self.host is not None:
+                self.host.flush()
+
+    async def _client(self, reader, writer):
+        conn = _Connection(writer)
+        self._clients[conn] = asyncio.current_task()
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    conn.send({"op": "error", "error": "request too long"})
+                    break
+                if not line:
+                    break
+                try:
+                    self._request(conn, json.loads(line))
+                except (ValueError, TypeError, KeyError) as e:
+                    conn.send({"op": "error", "error": str(e)})
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            conn.closed = True
+            del self._clients[conn]
+            self.connections -= 1
+            for tid in conn.tickets.values():
+                self.matchmaker.leave(tid)
+            writer.close()
+
+    def _request(self, conn, msg):
+        op = msg["op"]
+        if op == "join":
+            self._join(conn, msg)
+        elif op == "leave":
+            tid = conn.tickets.pop(msg["ticket"], None)
+            if tid is not None:
+                self.matchmaker.leave(tid)
+        elif op == "stats":
+            conn.send(dict(self.stats(), op="stats"))
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    def _join(self, conn, msg):
+        tag, name = msg["ticket"], str(msg["name"])
+        if tag in conn.tickets:
+            raise ValueError(f"ticket {tag!r} is already queued")
+        rating = msg.get("rating")
+        if rating is None:
+            from game.ledger import START_RATING
+            known = self.ledger.ratings.players.get(name) if self.ledger is not None else None
+            rating = known[2] if known is not None else START_RATING
+        latency = max(0.0, float(msg.get("latency", 0.0)))
+        ticket = Ticket(next(self._ids), name, rating, latency, owner=conn, tag=tag)
+        conn.tickets[tag] = ticket.id
+        conn.send({"op": "queued", "ticket": tag})
+        now = asyncio.get_running_loop().time()
+        t0 = time.perf_counter()
+        pair = self.matchmaker.join(ticket, now)
+        self.join_s += time.perf_counter() - t0
+        self.joins += 1
+        if pair is not None:
+            self._matched(pair[0], pair[1], now)
+
+    def _matched(self, left, right, now):
+        match_id = next(self._match_ids)
+        for side, ticket, other in (("left", left, right), ("right", right, left)):
+            ticket.owner.tickets.pop(ticket.tag, None)
+            ticket.owner.send({"op": "match", "ticket": ticket.tag, "match": match_id, "side": side,
+                               "opponent": other.name, "rating": other.rating, "latency": other.latency,
+                               "waited": round(now - ticket.joined, 4)})
+        if self.host is not None:
+            self.host.submit(match_id, left, right, lambda mid, winner, ticks: self._result(mid, left, right,
+                                                                                            winner, ticks))
+
+    @staticmethod
+    def _result(match_id, left, right, winner, ticks):
+        for ticket in (left, right):
+            ticket.owner.send({"op": "result", "ticket": ticket.tag, "match": match_id, "winner": winner,
+                               "ticks": ticks})
+
+
+async def serve(address="127.0.0.1", port=0, db=None, play=False, workers=1, ready=None):
+    """Run a matchmaker until SIGINT/SIGTERM. ready(port) is called once it listens."""
+    ledger = None
+    if db:
+        from game.ledger import Ledger
+        ledger = Ledger(db)
+    host = MatchHost(workers) if play else None
+    server = MatchmakingServer(host, ledger)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass        # Windows: Ctrl+C still ends asyncio.run
+    try:
+        await server.start(address, port)
+        if ready is not None:
+            ready(server.port)
+        await stop.wait()
+    finally:
+        await server.close()
+        if host is not None:
+            host.close()
+        if ledger is not None:
+            ledger.close()
+    return server.stats()
+
+
+# -- load generator ------------------------------------------------------------
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def pairing_cost(queued, joins=2000, seed=1, names=None):
+    """(seconds per Matchmaker.join, pairs made) with about `queued` tickets already waiting (no network).
+
+    Every ticket is a different player unless names gives the (cycled) names to use.
+    """
+    rng = random.Random(seed)
+    mm = Matchmaker()
+    name = (lambda i: names[i % len(names)]) if names else (lambda i: f"p{i}")
+    # fill straight into the buckets: joins would pair most of them off
+    for i in range(queued):
+        t = Ticket(i, name(i), rng.gauss(1500, 300), rng.uniform(10, 300))
+        mm._add(t)
+        mm._schedule(t)
+    tickets = [Ticket(queued + i, name(queued + i), rng.gauss(1500, 300), rng.uniform(10, 300))
+               for i in range(joins)]
+    t0 = time.perf_counter()
+    for t in tickets:
+        mm.join(t, 0.0)
+    return (time.perf_counter() - t0) / joins, mm.pairs
+
+
+async def _spawn_server(play):
+    """A matchmaker child process on a free port: (process, port)."""
+    args = [sys.executable, "-m", "game.matchmaker", "--port", "0"] + (["--play"] if play else [])
+    proc = await asyncio.create_subprocess_exec(*args, stdout=asyncio.subprocess.PIPE)
+    line = await proc.stdout.readline()
+    if not line.startswith(b"[matchmaker] listening"):
+        raise RuntimeError("matchmaker server failed to start")
+    return proc, int(line.split(b":")[-1])
+
+
+async def load(clients, rate, connections=100, address="127.0.0.1", port=None, play=False, timeout=60.0, seed=1):
+    """Queue `clients` synthetic players at `rate` joins/s and wait for their matches.
+
+    Starts its own server process unless port is given. Returns a dict of
+    pairing latencies, match quality and the server's stats.
+    """
+    loop = asyncio.get_running_loop()
+    proc = None
+    if port is None:
+        proc, port = await _spawn_server(play)
+    rng = random.Random(seed)
+    # skill ~ N(1500, 300), ping spread over near and far players
+    players = [(rng.gauss(1500, 300), min(400.0, rng.lognormvariate(4.0, 0.6))) for _ in range(clients)]
+    sent = {}
+    waits = []
+    gaps = []
+    results = [0]
+    matched = asyncio.Event()
+    stats_reply = loop.create_future()
+    target = clients - clients % 2
+
+    async def read(reader):
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            msg = json.loads(line)
+            if msg["op"] == "match":
+                i = int(msg["ticket"])
+                waits.append(loop.time() - sent[i])
+                gaps.append((abs(players[i][0] - msg["rating"]), abs(players[i][1] - msg["latency"])))
+                if len(waits) >= target and not play:
+                    matched.set()
+            elif msg["op"] == "result":
+                results[0] += 1
+                if results[0] >= target:
+                    matched.set()
+            elif msg["op"] == "stats":
+                stats_reply.set_result(msg)
+
+    streams = [await asyncio.open_connection(address, port) for _ in range(connections)]
+    readers = [loop.create_task(read(r)) for r, _ in streams]
+    cpu0 = time.process_time()
+    start = loop.time()
+    step = max(1, int(rate * 0.01))     # joins per 10 ms slice
+    for first in range(0, clients, step):
+        for i in range(first, min(clients, first + step)):
+            rating, latency = players[i]
+            sent[i] = loop.time()
+            streams[i % connections][1].write(json.dumps({"op": "join", "ticket": str(i), "name": f"load{i}",
+                                                          "rating": rating, "latency": latency}).encode() + b"\n")
+        await asyncio.gather(*(w.drain() for _, w in streams))
+        delay = start + (first + step) / rate - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    joined = loop.time() - start
+    try:
+        await asyncio.wait_for(matched.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    elapsed = loop.time() - start
+
+    streams[0][1].write(b'{"op": "stats"}\n')
+    stats = await asyncio.wait_for(stats_reply, 10.0)
+    for task in readers:
+        task.cancel()
+    for _, w in streams:
+        w.close()
+    if proc is not None:
+        proc.terminate()
+        await proc.wait()
+    return {"clients": clients, "joined": joined, "elapsed": elapsed, "paired": len(waits), "played": results[0],
+            "waits": waits, "rating_gaps": [g[0] for g in gaps], "latency_gaps": [g[1] for g in gaps],
+            "client_cpu": time.process_time() - cpu0, "server": stats}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Matchmaking queue service (or its load generator with --load).")
+    parser.add_argument("--address", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777, help="0 picks a free port")
+    parser.add_argument("--db", default=None, help="ledger SQLite file to read ratings from for joins without one")
+    parser.add_argument("--play", action="store_true", help="play matched pairs on a match host")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="match host processes")
+    parser.add_argument("--load", type=int, default=0, help="run the load generator with this many clients")
+    parser.add_argument("--rate", type=float, default=10000.0, help="load generator joins per second")
+    parser.add_argument("--connections", type=int, default=100, help="load generator TCP connections")
+    parser.add_argument("--connect", default=None, help="load an existing server (HOST:PORT) instead of a new one")
+    args = parser.parse_args(argv)
+
+    if not args.load:
+        def ready(port):
+            print(f"[matchmaker] listening on {args.address}:{port}", flush=True)
+        stats = asyncio.run(serve(args.address, args.port, args.db, args.play, args.workers, ready))
+        print(f"[matchmaker] {stats['joins']} joins, {stats['pairs']} pairs, peak queue {stats['peak']}")
+        return 0
+
+    for queued in (1000, 10000, 100000):
+        cost, pairs = pairing_cost(queued)
+        print(f"[matchmaker] pairing cost with {queued:>6} queued: {cost * 1e6:6.1f} us/join ({pairs} pairs)")
+    address, port = args.address, None
+    if args.connect:
+        address, port = args.connect.rsplit(":", 1)
+        port = int(port)
+    r = asyncio.run(load(args.load, args.rate, args.connections, address, port, args.play))
+    s = r["server"]
+    waits = r["waits"]
+    print(f"[matchmaker] {r['clients']} clients over {args.connections} connections joined in {r['joined']:.2f}s "
+          f"({r['clients'] / r['joined']:.0f}/s); peak queue {s['peak']}, {s['queued']} still queued")
+    print(f"[matchmaker] paired {r['paired']} in {r['elapsed']:.2f}s; wait p50 {_percentile(waits, 0.5) * 1000:.0f} ms, "
+          f"p90 {_percentile(waits, 0.9) * 1000:.0f} ms, p99 {_percentile(waits, 0.99) * 1000:.0f} ms, "
+          f"max {max(waits or [0]) * 1000:.0f} ms")
+    print(f"[matchmaker] rating gap p50 {_percentile(r['rating_gaps'], 0.5):.0f} p90 {_percentile(r['rating_gaps'], 0.9):.0f}; "
+          f"latency gap p50 {_percentile(r['latency_gaps'], 0.5):.0f} ms p90 {_percentile(r['latency_gaps'], 0.9):.0f} ms")
+    print(f"[matchmaker] server cpu {s['cpu']:.2f}s over {s['uptime']:.2f}s ({100 * s['cpu'] / s['uptime']:.0f}% of a core); "
+          f"join {s['join_us']:.1f} us, {s['probes_per_search']:.1f} bucket probes per search; "
+          f"load generator cpu {r['client_cpu']:.2f}s" + (f"; {r['played']} results" if args.play else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
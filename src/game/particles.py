@@ -0,0 +1,235 @@
+"""Array-backed particle system for explosions, dust and rope fibers.
+
+Every particle lives in a slot of a few preallocated NumPy arrays (position,
+velocity, gravity, drag, remaining/total life, style), with the live ones
+packed at the front. update() moves all of them with a handful of vectorized
+operations and compacts out the dead ones; draw() maps positions to the
+display in one go and hands a single blit sequence to the surface or
+game.render.RenderQueue.
+
+Particles are drawn from small pre-rendered dot sprites, one per style and
+fade level, so there is no per-particle alpha work at draw time. Positions
+are logical pixels, like the rest of the game state; the Viewport does the
+mapping.
+
+Run from src/:  python -m game.particles --particles 6000   (prints per-frame cost)
+"""
+import argparse
+import math
+import os
+import time
+
+import numpy as np
+import pygame
+
+from game.view import Viewport
+
+# style name -> (color, radius in logical pixels)
+STYLES = {
+    "spark": ((255, 210, 90), 2),
+    "fire": ((240, 110, 30), 3),
+    "smoke": ((110, 110, 110), 4),
+    "dust": ((165, 135, 95), 2),
+    "fiber": ((225, 200, 90), 1),
+    "puff": ((225, 225, 235), 3),
+}
+FADE_LEVELS = 8         # alpha steps a particle fades through over its life
+
+# burst name -> list of (style, count, speed range, angle range in degrees, life range, gravity, drag).
+# Angles are screen angles: 0 is right, -90 is straight up.
+BURSTS = {
+    "explosion": [
+        ("spark", 90, (2.0, 7.0), (0, 360), (15, 35), 0.18, 0.96),
+        ("fire", 70, (1.0, 4.0), (0, 360), (18, 40), 0.05, 0.93),
+        ("smoke", 40, (0.3, 1.5), (-150, -30), (40, 70), -0.03, 0.97),
+    ],
+    "clone": [
+        ("puff", 60, (0.5, 2.5), (0, 360), (20, 45), -0.02, 0.92),
+        ("spark", 20, (1.0, 3.0), (-160, -20), (15, 30), 0.05, 0.95),
+    ],
+    "dust": [
+        ("dust", 30, (0.5, 2.5), (-170, -10), (15, 35), 0.12, 0.94),
+    ],
+    "fibers": [
+        ("fiber", 24, (1.0, 3.5), (0, 360), (20, 40), 0.15, 0.97),
+    ],
+}
+
+STYLE_NAMES = tuple(STYLES)
+_STYLE_INDEX = {name: i for i, name in enumerate(STYLE_NAMES)}
+
+
+class ParticleSystem:
+    def __init__(self, capacity=8192, view=None, seed=None):
+        self.capacity = int(capacity)
+        self.view = view or Viewport()
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        n = self.capacity
+        self.pos = np.zeros((n, 2), dtype=np.float32)
+        self.vel = np.zeros((n, 2), dtype=np.float32)
+        self.gravity = np.zeros(n, dtype=np.float32)
+        self.drag = np.ones(n, dtype=np.float32)
+        self.life = np.zeros(n, dtype=np.float32)
+        self.max_life = np.ones(n, dtype=np.float32)
+        self.style = np.zeros(n, dtype=np.intp)
+        self._sprites = None        # built on first draw, per view scale
+        self._sprite_scale = None
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def seed(self, seed):
+        """Restart the random stream (reproducible bursts for replays and captures)."""
+        self.rng = np.random.default_rng(seed)
+
+    def emit(self, style, x, y, n, speed=(1.0, 3.0), angle=(0, 360), life=(20, 40), gravity=0.1, drag=0.96):
+        """Spawn n particles of style at logical (x, y); extra ones are dropped when full."""
+        n = min(int(n), self.capacity - self.count)
+        if n <= 0:
+            return 0
+        rng = self.rng
+        s = slice(self.count, self.count + n)
+        theta = np.radians(rng.uniform(angle[0], angle[1], n))
+        v = rng.uniform(speed[0], speed[1], n)
+        self.pos[s, 0] = x
+        self.pos[s, 1] = y
+        self.vel[s, 0] = np.cos(theta) * v
+        self.vel[s, 1] = np.sin(theta) * v
+        self.gravity[s] = gravity
+        self.drag[s] = drag
+        self.max_life[s] = self.life[s] = rng.uniform(life[0], life[1], n)
+        self.style[s] = _STYLE_INDEX[style]
+        self.count += n
+        return n
+
+    def burst(self, name, x, y, scale=1.0):
+        """Emit one of the BURSTS presets at logical (x, y); scale multiplies the counts."""
+        total = 0
+        for style, count, speed, angle, life, gravity, drag in BURSTS[name]:
+            total += self.emit(style, x, y, int(count * scale), speed, angle, life, gravity, drag)
+        return total
+
+    def update(self):
+        """Advance every live particle one frame and drop the ones that expired."""
+        n = self.count
+        if not n:
+            return
+        vel = self.vel[:n]
+        vel[:, 1] += self.gravity[:n]
+        vel *= self.drag[:n, None]
+        self.pos[:n] += vel
+        life = self.life[:n]
+        life -= 1.0
+        alive = life > 0
+        k = int(np.count_nonzero(alive))
+        if k != n:
+            # keep live particles packed at the front
+            for arr in (self.pos, self.vel, self.gravity, self.drag, self.life, self.max_life, self.style):
+                arr[:k] = arr[:n][alive]
+            self.count = k
+
+    def _build_sprites(self, scale):
+        """Dot sprites indexed by style * FADE_LEVELS + level, plus their half sizes."""
+        sprites = []
+        half = []
+        for name in STYLE_NAMES:
+            color, radius = STYLES[name]
+            r = max(1, int(round(radius * scale)))
+            for level in range(FADE_LEVELS):
+                alpha = int(255 * (level + 1) / FADE_LEVELS)
+                dot = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+                if r == 1:
+                    dot.fill(color + (alpha,))
+                else:
+                    pygame.draw.circle(dot, color + (alpha,), (r, r), r)
+                if pygame.display.get_surface() is not None:
+                    dot = dot.convert_alpha()
+                sprites.append(dot)
+                half.append(r)
+        self._sprites = np.empty(len(sprites), dtype=object)
+        self._sprites[:] = sprites
+        self._half = np.array(half, dtype=np.float32)
+        self._sprite_scale = scale
+
+    def draw(self, surface):
+        # surface is a Surface or a game.render.RenderQueue
+        n = self.count
+        if not n:
+            return
+        view = self.view
+        scale = view.drawing_scale
+        if self._sprite_scale != scale:
+            self._build_sprites(scale)
+        ox, oy = (0, 0) if view.mode == "canvas" else (view.ox, view.oy)
+        level = (self.life[:n] * (FADE_LEVELS / self.max_life[:n])).astype(np.intp)
+        np.minimum(level, FADE_LEVELS - 1, out=level)
+        idx = self.style[:n] * FADE_LEVELS + level
+        xy = self.pos[:n] * scale
+        xy -= self._half[idx, None]
+        xy[:, 0] += ox
+        xy[:, 1] += oy
+        xy = xy.astype(np.int32)
+        # column lists zip into (x, y) tuples faster than xy.tolist() builds nested lists
+        dest = zip(xy[:, 0].tolist(), xy[:, 1].tolist())
+        surface.blits(list(zip(self._sprites[idx].tolist(), dest)), doreturn=False)
+
+
+def main(argv=None):
+    from game.render import RenderQueue
+    parser = argparse.ArgumentParser(description="Particle update + draw cost at a sustained particle count.")
+    parser.add_argument("--particles", type=int, default=6000, help="live particles to sustain")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--size", default="800x480", help="display size (WxH)")
+    parser.add_argument("--fps", type=float, default=60.0, help="fail (exit 1) if the budget for this frame rate is missed")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    screen = pygame.display.set_mode((w, h))
+    view = Viewport((w, h))
+    bg = pygame.Surface(view.logical).convert()
+    bg.fill((40, 60, 40))
+    ps = ParticleSystem(capacity=args.particles * 2, view=view, seed=1)
+    queue = RenderQueue()
+    lw, lh = view.logical
+
+    def top_up(frame):
+        # keep roughly args.particles alive: bursts scattered over the field
+        while ps.count < args.particles:
+            x = lw * (0.5 + 0.4 * math.sin(frame * 0.37 + ps.count))
+            ps.burst("explosion", x, lh * 0.5)
+
+    for frame in range(30):     # warm up to steady state
+        top_up(frame)
+        ps.update()
+    update_t = draw_t = 0.0
+    live = 0
+    for frame in range(args.frames):
+        top_up(frame)
+        live += ps.count
+        t0 = time.perf_counter()
+        ps.update()
+        t1 = time.perf_counter()
+        queue.blit(bg, view.pt(0, 0))
+        ps.draw(queue)
+        queue.flush(screen)
+        t2 = time.perf_counter()
+        update_t += t1 - t0
+        draw_t += t2 - t1
+    frames = max(1, args.frames)
+    per_frame = (update_t + draw_t) / frames
+    budget = 1.0 / args.fps
+    print(f"[particles] {live / frames:.0f} live particles at {w}x{h}: "
+          f"update {update_t / frames * 1000:.2f} ms, draw {draw_t / frames * 1000:.2f} ms "
+          f"({per_frame / budget * 100:.0f}% of a {args.fps:g} fps frame)")
+    pygame.quit()
+    return 0 if per_frame <= budget else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,27 @@
 import pygame
 import random
 from game.utils import load_image
-from game.effects import ExplosionAnim, load_sequence
-
-class Player:
-    def __init__(self, x, y, width, height, side, push_img_path, pull_img_path):
+from game.effects import FRAME_MS, load_sequence
+from game.view import Viewport
+from game.render import primitive
+from game.eventlog import log
+
+# canonical round rules applied by Game.start() (and the headless engine)
+# make each pull half strength to increase difficulty
+PULL_POWER = 3          # single canonical pull strength for both sides (halved)
+TAP_DURATION = 6        # frames a tap lasts
+MAX_STAMINA = 100.0
+STAMINA_DRAIN = 1.5
+STAMINA_REGEN = 0.8
+
+
+class PlayerState:
+    """Asset-free player rules: pulling, stamina, AI timers, clone, bomb and freeze.
+
+    Player adds sprites and effects on top; the headless engine (game.sim)
+    drives PlayerState directly so both share the exact same per-frame rules.
+    """
+    def __init__(self, x, y, side):
         self.side = side
         self.x = x
         self.y = y
@@ -26,9 +43,30 @@ class Player:
         # AI timers / params
         # Keep pull strength identical for both players so pulls are fair.
         # Side-specific difficulty should be expressed via ai_aggressiveness and timers only.
-        self.ai_aggressiveness = 0.95
+        # chance to answer when the rope is on the losing side of center. Off by
+        # default: with the 0.5 center Game.run used to pass the right AI could
+        # never answer, and an AI that answers every lead makes AI-vs-AI a
+        # stalemate; difficulty presets turn it up
+        self.ai_aggressiveness = 0.0
+        # (opponent idle, opponent pulling) bias added to ai_aggressiveness
+        self.ai_respond_bias = (0.0, 0.0)
+        self.ai_burst_frames = (1, 4)
+        self.ai_pause_frames = (1, 6)
+        self.ai_opportunistic_chance = 0.18
+        # per-frame chance the AI rolls a clone / bomb (see Game.run)
+        self.ai_clone_chance = 0.004
+        self.ai_bomb_chance = 0.002
+        # per-frame chance ai_act flags ai_wants_clone / ai_wants_bomb (side-specific)
+        self.ai_clone_wish = 0.012 if side == "right" else 0.008
+        self.ai_bomb_wish = 0.008 if side == "right" else 0.003
         self.ai_burst_timer = 0
         self.ai_pause_timer = 0
+        # optional precomputed decision table (game.policy.TablePolicy); when set
+        # ai_act defers to it instead of rolling the dice
+        self.ai_policy = None
+        # random source for AI decisions (module-level random by default; the
+        # headless engine swaps in a per-match random.Random for reproducibility)
+        self.rng = random
 
         # clone / special
         self.clone_active = False
@@ -45,72 +83,28 @@ class Player:
         self.freeze_timer = 0
         self.freeze_duration_frames = 120
 
-        # --- LOAD SIDE-SPECIFIC SPRITES (explicit, prefer exact files) ---
-        if self.side == "left":
-            push_name = "girl-push.png"
-            pull_name = "girl-pull.png"
-        else:
-            push_name = "boy-push.png"
-            pull_name = "boy-pull.png"
-
-        self.push_img = load_image(push_name)
-        self.pull_img = load_image(pull_name)
-
-        # If preferred files are missing, log warning and attempt fallback but do NOT
-        # let fallback override a successfully loaded preferred image.
-        if self.push_img is None:
-            fallback = "boy-push.png" if self.side == "left" else "girl-push.png"
-            alt = load_image(fallback)
-            if alt:
-                # flip fallback for left side so it faces correct direction
-                if self.side == "left":
-                    alt = pygame.transform.flip(alt, True, False)
-                self.push_img = alt
-                print(f"[player] {self.side}: using fallback push image {fallback}")
-            else:
-                print(f"[player] WARNING: no push image for {self.side} (tried {push_name} and {fallback})")
-
-        if self.pull_img is None:
-            fallback = "boy-pull.png" if self.side == "left" else "girl-pull.png"
-            alt = load_image(fallback)
-            if alt:
-                if self.side == "left":
-                    alt = pygame.transform.flip(alt, True, False)
-                self.pull_img = alt
-                print(f"[player] {self.side}: using fallback pull image {fallback}")
-            else:
-                print(f"[player] WARNING: no pull image for {self.side} (tried {pull_name} and {fallback})")
-        else:
-            if self.pull_img is None:
-                # Load default pull image or handle error
-                pass  # Add your code here if needed
+    def begin_round(self):
+        """Reset per-round state and apply the canonical round rules (see Game.start)."""
+        # reset clone state so players get their one chance this round
+        self.clone_active = False
+        self.clone_timer = 0
+        self.clone_used = False
 
-        # scale images to player size
-        if self.push_img and self.push_img.get_size() != (self.width, self.height):
-            try:
-                self.push_img = pygame.transform.smoothscale(self.push_img, (self.width, self.height))
-            except Exception:
-                self.push_img = pygame.transform.scale(self.push_img, (self.width, self.height))
-        if self.pull_img and self.pull_img.get_size() != (self.width, self.height):
-            try:
-                self.pull_img = pygame.transform.smoothscale(self.pull_img, (self.width, self.height))
-            except Exception:
-                self.pull_img = pygame.transform.scale(self.pull_img, (self.width, self.height))
+        # clear pulls
+        self.pull = 0
 
-        # preload clone smoke frames (folder: src/assets/sprites/clone-smoke/)
-        try:
-            self.clone_smoke_frames = load_sequence("clone-smoke")
-        except Exception:
-            self.clone_smoke_frames = []
+        # reset player timers so no leftover tap/AI burst triggers a forced start
+        self.tap_timer = 0
+        self.ai_burst_timer = 0
+        self.ai_pause_timer = 0
 
-        # active particle/effect list
-        self.effects = []
-        # explicit total explosion time in milliseconds (set small so frames advance)
-        # 300 ms total for 6 frames -> 50 ms per frame
-        # total explosion time in milliseconds: 6 frames * 100ms = 600ms
-        self.explosion_duration_ms = 600
-        self.explosion_frames = load_sequence("explosion", 6)
-        self.explosion_anim = None
+        # --- enforce strict symmetry so each tap moves the rope equally ---
+        self.pull_strength = PULL_POWER
+        self.tap_duration = TAP_DURATION
+        self.max_stamina = MAX_STAMINA
+        self.stamina = MAX_STAMINA
+        self.stamina_drain = STAMINA_DRAIN
+        self.stamina_regen = STAMINA_REGEN
 
     def press_pull(self):
         # cannot pull if frozen
@@ -134,36 +128,9 @@ class Player:
 
     def apply_bomb_hit(self, freeze_frames=120):
         self.freeze_timer = freeze_frames
-        self.spawn_explosion()
-
-    def spawn_explosion(self, y_offset=-30):
-        """
-        Spawn explosion centered on the player's rect center.
-        y_offset moves it vertically (negative moves up).
-        """
-        if not getattr(self, "explosion_frames", None):
-            return
-
-        # use player rect if available
-        if hasattr(self, "rect") and self.rect:
-            cx, cy = self.rect.center
-        else:
-            cx = int(self.x + self.width / 2)
-            cy = int(self.y + self.height / 2)
-
-        cy += int(y_offset)
-
-        size = int(max(self.width, self.height) * 1.6)
-        # pass explicit duration in milliseconds
-        self.explosion_anim = ExplosionAnim(cx, cy, self.explosion_frames, duration_ms=self.explosion_duration_ms, target_size=(size, size))
 
     def update(self, *args, **kwargs):
-        # always update explosion animation first
-        if getattr(self, "explosion_anim", None):
-            self.explosion_anim.update()
-            if not self.explosion_anim.alive:
-                self.explosion_anim = None
-
+        """Advance the pull/stamina rules by one frame. Returns True on an idle frame."""
         # clone timer
         if self.clone_timer > 0:
             self.clone_timer -= 1
@@ -182,7 +149,7 @@ class Player:
             self.ai_burst_timer = 0
             self.ai_pause_timer = max(self.ai_pause_timer, self.freeze_timer)
             self.pull = 0
-            return
+            return False
 
         # tap (player input)
         if self.tap_timer > 0:
@@ -192,7 +159,7 @@ class Player:
             self.stamina -= self.stamina_drain
             if self.stamina < 0:
                 self.stamina = 0
-            return
+            return False
 
         # AI burst (when ai_act set burst)
         if self.ai_burst_timer > 0:
@@ -202,28 +169,24 @@ class Player:
             self.stamina -= self.stamina_drain
             if self.stamina < 0:
                 self.stamina = 0
-            return
+            return False
 
         # idle
         self.pull = 0
         self.stamina += self.stamina_regen
         if self.stamina > self.max_stamina:
             self.stamina = self.max_stamina
-
-        # update effects
-        for e in list(self.effects):
-            e.update()
-            if e.finished:
-                try:
-                    self.effects.remove(e)
-                except Exception:
-                    pass
+        return True
 
     def ai_act(self, rope_pos, rope_center, opponent_pull=0, threshold=10):
         # do nothing while frozen
         if self.freeze_timer > 0:
             return
 
+        if self.ai_policy is not None:
+            self.ai_policy.act(self, rope_pos, opponent_pull)
+            return
+
         if self.ai_pause_timer > 0:
             self.ai_pause_timer -= 1
 
@@ -233,93 +196,216 @@ class Player:
             condition = rope_pos < (rope_center - threshold)
 
         # higher base chance to start bursts, but keep bursts short so no long holds
-        respond_bias = 0.45 if opponent_pull == 0 else 0.7
+        respond_bias = self.ai_respond_bias[0] if opponent_pull == 0 else self.ai_respond_bias[1]
 
+        rng = self.rng
         if self.ai_pause_timer == 0:
             chance = min(1.0, self.ai_aggressiveness + respond_bias)
-            if condition and random.random() < chance:
+            if condition and rng.random() < chance:
                 # SHORT burst lengths, very brief pauses => frequent short pulls
-                self.ai_burst_timer = random.randint(1, 4)   # very short bursts
-                self.ai_pause_timer = random.randint(1, 6)   # short pause
+                self.ai_burst_timer = rng.randint(*self.ai_burst_frames)   # very short bursts
+                self.ai_pause_timer = rng.randint(*self.ai_pause_frames)   # short pause
                 return
 
         # higher opportunistic short-burst chance when opponent not pulling
-        if opponent_pull == 0 and random.random() < 0.18:
-            self.ai_burst_timer = random.randint(1, 4)
-            self.ai_pause_timer = random.randint(1, 6)
+        if opponent_pull == 0 and rng.random() < self.ai_opportunistic_chance:
+            self.ai_burst_timer = rng.randint(*self.ai_burst_frames)
+            self.ai_pause_timer = rng.randint(*self.ai_pause_frames)
             return
 
         # small increased chance for specials (still single-use per round)
         if not getattr(self, "clone_used", False) and not getattr(self, "clone_active", False):
-            if random.random() < (0.012 if self.side == "right" else 0.008):
+            if rng.random() < self.ai_clone_wish:
                 self.ai_wants_clone = True
 
         if not getattr(self, "bomb_used", False):
-            if random.random() < (0.008 if self.side == "right" else 0.003):
+            if rng.random() < self.ai_bomb_wish:
                 self.ai_wants_bomb = True
 
+    def reset(self):
+        # reset player for a new round
+        self.stamina = self.max_stamina
+        self.tap_timer = 0
+        self.clone_active = False
+        self.clone_timer = 0
+        self.clone_used = False
+        self.clone_cooldown_timer = 0
+        self.bomb_used = False
+        self.freeze_timer = 0
+        self.ai_burst_timer = 0
+        self.ai_pause_timer = 0
+        self.pull = 0
+
+
+class Player(PlayerState):
+    def __init__(self, x, y, width, height, side, push_img_path, pull_img_path, load=True, view=None):
+        super().__init__(x, y, side)
+        # sprites are pre-scaled for the view's physical size; positions stay logical
+        self.view = view or Viewport()
+        self.push_img = None
+        self.pull_img = None
+        self.clone_smoke_frames = []
+        # shared game.effects.EffectManager (set by Game); None spawns no effects
+        self.effects = None
+        # total explosion time in milliseconds: 6 frames * 100ms = 600ms
+        self.explosion_duration_ms = 600
+        self.explosion_frames = []
+        # shared game.particles.ParticleSystem (set by Game); None draws no particles
+        self.particles = None
+        if load:
+            self.load_sprites()
+
+    def load_sprites(self):
+        """Decode and scale this side's sprites (safe to run on the asset loader thread)."""
+        # --- LOAD SIDE-SPECIFIC SPRITES (explicit, prefer exact files) ---
+        if self.side == "left":
+            push_name = "girl-push.png"
+            pull_name = "girl-pull.png"
+        else:
+            push_name = "boy-push.png"
+            pull_name = "boy-pull.png"
+
+        self.push_img = load_image(push_name)
+        self.pull_img = load_image(pull_name)
+
+        # If preferred files are missing, log warning and attempt fallback but do NOT
+        # let fallback override a successfully loaded preferred image.
+        if self.push_img is None:
+            fallback = "boy-push.png" if self.side == "left" else "girl-push.png"
+            alt = load_image(fallback)
+            if alt:
+                # flip fallback for left side so it faces correct direction
+                if self.side == "left":
+                    alt = pygame.transform.flip(alt, True, False)
+                self.push_img = alt
+                log.info("asset", "%s player: using fallback push image %s", self.side, fallback)
+            else:
+                log.warning("asset", "no push image for %s player (tried %s and %s)", self.side, push_name, fallback)
+
+        if self.pull_img is None:
+            fallback = "boy-pull.png" if self.side == "left" else "girl-pull.png"
+            alt = load_image(fallback)
+            if alt:
+                if self.side == "left":
+                    alt = pygame.transform.flip(alt, True, False)
+                self.pull_img = alt
+                log.info("asset", "%s player: using fallback pull image %s", self.side, fallback)
+            else:
+                log.warning("asset", "no pull image for %s player (tried %s and %s)", self.side, pull_name, fallback)
+        else:
+            if self.pull_img is None:
+                # Load default pull image or handle error
+                pass  # Add your code here if needed
+
+        # scale images to player size (in physical pixels)
+        size = self.view.size(self.width, self.height)
+        if self.push_img and self.push_img.get_size() != size:
+            try:
+                self.push_img = pygame.transform.smoothscale(self.push_img, size)
+            except Exception:
+                self.push_img = pygame.transform.scale(self.push_img, size)
+        if self.pull_img and self.pull_img.get_size() != size:
+            try:
+                self.pull_img = pygame.transform.smoothscale(self.pull_img, size)
+            except Exception:
+                self.pull_img = pygame.transform.scale(self.pull_img, size)
+
+        # preload clone smoke frames (folder: src/assets/sprites/clone-smoke/)
+        try:
+            self.clone_smoke_frames = load_sequence("clone-smoke")
+        except Exception:
+            self.clone_smoke_frames = []
+
+        self.explosion_frames = load_sequence("explosion", 6)
+
+    def apply_bomb_hit(self, freeze_frames=120):
+        super().apply_bomb_hit(freeze_frames)
+        self.spawn_explosion()
+        if self.particles is not None:
+            # same spot as spawn_explosion, in logical pixels
+            self.particles.burst("explosion", self.x + self.width / 2, self.y + self.height / 2 - 30)
+
+    def activate_clone(self, frames=None):
+        if not super().activate_clone(frames):
+            return False
+        if self.particles is not None:
+            self.particles.burst("clone", self.clone_x(), self.y)
+        return True
+
+    def clone_x(self):
+        """Logical x of the clone's center: in front of the player, toward the rope center."""
+        offset_x = int(self.width * 0.8)
+        # small manual nudges: left clone 2px left, right clone 2px right
+        if self.side == "left":
+            return self.x + self.width // 2 + offset_x - 2
+        return self.x + self.width // 2 - offset_x + 2
+
+    def spawn_explosion(self, y_offset=-30):
+        """
+        Spawn explosion centered on the player's rect center.
+        y_offset moves it vertically (negative moves up).
+        """
+        if self.effects is None or not getattr(self, "explosion_frames", None):
+            return
+
+        # use player rect if available
+        if hasattr(self, "rect") and self.rect:
+            cx, cy = self.rect.center
+        else:
+            cx = int(self.x + self.width / 2)
+            cy = int(self.y + self.height / 2)
+
+        cy += int(y_offset)
+
+        # the effect draws in physical pixels: cover a size x size square
+        size = self.view.px(int(max(self.width, self.height) * 1.6))
+        fw, fh = self.explosion_frames[0].get_size()
+        frames = self.effects.scaled("explosion", self.explosion_frames, max(size / float(fw), size / float(fh)))
+        cx, cy = self.view.pt(cx, cy)
+        self.effects.spawn(frames, cx, cy, self.explosion_duration_ms / len(frames))
+
+    def _clone_image(self, img):
+        """Semi-transparent copy of img for the clone, made once per source frame."""
+        cache = getattr(self, "_clone_cache", None)
+        if cache is None or cache[0] is not img:
+            try:
+                clone_img = img.copy()
+                clone_img.set_alpha(160)
+            except Exception:
+                clone_img = img
+            self._clone_cache = cache = (img, clone_img)
+        return cache[1]
+
     def draw(self, surface):
-        # draw player sprite
+        # surface is a Surface or a game.render.RenderQueue
         # show pull frame when actively pulling, else ready/push frame if available
+        img = None
         if self.pull > 0 and self.pull_img:
             img = self.pull_img
         elif self.push_img:
             img = self.push_img
 
+        view = self.view
         if img:
-            rect = img.get_rect(center=(self.x + self.width // 2, self.y))
-            surface.blit(img, rect)
+            w, h = img.get_size()
+            cx, cy = view.pt(self.x + self.width // 2, self.y)
+            surface.blit(img, (cx - w // 2, cy - h // 2))
         else:
             # fallback rectangle (red for left, blue for right)
             color = (180, 60, 60) if self.side == 'left' else (60, 90, 180)
-            rect = pygame.Rect(self.x, self.y - self.height // 2, self.width, self.height)
-            pygame.draw.rect(surface, color, rect)
+            rect = view.rect(self.x, self.y - self.height // 2, self.width, self.height)
+            primitive(surface, pygame.draw.rect, color, rect)
 
         # draw clone (semi-transparent copy) in front if active
         if self.clone_active and img:
-            try:
-                clone_img = img.copy()
-                # semi-transparent
-                clone_img.set_alpha(160)
-            except Exception:
-                clone_img = img
             # offset in front toward center: left clone appears to the right, right clone to the left
-            offset_x = int(self.width * 0.8)
-            # small manual nudges: left clone 2px left, right clone 2px right
-            if self.side == "left":
-                cx = self.x + self.width // 2 + offset_x - 2
-            else:
-                cx = self.x + self.width // 2 - offset_x + 2
-            crect = clone_img.get_rect(center=(cx, self.y))
-            surface.blit(clone_img, crect)
-
-        # draw local effects
-        for e in self.effects:
-            e.draw(surface)
-
-        # draw explosion on top even if player frozen
-        if getattr(self, "explosion_anim", None):
-            self.explosion_anim.draw(surface)
+            cx, cy = view.pt(self.clone_x(), self.y)
+            surface.blit(self._clone_image(img), (cx - w // 2, cy - h // 2))
 
     def spawn_effect(self, x, y, kind="clone-smoke", frame_rate=12):
-        if kind == "clone-smoke" and self.clone_smoke_frames:
-            eff = SpriteEffect(x, y, self.clone_smoke_frames, frame_rate=frame_rate)
-            self.effects.append(eff)
-
-    def reset(self):
-        # reset player for a new round
-        self.stamina = self.max_stamina
-        self.tap_timer = 0
-        self.clone_active = False
-        self.clone_timer = 0
-        self.clone_used = False
-        self.clone_cooldown_timer = 0
-        self.bomb_used = False
-        self.freeze_timer = 0
-        self.ai_burst_timer = 0
-        self.ai_pause_timer = 0
-        self.pull = 0
-        self.effects = []
+        """Play the clone smoke centered on physical (x, y), frame_rate frames per image."""
+        if kind == "clone-smoke" and self.clone_smoke_frames and self.effects is not None:
+            self.effects.spawn(self.clone_smoke_frames, x, y, frame_rate * FRAME_MS)
 
 class Game:
     def run(self):
@@ -339,6 +425,6 @@ class Game:
             now = pygame.time.get_ticks()
             if now - fps_timer >= 1000:
                 fps = frame_count / ((now - fps_timer) / 1000.0)
-                print(f"[dbg-core] approx fps={fps:.1f} tick_dt={dt}ms")
+                log.debug("frame", "approx fps=%.1f tick_dt=%dms", fps, dt)
                 fps_timer = now
                 frame_count = 0
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""Precomputed lookup-table AI policy.
+
+TablePolicy maps a discretized observation - rope offset toward the AI's own
+win, own stamina, opponent pull and which specials are still available - to
+one action byte, so each decision is a handful of integer ops and one index
+into a bytes object. Plug it in with ``player.ai_policy = TablePolicy.load()``;
+PlayerState.ai_act then defers to it.
+
+Tables are generated offline from game.sim rollouts:
+
+    python -m game.policy build --rollouts 8 --out assets/ai_policy.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+
+from game.sim import Match, AIController
+from game.player import MAX_STAMINA, PULL_POWER
+
+# actions (one byte each in the table)
+IDLE = 0
+PULL_SHORT = 1
+PULL_LONG = 2
+CLONE = 3
+BOMB = 4
+ACTIONS = (IDLE, PULL_SHORT, PULL_LONG, CLONE, BOMB)
+ACTION_NAMES = ("idle", "pull-short", "pull-long", "clone", "bomb")
+
+PULL_SHORT_FRAMES = 2
+PULL_LONG_FRAMES = 6
+
+# observation bins
+ROPE_BINS = 12
+STAMINA_BINS = 4
+OPPONENT_BINS = 3   # idle / pulling / pulling with a clone
+SPECIAL_BINS = 4    # bit 0: clone available, bit 1: bomb available
+TABLE_SIZE = ROPE_BINS * STAMINA_BINS * OPPONENT_BINS * SPECIAL_BINS
+
+DEFAULT_POLICY_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "ai_policy.json")
+
+
+class TablePolicy:
+    def __init__(self, table, min_x=120, max_x=680, max_stamina=MAX_STAMINA, pull_strength=PULL_POWER,
+                 rope_bins=ROPE_BINS, stamina_bins=STAMINA_BINS):
+        self.rope_bins = rope_bins
+        self.stamina_bins = stamina_bins
+        self.size = rope_bins * stamina_bins * OPPONENT_BINS * SPECIAL_BINS
+        self.table = bytes(table)
+        if len(self.table) != self.size:
+            raise ValueError(f"policy table has {len(self.table)} cells, expected {self.size}")
+        self.min_x = min_x
+        self.max_x = max_x
+        self.max_stamina = float(max_stamina)
+        self.pull_strength = pull_strength
+
+    def index(self, side, rope_pos, stamina, opponent_pull, clone_ready, bomb_ready):
+        span = self.max_x - self.min_x
+        # offset toward our own win: right wins at max_x, left at min_x
+        off = rope_pos - self.min_x if side == "right" else self.max_x - rope_pos
+        r = int(off * self.rope_bins // span) if span > 0 else 0
+        r = 0 if r < 0 else (self.rope_bins - 1 if r >= self.rope_bins else r)
+        s = int(stamina * self.stamina_bins // self.max_stamina) if self.max_stamina > 0 else 0
+        s = 0 if s < 0 else (self.stamina_bins - 1 if s >= self.stamina_bins else s)
+        o = 0 if opponent_pull <= 0 else (1 if opponent_pull <= self.pull_strength else 2)
+        return ((r * self.stamina_bins + s) * OPPONENT_BINS + o) * SPECIAL_BINS + (clone_ready | (bomb_ready << 1))
+
+    def decide(self, player, rope_pos, opponent_pull):
+        return self.table[self.index(player.side, rope_pos, player.stamina, opponent_pull,
+                                     not player.clone_used, not player.bomb_used)]
+
+    def act(self, player, rope_pos, opponent_pull):
+        """Apply this frame's decision to player (called from PlayerState.ai_act)."""
+        action = self.decide(player, rope_pos, opponent_pull)
+        apply_action(player, action)
+
+    def to_dict(self):
+        return {"table": list(self.table), "min_x": self.min_x, "max_x": self.max_x,
+                "max_stamina": self.max_stamina, "pull_strength": self.pull_strength,
+                "rope_bins": self.rope_bins, "stamina_bins": self.stamina_bins}
+
+    def save(self, path=DEFAULT_POLICY_PATH):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path=DEFAULT_POLICY_PATH):
+        with open(path) as f:
+            data = json.load(f)
+        return cls(**data)
+
+
+def apply_action(player, action):
+    if action == PULL_SHORT or action == PULL_LONG:
+        if player.ai_burst_timer == 0:
+            player.ai_burst_timer = PULL_SHORT_FRAMES if action == PULL_SHORT else PULL_LONG_FRAMES
+    elif action == CLONE:
+        player.activate_clone()
+    elif action == BOMB:
+        if not player.bomb_used:
+            # Game.run / AIController throw it after the update
+            player.ai_wants_bomb = True
+
+
+def cell_state(policy, index):
+    """Representative (rope_pos, stamina, opponent_pull, clone_ready, bomb_ready) for a cell, right side."""
+    special = index % SPECIAL_BINS
+    index //= SPECIAL_BINS
+    o = index % OPPONENT_BINS
+    index //= OPPONENT_BINS
+    s = index % policy.stamina_bins
+    r = index // policy.stamina_bins
+    span = policy.max_x - policy.min_x
+    rope_pos = policy.min_x + int((r + 0.5) * span / policy.rope_bins)
+    stamina = (s + 0.5) * policy.max_stamina / policy.stamina_bins
+    opponent_pull = (0, policy.pull_strength, policy.pull_strength * 2)[o]
+    return rope_pos, stamina, opponent_pull, bool(special & 1), bool(special & 2)
+
+
+class _FirstAction:
+    """Rollout policy: force one action on the first decision, then defer to `then`."""
+    def __init__(self, action, then, rope_center):
+        self.action = action
+        self.then = then
+        self.rope_center = rope_center
+
+    def act(self, player, rope_pos, opponent_pull):
+        if self.action is not None:
+            action, self.action = self.action, None
+            apply_action(player, action)
+        elif self.then is not None:
+            self.then.act(player, rope_pos, opponent_pull)
+        else:
+            # no table yet: fall back to the hand-tuned AI for the rest of the rollout
+            player.ai_policy = None
+            player.ai_act(rope_pos, self.rope_center, opponent_pull)
+            player.ai_policy = self
+
+
+def _rollout_value(match, horizon):
+    """Right-side score in [0, 1]: wins > unfinished > losses, graded within each."""
+    winner = match.run(max_ticks=horizon)
+    # faster wins and longer-held losses score better, so actions that all win
+    # (or all lose) still rank by margin instead of tying
+    if winner == "Right team":
+        return 1.0 - 0.25 * match.tick / float(horizon)
+    if winner == "Left team":
+        return 0.25 * match.tick / float(horizon)
+    rope = match.rope
+    # unfinished: score by how far the knot sits toward the right's win
+    return 0.5 * (rope.pos - rope.min_x) / float(max(1, rope.max_x - rope.min_x)) + 0.25
+
+
+def _best_action_job(job):
+    index, policy_dict, base_table, rollouts, horizon, seed = job
+    from game.tuning import REFERENCE_BOTS
+    probe = TablePolicy(**policy_dict)
+    base = TablePolicy(**dict(policy_dict, table=base_table)) if base_table is not None else None
+    rope_pos, stamina, opponent_pull, clone_ready, bomb_ready = cell_state(probe, index)
+    # rollouts cycle through the reference bots, so the table has to beat all of them
+    opponents = sorted(REFERENCE_BOTS)
+    best, best_value = IDLE, -1.0
+    for action in ACTIONS:
+        if (action == CLONE and not clone_ready) or (action == BOMB and not bomb_ready):
+            continue
+        total = 0.0
+        for r in range(rollouts):
+            m = Match(left=REFERENCE_BOTS[opponents[r % len(opponents)]](), right=AIController(), seed=seed + r)
+            m.rope.pos = rope_pos
+            m.right.stamina = stamina
+            m.right.clone_used = not clone_ready
+            m.right.bomb_used = not bomb_ready
+            m.right.ai_pause_timer = 0
+            if opponent_pull:
+                m.left.pull = opponent_pull
+                m.left.tap_timer = 3
+                if opponent_pull > probe.pull_strength:
+                    m.left.activate_clone()
+            m.right.ai_policy = _FirstAction(action, base, m.rope.center)
+            total += _rollout_value(m, horizon)
+        value = total / rollouts
+        if value > best_value:
+            best, best_value = action, value
+    return index, best
+
+
+def build_table(rollouts=8, horizon=300, iterations=1, seed=0, workers=None, log=print):
+    """Generate a table by Monte Carlo rollouts on the headless engine.
+
+    Each cell gets the action with the best rollout value against the
+    reference bots of game.tuning on the left (rollouts take turns); later
+    iterations roll out with the previous table, i.e. policy iteration.
+    """
+    probe = TablePolicy(bytes(TABLE_SIZE))
+    policy_dict = probe.to_dict()
+    base_table = None
+    workers = workers or os.cpu_count() or 1
+    for it in range(iterations):
+        jobs = [(i, policy_dict, base_table, rollouts, horizon, seed + it * 7919) for i in range(probe.size)]
+        table = bytearray(probe.size)
+        if workers <= 1:
+            results = map(_best_action_job, jobs)
+        else:
+            pool = multiprocessing.Pool(workers)
+            results = pool.imap_unordered(_best_action_job, jobs, chunksize=8)
+        for index, action in results:
+            table[index] = action
+        if workers > 1:
+            pool.close()
+            pool.join()
+        base_table = list(table)
+        if log:
+            counts = ", ".join(f"{ACTION_NAMES[a]}={table.count(a)}" for a in ACTIONS)
+            log(f"[policy] iteration {it}: {counts}")
+    return TablePolicy(base_table, **{k: v for k, v in policy_dict.items() if k != "table"})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the lookup-table AI policy from headless rollouts.")
+    parser.add_argument("command", choices=("build",))
+    parser.add_argument("--rollouts", type=int, default=8)
+    parser.add_argument("--horizon", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=DEFAULT_POLICY_PATH)
+    args = parser.parse_args(argv)
+
+    policy = build_table(rollouts=args.rollouts, horizon=args.horizon, iterations=args.iterations,
+                         seed=args.seed, workers=args.workers)
+    policy.save(args.out)
+    print(f"[policy] wrote {policy.size}-cell table to {os.path.normpath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,48 @@
 import os
 import pygame
-from game.utils import load_image
+from game.utils import load_scaled
+from game.render import primitive
+from game.eventlog import log
 
 # desired bomb sprite size (width, height)
 # increased size for a visually larger bomb
 BOMB_SIZE = 48
 
-# try generic loader first
-_BOMB_IMG = load_image("bomb.png")
-
-# explicit fallback to src/assets/sprites/bomb.png
-if not _BOMB_IMG:
-    path = os.path.join("src", "assets", "sprites", "bomb.png")
-    if os.path.exists(path):
-        try:
-            _BOMB_IMG = pygame.image.load(path).convert_alpha()
-            print(f"[debug projectile] loaded bomb image from {path}")
-        except Exception:
+# decoded on first use (or by the asset loader thread), never at import time;
+# one entry per physical size the sprite is drawn at
+_BOMB_IMGS = {}
+
+
+def bomb_image(size=(BOMB_SIZE, BOMB_SIZE)):
+    """Return the bomb sprite scaled to size, loading it once; None if unavailable."""
+    size = tuple(size)
+    if size in _BOMB_IMGS:
+        return _BOMB_IMGS[size]
+    img = load_scaled("bomb.png", size)
+
+    # explicit fallback to src/assets/sprites/bomb.png
+    if not img:
+        path = os.path.join("src", "assets", "sprites", "bomb.png")
+        if os.path.exists(path):
             try:
-                _BOMB_IMG = pygame.image.load(path).convert()
-                print(f"[debug projectile] loaded bomb image (no alpha) from {path}")
+                img = pygame.image.load(path).convert_alpha()
+                log.debug("asset", "loaded bomb image from %s", path)
             except Exception:
-                _BOMB_IMG = None
-    else:
-        print(f"[debug projectile] bomb image not found at {path}, using fallback circle")
+                try:
+                    img = pygame.image.load(path).convert()
+                    log.debug("asset", "loaded bomb image (no alpha) from %s", path)
+                except Exception:
+                    img = None
+        else:
+            log.info("asset", "bomb image not found at %s, using fallback circle", path)
 
-if _BOMB_IMG:
-    try:
-        _BOMB_IMG = pygame.transform.smoothscale(_BOMB_IMG, (BOMB_SIZE, BOMB_SIZE))
-    except Exception:
-        pass
+        if img:
+            try:
+                img = pygame.transform.smoothscale(img, size)
+            except Exception:
+                pass
+    _BOMB_IMGS[size] = img
+    return img
 
 class Bomb:
     """Simple parabolic projectile using bomb.png when available."""
@@ -41,6 +54,7 @@ class Bomb:
         self.gravity = gravity
         self.alive = True
         self.exploded = False
+        self.motion = (0.0, 0.0)    # how far the last update() moved it (for swept hits)
 
     def update(self):
         if not self.alive or self.exploded:
@@ -48,27 +62,79 @@ class Bomb:
         self.vy += self.gravity
         self.x += self.vx
         self.y += self.vy
+        self.motion = (self.vx, self.vy)
 
-    def draw(self, surface):
+    def draw(self, surface, view=None):
         if not self.alive or self.exploded:
             return
-        if _BOMB_IMG:
-            try:
-                rect = _BOMB_IMG.get_rect(center=(int(self.x), int(self.y)))
-                surface.blit(_BOMB_IMG, rect)
-                return
-            except Exception:
-                pass
+        # positions are logical; view (game.view.Viewport) maps them to the display.
+        # surface is a Surface or a game.render.RenderQueue
+        center = view.pt(self.x, self.y) if view is not None else (int(self.x), int(self.y))
+        img = bomb_image(view.size(BOMB_SIZE, BOMB_SIZE) if view is not None else (BOMB_SIZE, BOMB_SIZE))
+        if img:
+            w, h = img.get_size()
+            surface.blit(img, (center[0] - w // 2, center[1] - h // 2))
+            return
         # fallback: draw same-sized gray circle
         radius = max(4, BOMB_SIZE // 2)
-        pygame.draw.circle(surface, (80, 80, 80), (int(self.x), int(self.y)), radius)
+        if view is not None:
+            radius = view.px(radius)
+        primitive(surface, pygame.draw.circle, (80, 80, 80), center, radius)
 
     def get_rect(self):
-        if _BOMB_IMG:
-            w, h = _BOMB_IMG.get_size()
-            return pygame.Rect(int(self.x - w/2), int(self.y - h/2), w, h)
+        # collision box in logical pixels (the sprite's logical size), whatever
+        # size it is drawn at and whether or not it loaded
         r = max(4, BOMB_SIZE // 2)
         return pygame.Rect(int(self.x - r), int(self.y - r), r*2, r*2)
 
+    def hits(self, target):
+        """True if the bomb touched target (a Rect) anywhere along its last step."""
+        return swept_hit(self.get_rect(), self.motion, target) is not None
+
     def offscreen(self, width, height):
-        return (self.x < -200) or (self.x > width + 200) or (self.y > height + 400)
\ No newline at end of file
+        return (self.x < -200) or (self.x > width + 200) or (self.y > height + 400)
+
+def launch_bomb(thrower, target, travel_time_frames=60, gravity=0.4):
+    """Return a Bomb aimed from thrower at target so it lands in ~travel_time_frames."""
+    sx = thrower.x + thrower.width // 2
+    sy = thrower.y - (thrower.height * 0.1)
+    tx = target.x + target.width // 2
+    ty = target.y
+    dx = tx - sx
+    dy = ty - sy
+    T = float(max(10, travel_time_frames))
+    vx = dx / T
+    vy = (dy - 0.5 * gravity * T * T) / T
+    return Bomb(sx, sy, vx, vy, gravity=gravity)
+
+
+def swept_hit(box, motion, target):
+    """Fraction of the step (0..1) at which box first touched target, or None.
+
+    box is where the moving rect ended up and motion how far it moved to get
+    there, so the whole segment between two frames is tested, not just its
+    end: a fast bomb (short travel time, big or time-scaled steps) can't jump
+    over a hitbox. Touching edges don't count, as with colliderect, and at
+    the end of the step this is exactly box.colliderect(target).
+    """
+    enter, leave = float("-inf"), float("inf")
+    # per axis: the offsets u from the end position (u = (s - 1) * d at
+    # fraction s of the step) where the two spans overlap, lo < u < hi
+    for lo, hi, d in ((target.left - box.right, target.right - box.left, motion[0]),
+                      (target.top - box.bottom, target.bottom - box.top, motion[1])):
+        if d == 0:
+            if not lo < 0 < hi:
+                return None
+            continue
+        a, b = 1 + lo / d, 1 + hi / d
+        if a > b:
+            a, b = b, a
+        enter, leave = max(enter, a), min(leave, b)
+    if enter < 1 and leave > 0 and enter < leave:
+        return max(enter, 0.0)
+    return None
+
+
+def hitbox(player):
+    """Rect a bomb must touch to hit player (feet at player.y, body above)."""
+    return pygame.Rect(player.x, player.y - player.height, player.width, player.height)
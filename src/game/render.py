@@ -0,0 +1,65 @@
+"""Per-frame render queue: gather blits, submit them in batches.
+
+Drawables call queue.blit(surface, pos) / queue.blits(seq) exactly as they
+would on a Surface;
+primitives (pygame.draw.*, fill) go through primitive(), which on a queue
+records the call in order. flush() then submits each run of consecutive
+blits with one Surface.fblits call (pygame-ce) or Surface.blits(...,
+doreturn=False) on pygame, so layering is exactly the call order.
+"""
+import pygame
+
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+class RenderQueue:
+    def __init__(self):
+        self._ops = []      # finished blit runs (lists) and deferred primitives (tuples)
+        self._run = []      # current run of (surface, pos) pairs
+        self.submitted = 0  # blit calls batched by the last flush
+
+    def blit(self, source, dest):
+        self._run.append((source, dest))
+
+    def blits(self, blit_sequence, doreturn=False):
+        # same signature as Surface.blits so drawables can take either
+        self._run.extend(blit_sequence)
+
+    def defer(self, fn, *args):
+        """Queue a non-blit draw call fn(target, *args) at this point in the order."""
+        if self._run:
+            self._ops.append(self._run)
+            self._run = []
+        self._ops.append((fn, args))
+
+    def flush(self, target):
+        """Draw everything queued onto target, in order, and clear the queue."""
+        if self._run:
+            self._ops.append(self._run)
+            self._run = []
+        count = 0
+        for op in self._ops:
+            if isinstance(op, list):
+                count += len(op)
+                if _HAS_FBLITS:
+                    target.fblits(op)
+                else:
+                    target.blits(op, doreturn=False)
+            else:
+                fn, args = op
+                primitive(target, fn, *args)
+        self._ops = []
+        self.submitted = count
+
+
+def primitive(surface, fn, *args):
+    """fn(surface, *args) now, or in order later when surface is a RenderQueue.
+
+    A game.texrender.TextureScreen turns the call into Renderer draws itself.
+    """
+    if isinstance(surface, RenderQueue):
+        surface.defer(fn, *args)
+    elif isinstance(surface, pygame.Surface):
+        fn(surface, *args)
+    else:
+        surface.primitive(fn, *args)
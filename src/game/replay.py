@@ -0,0 +1,264 @@
+"""Match replays: recorded input logs, re-simulated and rendered to PNGs or video.
+
+With TUG_REPLAYS=<dir> every round is seeded (Game._seed_round) and its key
+presses are logged per side as (tick, action) pairs, the same format
+game.sim.ScriptedController plays. At game over the log is saved as
+<dir>/<YYYYmmdd-HHMMSS>-<seed>.json.
+
+export() plays a replay back through the real Game loop headlessly (a
+game.capture.FrameCapture: same update and draw code, the recorded keys
+posted on their ticks) and hands every rendered frame to a sink:
+
+  PngSequence   frames are encoded by a pool of worker processes while the
+                main process keeps simulating and rendering
+  FfmpegVideo   raw RGB frames piped to a local ffmpeg (used for .mp4/.webm/...
+                outputs when ffmpeg is on PATH), which encodes on its own threads
+
+Run from src/:  python -m game.replay REPLAY.json --out /tmp/clip            (PNG sequence)
+                python -m game.replay REPLAY.json --out clip.mp4 --start 20 --duration 8
+                python -m game.replay --bench 60 --out /tmp/clip             (synthetic 60 s match)
+"""
+import argparse
+import collections
+import concurrent.futures
+import datetime
+import json
+import multiprocessing
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import time
+import zlib
+
+import numpy as np
+import pygame
+
+from game.eventlog import log
+from game.tuning import AI_DEFAULTS, apply_ai_params
+
+FPS = 60
+TAIL_FRAMES = FPS           # game-over frames exported after the winning tick
+VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm", ".mov", ".gif")
+PNG_LEVEL = 3               # zlib level for PNG frames: ~4x faster than pygame's saver, files a bit bigger
+
+# key each logged action is replayed with, per side (see Game.run)
+KEYS = {
+    ("left", "pull"): pygame.K_a, ("left", "clone"): pygame.K_f, ("left", "bomb"): pygame.K_d,
+    ("right", "pull"): pygame.K_l, ("right", "clone"): pygame.K_h, ("right", "bomb"): pygame.K_j,
+}
+
+
+def replay_of(game):
+    """The finished round of game as a JSON-able replay."""
+    return {
+        "version": 1,
+        "seed": game.round_seed,
+        "ai": bool(game.ai_enabled),
+        "spectate": game.spectating,        # AI on both sides (Game.spectate)
+        "ai_label": game.ai_label,
+        # a table policy (ai_label "policy") isn't stored; export() needs it passed back in
+        "ai_params": {k: getattr(game.right, k) for k in AI_DEFAULTS} if game.ai_enabled else None,
+        "team_size": len(game.left_team) + 1 if game.left_team is not None else 1,
+        "ticks": game.match_ticks,
+        "winner": game.winner,
+        "left": game.input_log["left"],
+        "right": game.input_log["right"],
+    }
+
+
+def save_replay(game, directory):
+    """Write the finished round of game to directory; returns the path (None on failure)."""
+    try:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{datetime.datetime.now():%Y%m%d-%H%M%S}-{game.round_seed:08x}.json")
+        with open(path, "w") as f:
+            json.dump(replay_of(game), f)
+        return path
+    except (OSError, TypeError) as e:
+        log.error("data", "failed to save replay: %s", e)
+        return None
+
+
+def load_replay(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def synthetic_replay(seconds, seed=1):
+    """A 2P round of about seconds length: both sides tap at the same rate, specials mid-match."""
+    ticks = int(seconds * FPS)
+    left = [(t, "pull") for t in range(1, ticks, 6)]
+    right = [(t, "pull") for t in range(4, ticks, 6)]
+    left += [(ticks // 4, "clone"), (ticks // 2, "bomb")]
+    right += [(ticks // 4 + 200, "clone"), (ticks // 2 + 60, "bomb")]
+    return {"version": 1, "seed": seed, "ai": False, "ai_label": None, "ai_params": None, "team_size": 1,
+            "ticks": ticks, "winner": None, "left": sorted(left), "right": sorted(right)}
+
+
+# -- frame sinks ---------------------------------------------------------------
+
+def _png_chunk(tag, body):
+    return struct.pack(">I", len(body)) + tag + body + struct.pack(">I", zlib.crc32(tag + body))
+
+
+def encode_png(data, size, level=PNG_LEVEL):
+    """RGB bytes -> PNG file bytes (8-bit truecolor, no row filters)."""
+    w, h = size
+    rows = np.zeros((h, w * 3 + 1), dtype=np.uint8)     # column 0: filter type 0 per row
+    rows[:, 1:] = np.frombuffer(data, dtype=np.uint8).reshape(h, w * 3)
+    return (b"\x89PNG\r\n\x1a\n"
+            + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0))
+            + _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), level))
+            + _png_chunk(b"IEND", b""))
+
+
+def _write_png(path, data, size):
+    # runs in a worker process
+    with open(path, "wb") as f:
+        f.write(encode_png(data, size))
+
+
+class PngSequence:
+    """<directory>/frame_00000.png ... encoded on a process pool, at most a few frames in flight per worker."""
+    def __init__(self, directory, size, workers=None):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.size = size
+        workers = workers or multiprocessing.cpu_count() or 1
+        # spawn so workers don't inherit the SDL/display state of this process
+        ctx = multiprocessing.get_context("spawn")
+        self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+        self._pending = collections.deque()
+        self.max_pending = 4 * workers
+        self.written = 0
+
+    def add(self, data):
+        path = os.path.join(self.directory, f"frame_{self.written:05d}.png")
+        self._pending.append(self._pool.submit(_write_png, path, data, self.size))
+        self.written += 1
+        # bounded backlog: wait for the oldest frame instead of buffering the whole match
+        while len(self._pending) > self.max_pending:
+            self._pending.popleft().result()
+
+    def close(self):
+        while self._pending:
+            self._pending.popleft().result()
+        self._pool.shutdown()
+
+
+class FfmpegVideo:
+    """Raw RGB frames piped into ffmpeg, which encodes in parallel with the simulation."""
+    def __init__(self, path, size, fps=FPS, ffmpeg="ffmpeg"):
+        w, h = size
+        self._proc = subprocess.Popen(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}",
+             "-r", str(fps), "-i", "-", "-pix_fmt", "yuv420p", path], stdin=subprocess.PIPE)
+        self.written = 0
+
+    def add(self, data):
+        self._proc.stdin.write(data)
+        self.written += 1
+
+    def close(self):
+        self._proc.stdin.close()
+        if self._proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {self._proc.returncode}")
+
+
+def open_sink(out, size, workers=None):
+    """FfmpegVideo for a video file name (ffmpeg must be installed), else a PngSequence directory."""
+    if out.lower().endswith(VIDEO_EXTENSIONS):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError(f"ffmpeg not found; can't write {out} (export a PNG sequence directory instead)")
+        return FfmpegVideo(out, size, ffmpeg=ffmpeg)
+    return PngSequence(out, size, workers)
+
+
+# -- playback ------------------------------------------------------------------
+
+def export(replay, out, size=(800, 480), start=0.0, duration=None, workers=None, policy=None):
+    """Re-simulate replay and write frames start .. start+duration seconds to out.
+
+    Returns a dict of frame counts and timings. policy is the TablePolicy the
+    AI used when the replay's ai_label is "policy".
+    """
+    from game.capture import FrameCapture
+    tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+    cap = FrameCapture(size)
+    game = cap.game
+    game.reset()
+    game.ai_enabled = replay["ai"]
+    if replay.get("spectate"):
+        game.spectate()
+        game.spectate_hold = None       # stay on the result for the tail frames
+    if replay.get("ai_params"):
+        apply_ai_params(game.right, replay["ai_params"])
+    game.right.ai_policy = policy
+    game.set_team_size(replay.get("team_size", 1))
+    game.round_seed = replay["seed"]
+    game.start()
+
+    keys = collections.defaultdict(list)
+    for side in ("left", "right"):
+        for tick, action in replay[side]:
+            keys[int(tick)].append(KEYS[side, action])
+    end = replay["ticks"] + (TAIL_FRAMES if replay.get("winner") else 0)
+    first = int(start * FPS)
+    last = min(end, first + int(duration * FPS)) if duration is not None else end
+
+    sink = open_sink(out, cap.display.get_size(), workers)
+    t0 = time.perf_counter()
+    render_t = 0.0
+    try:
+        for frame in range(last):
+            t1 = time.perf_counter()
+            cap.step(() if game.game_over else keys.get(game.match_ticks, ()))
+            render_t += time.perf_counter() - t1
+            if frame >= first:
+                sink.add(tobytes(cap.display, "RGB"))
+    finally:
+        sink.close()
+        cap.close()
+    elapsed = time.perf_counter() - t0
+    if last == end and (game.winner, game.match_ticks) != (replay.get("winner"), replay["ticks"]):
+        log.warning("data", "replay diverged: %s after %d ticks, recorded %s after %d",
+                    game.winner, game.match_ticks, replay.get("winner"), replay["ticks"])
+    return {"frames": sink.written, "simulated": last, "elapsed": elapsed, "render": render_t,
+            "winner": game.winner, "ticks": game.match_ticks}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a recorded match to a PNG sequence or a video.")
+    parser.add_argument("replay", nargs="?", help="replay JSON (saved with TUG_REPLAYS)")
+    parser.add_argument("--out", required=True, help="output directory (PNG sequence) or video file (.mp4 ...)")
+    parser.add_argument("--start", type=float, default=0.0, help="clip start, seconds into the match")
+    parser.add_argument("--duration", type=float, default=None, help="clip length in seconds (default: to the end)")
+    parser.add_argument("--size", default="800x480", help="frame size (WxH)")
+    parser.add_argument("--workers", type=int, default=None, help="PNG encoder processes (default: all cores)")
+    parser.add_argument("--policy", default=None, help="TablePolicy file for replays of the table-policy AI")
+    parser.add_argument("--bench", type=float, default=0, help="export a synthetic match this many seconds long")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        replay = synthetic_replay(args.bench)
+    elif args.replay:
+        replay = load_replay(args.replay)
+    else:
+        parser.error("a replay file or --bench is required")
+    policy = None
+    if args.policy:
+        from game.policy import TablePolicy
+        policy = TablePolicy.load(args.policy)
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    stats = export(replay, args.out, (w, h), args.start, args.duration, args.workers, policy)
+    print(f"[replay] {stats['frames']} frames ({stats['simulated'] / float(FPS):.1f}s simulated) "
+          f"to {args.out} in {stats['elapsed']:.2f}s "
+          f"({stats['frames'] / stats['elapsed']:.0f} fps; simulate + render {stats['render'] * 1000 / max(1, stats['simulated']):.2f} ms/frame)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
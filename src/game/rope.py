@@ -1,8 +1,11 @@
 import pygame
-from game.utils import load_image
+from game.utils import load_image, load_scaled
+from game.view import Viewport
+from game.render import primitive
 from game.player import Player
 
-class Rope:
+class RopeState:
+    """Asset-free rope: travel limits, knot position and the pull rule."""
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -13,6 +16,36 @@ class Rope:
         # vertical position: below characters (baseline)
         self.y = height // 2 + 80
 
+    @property
+    def center(self):
+        """Starting knot position, halfway between the travel limits (what the AI pulls towards)."""
+        return self.width // 2
+
+    def recenter(self):
+        """Back to the starting state for a new round."""
+        self.pos = self.width // 2
+        self.y = self.height // 2 + 80
+
+    def apply_pull(self, left_pull, right_pull):
+        self.pos += (right_pull - left_pull)
+        self.pos = max(self.min_x, min(self.max_x, self.pos))
+
+
+class Rope(RopeState):
+    def __init__(self, width, height, load=True, view=None):
+        super().__init__(width, height)
+        # sprites are pre-scaled for the view's physical size; positions stay logical
+        self.view = view or Viewport()
+        self.body_img = None
+        self.knot_img = None
+        self.body_tile = None
+        # vertical offset for the knot (positive moves knot downward)
+        self.knot_offset = 5
+        if load:
+            self.load_images()
+
+    def load_images(self):
+        """Decode and scale the rope sprites (safe to run on the asset loader thread)."""
         self.body_img = load_image("rope-body.png")
         self.knot_img = load_image("rope-knot.png")
 
@@ -20,10 +53,10 @@ class Rope:
         if self.body_img:
             try:
                 # slightly larger than previous (was 48); make rope a bit thicker
-                target_h = 56
+                target_h = self.view.px(56)
                 w, h = self.body_img.get_size()
                 scale_w = max(1, int(w * (target_h / float(h))))
-                self.body_tile = pygame.transform.smoothscale(self.body_img, (scale_w, target_h))
+                self.body_tile = load_scaled("rope-body.png", (scale_w, target_h))
             except Exception:
                 self.body_tile = self.body_img
         else:
@@ -33,41 +66,48 @@ class Rope:
         if self.knot_img:
             try:
                 kw, kh = self.knot_img.get_size()
-                max_kh = 48
+                max_kh = self.view.px(48)
                 if kh > max_kh:
                     kscale = max_kh / float(kh)
-                    self.knot_img = pygame.transform.smoothscale(self.knot_img, (int(kw * kscale), max_kh))
+                    self.knot_img = load_scaled("rope-knot.png", (int(kw * kscale), max_kh))
             except Exception:
                 pass
 
-        # vertical offset for the knot (positive moves knot downward)
-        self.knot_offset = 5
-
-    def apply_pull(self, left_pull, right_pull):
-        self.pos += (right_pull - left_pull)
-        self.pos = max(self.min_x, min(self.max_x, self.pos))
+    def _body_blits(self, x0, x1, y):
+        """(tile, pos) pairs covering x0..x1; the last tile is cropped rather than clipped."""
+        key = (x0, x1, y, self.body_tile)
+        if getattr(self, "_body_key", None) != key:
+            tile_w, tile_h = self.body_tile.get_size()
+            seq = []
+            x = x0
+            while x < x1:
+                # keep the last tile out of the letterbox margin
+                tile = self.body_tile if x + tile_w <= x1 else self.body_tile.subsurface((0, 0, x1 - x, tile_h))
+                seq.append((tile, (x, y)))
+                x += tile_w
+            self._body_key, self._body_seq = key, seq
+        return self._body_seq
 
     def draw_body(self, surface):
+        # surface is a Surface or a game.render.RenderQueue
+        view = self.view
+        x0, cy = view.pt(0, self.y)
+        x1 = view.pt(self.width, self.y)[0]
         if self.body_tile:
-            tile_w, tile_h = self.body_tile.get_size()
-            y = int(self.y - tile_h // 2)
-            x = 0
-            while x < self.width:
-                surface.blit(self.body_tile, (x, y))
-                x += tile_w
+            y = int(cy - self.body_tile.get_height() // 2)
+            surface.blits(self._body_blits(x0, x1, y), doreturn=False)
         else:
             # fallback: draw a thicker line (2x thickness)
-            pygame.draw.line(surface, (220, 200, 60), (0, self.y), (self.width, self.y), 6)
+            primitive(surface, pygame.draw.line, (220, 200, 60), (x0, cy), (x1, cy), view.px(6))
 
     def draw_knot(self, surface):
+        cx, cy = self.view.pt(self.pos, self.y + getattr(self, "knot_offset", 0))
         if self.knot_img:
             kw, kh = self.knot_img.get_size()
-            kx = int(self.pos - kw // 2)
-            ky = int(self.y - kh // 2 + getattr(self, "knot_offset", 0))
-            surface.blit(self.knot_img, (kx, ky))
+            surface.blit(self.knot_img, (int(cx - kw // 2), int(cy - kh // 2)))
         else:
             # baseline fallback circle
-            pygame.draw.circle(surface, (240, 240, 240), (int(self.pos), int(self.y + getattr(self, "knot_offset", 0))), 8)
+            primitive(surface, pygame.draw.circle, (240, 240, 240), (cx, cy), self.view.px(8))
 
     def reset(self):
         self.rope = Rope(self.width, self.height)
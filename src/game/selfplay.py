@@ -0,0 +1,201 @@
+"""Self-play tabular Q-learning (Monte Carlo returns) trainer for the AI opponent.
+
+Both sides of a headless game.sim.Match are driven by the same epsilon-greedy
+learner over the TablePolicy observation cells and actions, so every rollout
+is two learning episodes (the left side sees the rope mirrored). Worker
+processes play batches of rollouts against a frozen copy of the Q table and
+send back (cell, action, return) updates; the parent merges them every
+round and checkpoints the table to disk. CPU only, standard library only.
+
+The greedy table exports as a game.policy.TablePolicy, i.e. the same object
+that plugs into the right-side AI slot (player.ai_policy) Game.run drives.
+
+Run from src/:  python -m game.selfplay --rounds 50 --checkpoint selfplay.ckpt
+"""
+import argparse
+import multiprocessing
+import os
+import pickle
+import random
+
+from game.sim import Match, AIController
+from game.policy import (TablePolicy, ACTIONS, CLONE, BOMB, SPECIAL_BINS, TABLE_SIZE,
+                         apply_action, DEFAULT_POLICY_PATH)
+
+MAX_TICKS = 60 * 60 * 2
+# returns are discounted per second of play before the round ended
+DISCOUNT_FRAMES = 60
+
+
+class QTable:
+    """Q values plus visit counts, one row of len(ACTIONS) per policy cell."""
+    def __init__(self, size, init=0.5):
+        self.size = size
+        self.q = [[init] * len(ACTIONS) for _ in range(size)]
+        self.n = [[0] * len(ACTIONS) for _ in range(size)]
+
+    def merge(self, updates, alpha=None):
+        """Fold worker (cell, action, return) samples in as incremental means
+        (or a constant step size when alpha is given)."""
+        for cell, action, value in updates:
+            self.n[cell][action] += 1
+            step = alpha if alpha is not None else 1.0 / self.n[cell][action]
+            self.q[cell][action] += step * (value - self.q[cell][action])
+
+    def greedy_table(self, probe):
+        table = bytearray(self.size)
+        for cell in range(self.size):
+            table[cell] = _argmax(self.q[cell], _allowed(cell))
+        return TablePolicy(table, **{k: v for k, v in probe.to_dict().items() if k != "table"})
+
+
+def _allowed(cell):
+    special = cell % SPECIAL_BINS
+    return [a for a in ACTIONS if not ((a == CLONE and not special & 1) or (a == BOMB and not special & 2))]
+
+
+def _argmax(row, allowed):
+    best = allowed[0]
+    for a in allowed:
+        if row[a] > row[best]:
+            best = a
+    return best
+
+
+class _Learner:
+    """Epsilon-greedy ai_policy that records the cells it visited."""
+    def __init__(self, probe, q, epsilon, rng):
+        self.probe = probe
+        self.q = q
+        self.epsilon = epsilon
+        self.rng = rng
+        self.trace = []
+
+    def act(self, player, rope_pos, opponent_pull):
+        cell = self.probe.index(player.side, rope_pos, player.stamina, opponent_pull,
+                                not player.clone_used, not player.bomb_used)
+        allowed = _allowed(cell)
+        if self.rng.random() < self.epsilon:
+            action = self.rng.choice(allowed)
+        else:
+            action = _argmax(self.q[cell], allowed)
+        self.trace.append((cell, action))
+        apply_action(player, action)
+
+
+def _episode_updates(trace, reward, gamma):
+    # Monte Carlo return: reward discounted by how far from the end the decision was
+    n = len(trace)
+    return [(cell, action, reward * (gamma ** ((n - 1 - i) / float(DISCOUNT_FRAMES))))
+            for i, (cell, action) in enumerate(trace)]
+
+
+def _rollout_job(job):
+    q, probe_dict, games, epsilon, gamma, seed = job
+    probe = TablePolicy(**probe_dict)
+    rng = random.Random(seed)
+    updates = []
+    wins = 0
+    for g in range(games):
+        m = Match(left=AIController(), right=AIController(), seed=seed * 1009 + g)
+        lp = _Learner(probe, q, epsilon, rng)
+        rp = _Learner(probe, q, epsilon, rng)
+        m.left.ai_policy = lp
+        m.right.ai_policy = rp
+        winner = m.run(max_ticks=MAX_TICKS)
+        if winner == "Right team":
+            r_right, wins = 1.0, wins + 1
+        elif winner == "Left team":
+            r_right = 0.0
+        else:
+            r_right = 0.5
+        updates += _episode_updates(rp.trace, r_right, gamma)
+        updates += _episode_updates(lp.trace, 1.0 - r_right, gamma)
+    return updates, wins
+
+
+class Trainer:
+    def __init__(self, workers=None, games_per_worker=8, epsilon=0.2, gamma=0.97, alpha=None, seed=0):
+        self.probe = TablePolicy(bytes(TABLE_SIZE))
+        self.q = QTable(self.probe.size)
+        self.workers = workers or os.cpu_count() or 1
+        self.games_per_worker = games_per_worker
+        self.epsilon = epsilon
+        self.gamma = gamma
+        self.alpha = alpha
+        self.seed = seed
+        self.round = 0
+
+    def train_round(self, pool=None):
+        """One merge period: every worker plays a batch against the current table."""
+        q = self.q.q
+        base = (self.seed + self.round) * 7919
+        jobs = [(q, self.probe.to_dict(), self.games_per_worker, self.epsilon, self.gamma, base + w)
+                for w in range(self.workers)]
+        results = pool.map(_rollout_job, jobs) if pool is not None else list(map(_rollout_job, jobs))
+        wins = 0
+        for updates, w in results:
+            self.q.merge(updates, alpha=self.alpha)
+            wins += w
+        self.round += 1
+        return wins / float(self.workers * self.games_per_worker)
+
+    def train(self, rounds, checkpoint=None, checkpoint_every=5, log=print):
+        pool = multiprocessing.Pool(self.workers) if self.workers > 1 else None
+        try:
+            for _ in range(rounds):
+                right_wins = self.train_round(pool)
+                if log:
+                    log(f"[selfplay] round {self.round}: right-side win rate {right_wins:.2f}")
+                if checkpoint and self.round % checkpoint_every == 0:
+                    self.save(checkpoint)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        if checkpoint:
+            self.save(checkpoint)
+
+    def policy(self):
+        return self.q.greedy_table(self.probe)
+
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump({"round": self.round, "q": self.q.q, "n": self.q.n,
+                         "epsilon": self.epsilon, "gamma": self.gamma, "seed": self.seed}, f)
+        os.replace(tmp, path)
+
+    def load(self, path):
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        self.round = data["round"]
+        self.q.q = data["q"]
+        self.q.n = data["n"]
+        self.epsilon = data.get("epsilon", self.epsilon)
+        self.gamma = data.get("gamma", self.gamma)
+        self.seed = data.get("seed", self.seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the AI opponent by self-play Q-learning.")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--games", type=int, default=8, help="games per worker per round")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--epsilon", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", default="selfplay.ckpt")
+    parser.add_argument("--out", default=DEFAULT_POLICY_PATH, help="where to write the greedy TablePolicy")
+    args = parser.parse_args(argv)
+
+    trainer = Trainer(workers=args.workers, games_per_worker=args.games, epsilon=args.epsilon, seed=args.seed)
+    if os.path.exists(args.checkpoint):
+        trainer.load(args.checkpoint)
+        print(f"[selfplay] resumed from {args.checkpoint} at round {trainer.round}")
+    trainer.train(args.rounds, checkpoint=args.checkpoint)
+    trainer.policy().save(args.out)
+    print(f"[selfplay] wrote greedy policy to {os.path.normpath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""Headless match engine: the gameplay rules of Game.run() without a window.
+
+Match steps the same PlayerState/RopeState rules the rendered game uses, in
+the same order (inputs -> AI -> player updates -> AI specials -> rope -> win
+check -> bombs), so a seeded Match is reproducible and cheap to run in bulk.
+
+Steady stretches (idle sides, held taps/bursts, freezes) are advanced in
+closed form by Match.advance(); results are bit-identical to stepping frame
+by frame.
+"""
+import bisect
+import random
+
+from game.player import PlayerState
+from game.rope import RopeState
+from game.projectile import Bomb, launch_bomb, hitbox
+
+# "never acts again" for quiet_ticks()
+FOREVER = 1 << 62
+
+# same timings Game uses
+BOMB_TRAVEL_FRAMES = 60
+BOMB_FREEZE_FRAMES = 120
+AI_START_PAUSE = 12
+AI_ROPE_CENTER = None  # None: the match rope's own center (RopeState.center)
+
+# PlayerState attributes that make up the rules state (see capture_state)
+PLAYER_FIELDS = (
+    "x", "y", "pull", "pull_strength", "tap_duration", "tap_timer",
+    "max_stamina", "stamina", "stamina_drain", "stamina_regen",
+    "ai_aggressiveness", "ai_respond_bias", "ai_burst_frames", "ai_pause_frames",
+    "ai_opportunistic_chance", "ai_clone_chance", "ai_bomb_chance", "ai_clone_wish", "ai_bomb_wish",
+    "ai_burst_timer", "ai_pause_timer", "ai_policy",
+    "clone_active", "clone_timer", "clone_duration", "clone_used", "clone_cooldown", "clone_cooldown_timer",
+    "bomb_used", "freeze_timer",
+)
+
+
+def capture_state(game):
+    """Picklable copy of the rules state of a Game or Match (no surfaces, no sounds)."""
+    rope = game.rope
+    return {
+        "width": game.width,
+        "height": game.height,
+        "rope": (rope.pos, rope.min_x, rope.max_x, rope.y),
+        "left": {f: getattr(game.left, f, None) for f in PLAYER_FIELDS},
+        "right": {f: getattr(game.right, f, None) for f in PLAYER_FIELDS},
+        "bombs": [(b.x, b.y, b.vx, b.vy, b.gravity) for b in getattr(game, "projectiles", [])
+                  if b.alive and not b.exploded],
+        "game_over": bool(getattr(game, "game_over", False)),
+        "winner": getattr(game, "winner", None),
+    }
+
+
+class IdleController:
+    """Never presses anything. Base class for match controllers.
+
+    before_update() runs where Game.run handles key presses and calls ai_act;
+    after_update() runs where Game.run rolls the AI's random clone/bomb.
+    quiet_ticks() is how many upcoming frames the controller is guaranteed to
+    neither draw randomness nor change state except through advance().
+    """
+    def before_update(self, match, player, opponent):
+        pass
+
+    def after_update(self, match, player, opponent):
+        pass
+
+    def quiet_ticks(self, match, player, opponent):
+        return FOREVER
+
+    def advance(self, match, player, n):
+        pass
+
+
+class AIController(IdleController):
+    """The built-in 1P opponent: Player.ai_act plus Game.run's random specials."""
+    def __init__(self, specials=True, rope_center=AI_ROPE_CENTER):
+        self.specials = specials
+        self.rope_center = rope_center
+
+    def center(self, match):
+        return match.rope.center if self.rope_center is None else self.rope_center
+
+    def before_update(self, match, player, opponent):
+        player.ai_act(match.rope.pos, self.center(match), opponent_pull=getattr(opponent, "pull", 0))
+
+    def after_update(self, match, player, opponent):
+        if player.ai_policy is not None:
+            # the table policy picks specials itself (see Game.run)
+            if getattr(player, "ai_wants_bomb", False):
+                player.ai_wants_bomb = False
+                if not player.bomb_used and player.freeze_timer == 0:
+                    match.spawn_bomb(player, opponent)
+            return
+        if not self.specials:
+            return
+        rng = player.rng
+        # AI random clone
+        if (not player.clone_used
+                and player.clone_cooldown_timer == 0
+                and player.freeze_timer == 0
+                and rng.random() < player.ai_clone_chance):
+            player.activate_clone()
+
+        # AI random bomb
+        if (not player.bomb_used
+                and player.freeze_timer == 0
+                and rng.random() < player.ai_bomb_chance):
+            match.spawn_bomb(player, opponent)
+
+    def quiet_ticks(self, match, player, opponent):
+        # ai_act returns before touching rng while frozen; the specials only
+        # roll once freeze_timer is back to 0 after the update
+        if player.freeze_timer > 0:
+            return player.freeze_timer - 1
+        if player.ai_policy is not None:
+            return 0
+
+        # with both specials spent, ai_act only draws randomness when the
+        # opponent is idle (opportunistic burst) or when its pause is over and
+        # the rope is past center +- threshold (respond); while the opponent
+        # keeps pulling, skip until the first frame that could respond
+        if not (player.clone_used and player.bomb_used):
+            return 0
+        if opponent.pull == 0 or match.phase(opponent) not in ("tap", "burst"):
+            return 0
+        # pulls (so the rope speed) are constant until either segment ends
+        pn, ppull = match._segment(player)
+        on, opull = match._segment(opponent)
+        n = min(pn, on)
+        threshold = 10
+        rope, center = match.rope, self.center(match)
+        # px the knot can still move towards this side's losing end, and how
+        # fast it does (the opponent's pull minus ours, whichever the side)
+        if player.side == "left":
+            margin = center + threshold - rope.pos
+        else:
+            margin = rope.pos - (center - threshold)
+        speed = opull - ppull
+        # first frame k (1-based) whose ai_act sees the rope past the threshold;
+        # the knot there is where k - 1 frames of pull have left it
+        if margin < 0:
+            losing = 1
+        elif speed <= 0:
+            losing = FOREVER
+        else:
+            losing = margin // speed + 2
+        # ai_act decrements the pause first: frames k < pause can't respond
+        return min(n, max(losing, player.ai_pause_timer, 1) - 1)
+
+    def advance(self, match, player, n):
+        if player.freeze_timer == 0 and player.ai_pause_timer > 0:
+            player.ai_pause_timer = max(0, player.ai_pause_timer - n)
+
+
+class ScriptedController(IdleController):
+    """Replays an input log of (tick, action) pairs; action is "pull", "clone" or "bomb"."""
+    def __init__(self, events):
+        self.events = {}
+        for tick, action in events:
+            self.events.setdefault(int(tick), []).append(action)
+        self.ticks = sorted(self.events)
+
+    def before_update(self, match, player, opponent):
+        for action in self.events.get(match.tick, ()):
+            if action == "pull":
+                player.press_pull()
+            elif action == "clone":
+                player.activate_clone()
+            elif action == "bomb":
+                if not player.bomb_used and player.freeze_timer == 0:
+                    match.spawn_bomb(player, opponent)
+
+    def quiet_ticks(self, match, player, opponent):
+        i = bisect.bisect_left(self.ticks, match.tick)
+        if i >= len(self.ticks):
+            return FOREVER
+        return self.ticks[i] - match.tick
+
+
+def _exact(value, delta, n):
+    """True when value + k*delta is exactly representable for every k <= n."""
+    den = max(float(value).as_integer_ratio()[1], float(delta).as_integer_ratio()[1])
+    return (abs(value) + abs(delta) * n) * den < 2 ** 53
+
+
+def _drain(stamina, drain, n):
+    if _exact(stamina, drain, n):
+        stamina = stamina - drain * n
+        if stamina < 0:
+            stamina = 0
+        return stamina
+    for _ in range(n):
+        stamina -= drain
+        if stamina < 0:
+            stamina = 0
+            if drain >= 0:
+                break
+    return stamina
+
+
+def _regen(stamina, regen, cap, n):
+    if _exact(stamina, regen, n):
+        stamina = stamina + regen * n
+        if stamina > cap:
+            stamina = cap
+        return stamina
+    for _ in range(n):
+        stamina += regen
+        if stamina > cap:
+            stamina = cap
+            if regen >= 0:
+                break
+    return stamina
+
+
+class Match:
+    """One headless round between two controllers (IdleController when None)."""
+    def __init__(self, left=None, right=None, width=800, height=480, seed=None, fast_forward=True):
+        self.width = width
+        self.height = height
+        self.rng = random.Random(seed)
+        self.fast_forward = fast_forward
+
+        # same layout as Game.__init__ so bomb flights and hitboxes match
+        left_margin = 100
+        self.left = PlayerState(left_margin, height // 2 + 20, "left")
+        self.right = PlayerState(0, height // 2 + 20, "right")
+        left_center = left_margin + (self.left.width // 2)
+        self.right.x = int((width - left_center) - (self.right.width // 2))
+        self.left.rng = self.rng
+        self.right.rng = self.rng
+
+        self.rope = RopeState(width, height)
+        self.rope.y = self.left.y
+
+        self.controllers = {
+            "left": left if left is not None else IdleController(),
+            "right": right if right is not None else IdleController(),
+        }
+
+        # Game.start()
+        self.left.begin_round()
+        self.right.begin_round()
+        for player in (self.left, self.right):
+            if isinstance(self.controllers[player.side], AIController):
+                player.ai_pause_timer = AI_START_PAUSE
+
+        self.projectiles = []
+        self.tick = 0
+        self.game_over = False
+        self.winner = None
+
+    @classmethod
+    def from_state(cls, state, left=None, right=None, seed=None, fast_forward=True):
+        """Continue a captured Game/Match state (see capture_state) headlessly."""
+        m = cls(left=left, right=right, width=state["width"], height=state["height"],
+                seed=seed, fast_forward=fast_forward)
+        m.rope.pos, m.rope.min_x, m.rope.max_x, m.rope.y = state["rope"]
+        for player, fields in ((m.left, state["left"]), (m.right, state["right"])):
+            for f, value in fields.items():
+                if value is not None or f == "ai_policy":
+                    setattr(player, f, value)
+        m.projectiles = [Bomb(x, y, vx, vy, gravity=g) for x, y, vx, vy, g in state["bombs"]]
+        m.game_over = state["game_over"]
+        m.winner = state["winner"]
+        return m
+
+    def spawn_bomb(self, thrower, target):
+        if thrower.bomb_used:
+            return
+        self.projectiles.append(launch_bomb(thrower, target, travel_time_frames=BOMB_TRAVEL_FRAMES))
+        thrower.bomb_used = True
+
+    def _check_win(self):
+        if self.rope.pos <= self.rope.min_x:
+            self.game_over = True
+            self.winner = "Left team"
+        elif self.rope.pos >= self.rope.max_x:
+            self.game_over = True
+            self.winner = "Right team"
+
+    def _update_projectiles(self):
+        for p in list(self.projectiles):
+            p.update()
+            if p.alive and not p.exploded:
+                target = self.right if p.vx > 0 else self.left
+                if p.hits(hitbox(target)):
+                    target.apply_bomb_hit(freeze_frames=BOMB_FREEZE_FRAMES)
+                    p.exploded = True
+                    p.alive = False
+            if not p.alive or p.offscreen(self.width, self.height):
+                self.projectiles.remove(p)
+
+    def step(self):
+        """Advance exactly one frame."""
+        left, right = self.left, self.right
+        lc, rc = self.controllers["left"], self.controllers["right"]
+        lc.before_update(self, left, right)
+        rc.before_update(self, right, left)
+        left.update()
+        right.update()
+        lc.after_update(self, left, right)
+        rc.after_update(self, right, left)
+        self.rope.apply_pull(left.pull, right.pull)
+        self._check_win()
+        self._update_projectiles()
+        self.tick += 1
+
+    # --- closed-form fast-forward ---
+
+    @staticmethod
+    def phase(player):
+        """Which branch of PlayerState.update the next frame takes."""
+        if player.freeze_timer > 0:
+            return "frozen"
+        if player.tap_timer > 0:
+            return "tap"
+        if player.ai_burst_timer > 0:
+            return "burst"
+        return "idle"
+
+    @staticmethod
+    def _segment(player):
+        """(frames the current branch and pull stay constant, pull during them)."""
+        phase = Match.phase(player)
+        if phase == "frozen":
+            return player.freeze_timer, 0
+        if phase == "idle":
+            return FOREVER, 0
+        left = player.tap_timer if phase == "tap" else player.ai_burst_timer
+        # the clone wears off inside update() before the pull is computed
+        ct = player.clone_timer
+        if ct >= 2:
+            left = min(left, ct - 1)
+            multiplier = 2
+        elif ct == 1:
+            multiplier = 1
+        else:
+            multiplier = 2 if player.clone_active else 1
+        return left, player.pull_strength * multiplier
+
+    def steady_ticks(self):
+        """Frames that advance() may cover in one go (0 when a frame must be stepped)."""
+        if self.game_over or self.projectiles:
+            return 0
+        left, right = self.left, self.right
+        n = min(self.controllers["left"].quiet_ticks(self, left, right),
+                self.controllers["right"].quiet_ticks(self, right, left))
+        ln, lpull = self._segment(left)
+        rn, rpull = self._segment(right)
+        n = min(n, ln, rn)
+        d = rpull - lpull
+        if d and n > 0:
+            rope = self.rope
+            if not _exact(rope.pos, d, min(n, rope.max_x - rope.min_x)):
+                return 0
+            gap = (rope.max_x - rope.pos) if d > 0 else (rope.pos - rope.min_x)
+            # first frame the knot reaches a bound (the win check ends the round there)
+            n = min(n, max(1, -(-gap // abs(d))))
+        return int(n)
+
+    def advance(self, n):
+        """Apply n steady frames in closed form. n must not exceed steady_ticks()."""
+        if n <= 0:
+            return
+        _, lpull = self._segment(self.left)
+        _, rpull = self._segment(self.right)
+        for player, pull in ((self.left, lpull), (self.right, rpull)):
+            self.controllers[player.side].advance(self, player, n)
+            phase = self.phase(player)
+
+            if player.clone_timer > 0:
+                if player.clone_timer - n <= 0:
+                    player.clone_timer = 0
+                    player.clone_active = False
+                else:
+                    player.clone_timer -= n
+            if player.clone_cooldown_timer > 0:
+                player.clone_cooldown_timer = max(0, player.clone_cooldown_timer - n)
+
+            if phase == "frozen":
+                f = player.freeze_timer
+                player.freeze_timer = f - n
+                player.tap_timer = 0
+                player.ai_burst_timer = 0
+                player.ai_pause_timer = max(player.ai_pause_timer, f - 1)
+                player.pull = 0
+            elif phase == "tap" or phase == "burst":
+                if phase == "tap":
+                    player.tap_timer -= n
+                else:
+                    player.ai_burst_timer -= n
+                player.pull = pull
+                player.stamina = _drain(player.stamina, player.stamina_drain, n)
+            else:
+                player.pull = 0
+                player.stamina = _regen(player.stamina, player.stamina_regen, player.max_stamina, n)
+
+        d = rpull - lpull
+        if d:
+            rope = self.rope
+            rope.pos = max(rope.min_x, min(rope.max_x, rope.pos + d * n))
+        self._check_win()
+        self.tick += n
+
+    def run(self, max_ticks=60 * 60 * 5):
+        """Play until someone wins or max_ticks frames have passed. Returns the winner."""
+        while not self.game_over and self.tick < max_ticks:
+            n = self.steady_ticks() if self.fast_forward else 0
+            if n > 1:
+                self.advance(min(n, max_ticks - self.tick))
+            else:
+                self.step()
+        return self.winner
+
+    def snapshot(self):
+        """Hashable view of the full simulation state (used to compare runs)."""
+        fields = ("pull", "stamina", "tap_timer", "ai_burst_timer", "ai_pause_timer",
+                  "clone_active", "clone_timer", "clone_used", "clone_cooldown_timer",
+                  "bomb_used", "freeze_timer")
+        players = tuple(tuple(getattr(p, f) for f in fields) for p in (self.left, self.right))
+        bombs = tuple((b.x, b.y, b.vx, b.vy) for b in self.projectiles)
+        return (self.tick, self.rope.pos, self.game_over, self.winner, players, bombs)
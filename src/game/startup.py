@@ -0,0 +1,97 @@
+"""Startup-time benchmark.
+
+Launches the game in fresh interpreters (cold imports every run) and reports
+the median of each phase:
+
+    import       pygame + the game package
+    display      mixer/pygame init and set_mode
+    first_frame  building the Game (loaders queued) until the first menu frame is flipped
+    assets       first frame until the background loader has finished everything
+    total        process start until the first frame, interpreter startup included
+
+Run from src/:  python -m game.startup --runs 5 --budget 1.5
+With --budget (or TUG_STARTUP_BUDGET) the exit status is 1 when the median
+total goes over it, so CI can track the cold-start target. --headless uses SDL's dummy video/audio drivers.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PHASES = ("import", "display", "first_frame", "assets", "total")
+# CI sets TUG_STARTUP_BUDGET (seconds) to fail the run when cold start regresses
+DEFAULT_BUDGET = float(os.environ["TUG_STARTUP_BUDGET"]) if os.environ.get("TUG_STARTUP_BUDGET") else None
+
+
+def probe():
+    """Runs inside the child interpreter; returns the phase times."""
+    t0 = time.perf_counter()
+    import pygame
+    import main as game_main
+    import game.core  # noqa: F401  (the import cost is part of what we measure)
+    t1 = time.perf_counter()
+    screen, view = game_main.init_display()
+    t2 = time.perf_counter()
+    game = game_main.build_game(screen, view)
+    game.run(max_frames=1)
+    t3 = time.perf_counter()
+    first_frame_at = time.time()
+    if getattr(game, "assets", None) is not None:
+        game.assets.wait()
+    t4 = time.perf_counter()
+    pygame.quit()
+    return {"import": t1 - t0, "display": t2 - t1, "first_frame": t3 - t2, "assets": t4 - t3,
+            "first_frame_at": first_frame_at}
+
+
+def run_once(headless=False):
+    """One cold start in a fresh interpreter (run from the repo root, like the game)."""
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    if headless:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+        env.setdefault("SDL_AUDIODRIVER", "dummy")
+    src = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+    env["PYTHONPATH"] = src + os.pathsep + env.get("PYTHONPATH", "")
+    code = "import json; from game.startup import probe; print('STARTUP ' + json.dumps(probe()))"
+    launched_at = time.time()
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                         cwd=os.path.dirname(src))
+    for line in out.stdout.splitlines():
+        if line.startswith("STARTUP "):
+            result = json.loads(line[len("STARTUP "):])
+            result["total"] = result.pop("first_frame_at") - launched_at
+            return result
+    raise RuntimeError(f"startup probe failed:\n{out.stderr[-2000:]}")
+
+
+def benchmark(runs=5, headless=False):
+    results = [run_once(headless) for _ in range(runs)]
+    return {k: statistics.median(r[k] for r in results) for k in PHASES}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start time of the game.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--headless", action="store_true", help="use SDL's dummy video/audio drivers")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="fail if the median total exceeds this many seconds (default: $TUG_STARTUP_BUDGET)")
+    parser.add_argument("--json", action="store_true", help="print the medians as JSON")
+    args = parser.parse_args(argv)
+
+    medians = benchmark(args.runs, args.headless)
+    if args.json:
+        print(json.dumps(medians))
+    else:
+        for k in PHASES:
+            print(f"[startup] {k:<12} {medians[k] * 1000:8.1f} ms")
+    if args.budget is not None and medians["total"] > args.budget:
+        print(f"[startup] FAIL: total {medians['total']:.3f}s over budget {args.budget:.3f}s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
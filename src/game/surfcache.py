@@ -0,0 +1,139 @@
+"""Persistent cache of converted (and scaled) surfaces as raw pixel blobs.
+
+A cache entry is the output of some build step - decode + convert_alpha, or
+that plus a smoothscale - stored as raw 32-bit pixels with a 16-byte header.
+Its file name hashes the entry key, the display pixel format and the
+contents of every source file, so editing anything under src/assets (or
+running on a display with a different format) simply misses and rebuilds;
+older blobs for the same key are deleted when the new one is written.
+
+A hit memory-maps the blob and wraps it with pygame.image.frombuffer, so no
+decode, convert or scale happens at all. Disable with TUG_SURFACE_CACHE=0,
+relocate with TUG_SURFACE_CACHE=/some/dir.
+"""
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+
+import pygame
+
+from game.eventlog import log
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets", ".cache"))
+
+_HEADER = struct.Struct("<4sII4s")     # magic, width, height, pixel layout
+_MAGIC = b"TUGS"
+
+# channel byte order of a 32-bit surface with these (R, G, B, A) masks
+_LAYOUTS = {
+    (0xFF0000, 0xFF00, 0xFF, 0xFF000000): "BGRA" if sys.byteorder == "little" else "ARGB",
+    (0xFF, 0xFF00, 0xFF0000, 0xFF000000): "RGBA" if sys.byteorder == "little" else "ABGR",
+}
+
+stats = {"hits": 0, "misses": 0, "uncached": 0}
+_digests = {}       # (path, mtime_ns, size) -> content hash, so each file is hashed once per run
+
+
+def cache_dir():
+    setting = os.environ.get("TUG_SURFACE_CACHE", "")
+    if setting == "0":
+        return None
+    return setting or DEFAULT_CACHE_DIR
+
+
+def display_format():
+    """Tag for the display's pixel format, or None when there is no display yet."""
+    surf = pygame.display.get_surface() if pygame.display.get_init() else None
+    if surf is None:
+        return None
+    return "%d-%x-%x-%x-%x" % ((surf.get_bitsize(),) + tuple(surf.get_masks()))
+
+
+def file_digest(path):
+    st = os.stat(path)
+    memo = (path, st.st_mtime_ns, st.st_size)
+    digest = _digests.get(memo)
+    if digest is None:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                h.update(block)
+        digest = _digests[memo] = h.hexdigest()
+    return digest
+
+
+def _entry_path(directory, key, sources, fmt):
+    h = hashlib.sha1(f"{CACHE_VERSION}|{key}|{fmt}".encode())
+    for src in sources:
+        h.update(file_digest(src).encode())
+    slug = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+    return os.path.join(directory, f"{slug}-{h.hexdigest()[:20]}.surf"), slug
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        # copy-on-write mapping: pages come straight from the page cache and a
+        # stray write to the surface can never reach the file
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    magic, w, h, layout = _HEADER.unpack_from(mm)
+    if magic != _MAGIC or len(mm) != _HEADER.size + w * h * 4:
+        raise ValueError("corrupt surface cache entry")
+    # the surface keeps a reference to the view (and the view to the mapping)
+    return pygame.image.frombuffer(memoryview(mm)[_HEADER.size:], (w, h), layout.decode())
+
+
+def _write(path, slug, surf):
+    layout = _LAYOUTS.get(tuple(surf.get_masks())) if surf.get_bitsize() == 32 else None
+    if layout is None:
+        return False
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, surf.get_width(), surf.get_height(), layout.encode()))
+        f.write(pygame.image.tobytes(surf, layout))
+    os.replace(tmp, path)
+    # drop blobs of older source versions / display formats for this key
+    stale = re.compile(re.escape(slug) + r"-[0-9a-f]{20}\.surf$")
+    for name in os.listdir(directory):
+        if stale.match(name) and os.path.join(directory, name) != path:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+    return True
+
+
+def cached(key, sources, build):
+    """Return the surface build() makes for key, from the disk cache when possible.
+
+    sources are the files the result depends on; build() must return a
+    display-converted Surface (or None, which isn't cached).
+    """
+    directory = cache_dir()
+    fmt = display_format()
+    if directory is None or fmt is None or not all(os.path.isfile(s) for s in sources):
+        stats["uncached"] += 1
+        return build()
+    path = slug = None
+    try:
+        path, slug = _entry_path(directory, key, sources, fmt)
+        if os.path.exists(path):
+            surf = _read(path)
+            stats["hits"] += 1
+            return surf
+    except Exception as e:
+        # unreadable or corrupt: rebuild (and overwrite it below)
+        log.warning("asset", "ignoring surface cache entry for %s: %s", key, e)
+    stats["misses"] += 1
+    surf = build()
+    if surf is not None and path is not None:
+        try:
+            _write(path, slug, surf)
+        except Exception as e:
+            log.warning("asset", "failed to store %s in the surface cache: %s", key, e)
+    return surf
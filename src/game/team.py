@@ -0,0 +1,287 @@
+"""Team matches: a squad of extra pullers behind each side's Player.
+
+The side's own Player (the leader: human, or the 1P AI) keeps its usual
+rules and controls. A Team is everyone else on that side, up to
+MAX_TEAM_SIZE - 1 members, kept as struct-of-arrays state so a tick is the
+same handful of NumPy operations whether the squad has 3 members or 63:
+
+  - the pull/tap/burst/clone/freeze rules of PlayerState.update, per member
+  - one shared team stamina pool: every pulling member drains it, every idle
+    member refills it, and nobody starts a new pull while it is empty
+  - AI members decide with game.batch_ai.BatchAI (the 1P AI's rules, one
+    seeded stream per member); a human leader's squad pulls when the leader
+    taps instead
+  - clones double a member's pull; bombs from members target anyone on the
+    other side (leader or squad), and Team.hit() freezes the member a bomb lands on
+
+The rope gets the squad's summed pull scaled by 1/size - the whole squad pulls
+like one more player - so a 63-member squad doesn't end a match in two frames
+and the win condition is unchanged.
+Drawing is one blit sequence per team (see Team.draw).
+"""
+import random
+
+import numpy as np
+
+from game.batch_ai import BatchAI, stream_key
+from game.player import PlayerState
+from game.projectile import launch_bomb
+from game.render import primitive
+
+MAX_TEAM_SIZE = 64      # pullers per side, leader included
+ROW_SIZE = 16           # members per formation row
+ROW_STEP = 6            # logical px each row stands further back (up)
+EDGE_MARGIN = 8         # keep the formation this far inside the canvas
+
+
+class Member:
+    """Position/size snapshot of one squad member (what launch_bomb and hitbox read)."""
+    def __init__(self, team, i):
+        self.side = team.side
+        self.x = int(team.x[i])
+        self.y = int(team.y[i])
+        self.width = team.width
+        self.height = team.height
+
+
+class Team:
+    def __init__(self, side, size, leader, width, seed=None):
+        """Squad of size members behind leader (a Player) on a canvas width logical px wide."""
+        n = max(0, min(int(size), MAX_TEAM_SIZE - 1))
+        self.side = side
+        self.size = n
+        self.leader = leader
+        self.width = leader.width
+        self.height = leader.height
+        # member rules: the canonical round rules every Player starts with
+        rules = PlayerState(0, 0, side)
+        rules.begin_round()
+        self.rules = rules
+        self.x, self.y = self._formation(n, width)
+
+        self.pull = np.zeros(n, dtype=np.int64)
+        self.tap_timer = np.zeros(n, dtype=np.int64)
+        self.burst_timer = np.zeros(n, dtype=np.int64)
+        self.pause_timer = np.zeros(n, dtype=np.int64)
+        self.clone_active = np.zeros(n, dtype=bool)
+        self.clone_timer = np.zeros(n, dtype=np.int64)
+        self.clone_used = np.zeros(n, dtype=bool)
+        self.clone_cooldown_timer = np.zeros(n, dtype=np.int64)
+        self.bomb_used = np.zeros(n, dtype=bool)
+        self.freeze_timer = np.zeros(n, dtype=np.int64)
+        self.max_stamina = float(rules.max_stamina) * n
+        self.stamina = self.max_stamina
+        self.rope_pull = 0      # this frame's pull on the rope (whole px)
+        self._carry = 0.0       # fraction of a px owed to the rope from earlier frames
+
+        # AI members (ai_enabled) or followers of the leader's taps
+        self.ai_enabled = True
+        self.rng = random.Random(seed)
+        # squad AI pulls towards the rope's center, RopeState.center on this canvas
+        self.ai = BatchAI([rules] * n, [stream_key(self.rng.getrandbits(64), k) for k in range(n)],
+                          rope_center=width // 2) if n else None
+        # shared game.particles.ParticleSystem (set by Game); None emits nothing
+        self.particles = None
+
+    def __len__(self):
+        return self.size
+
+    def _formation(self, n, width):
+        """Member feet positions: rows of ROW_SIZE behind the leader, front row first."""
+        leader = self.leader
+        cols = max(1, min(n, ROW_SIZE))
+        k = np.arange(n)
+        col, row = k % cols + 1, k // cols
+        if self.side == "left":
+            span = leader.x - EDGE_MARGIN
+            x = leader.x - col * (span / float(cols))
+        else:
+            span = width - EDGE_MARGIN - (leader.x + leader.width)
+            x = leader.x + col * (span / float(cols))
+        y = leader.y - row * ROW_STEP
+        return x.astype(np.int64), y.astype(np.int64)
+
+    def begin_round(self):
+        """Fresh round: clear timers, pulls and per-round specials, refill stamina."""
+        for arr in (self.pull, self.tap_timer, self.burst_timer, self.pause_timer, self.clone_timer,
+                    self.clone_cooldown_timer, self.freeze_timer):
+            arr[:] = 0
+        for arr in (self.clone_active, self.clone_used, self.bomb_used):
+            arr[:] = False
+        self.stamina = self.max_stamina
+        self.rope_pull = 0
+        self._carry = 0.0
+
+    def reset(self):
+        self.begin_round()
+
+    def total_pull(self):
+        """The squad's pull on the rope: members' summed pull / size, in whole px."""
+        return self.rope_pull
+
+    def press(self):
+        """Every member who can (not frozen, team not exhausted) starts a tap."""
+        if self.size and self.stamina > 0:
+            self.tap_timer[self.freeze_timer == 0] = self.rules.tap_duration
+
+    def step(self, rope_pos, opponent_pull):
+        """One frame: AI decisions, rule update, post-update specials.
+
+        Returns the indices of members that throw a bomb this frame (for
+        launch_bombs); clones are activated here.
+        """
+        n = self.size
+        if not n:
+            return ()
+        decision = None
+        if self.ai_enabled:
+            decision = self.ai.decide({
+                "rope_pos": np.full(n, rope_pos, dtype=np.float64),
+                "opponent_pull": np.full(n, opponent_pull, dtype=np.float64),
+                "freeze": self.freeze_timer, "pause": self.pause_timer, "burst": self.burst_timer,
+                "cooldown": self.clone_cooldown_timer, "clone_used": self.clone_used,
+                "clone_active": self.clone_active, "bomb_used": self.bomb_used,
+            })
+            free = ~decision["frozen"]
+            # an exhausted team can't start new bursts
+            burst = decision["burst"] if self.stamina > 0 else self.burst_timer
+            self.burst_timer = np.where(free, burst, self.burst_timer)
+            self.pause_timer = np.where(free, decision["pause"], self.pause_timer)
+        self._update_rules()
+        if decision is None:
+            return ()
+        clone = np.flatnonzero(decision["clone"] & ~self.clone_used)
+        if len(clone):
+            self.activate_clone(clone)
+        bomb = decision["bomb"] & ~self.bomb_used & (self.freeze_timer == 0)
+        return np.flatnonzero(bomb).tolist()
+
+    def _update_rules(self):
+        """PlayerState.update for every member at once, with the team stamina pool."""
+        rules = self.rules
+        clone_running = self.clone_timer > 0
+        self.clone_timer[clone_running] -= 1
+        self.clone_active[clone_running & (self.clone_timer <= 0)] = False
+        self.clone_cooldown_timer[self.clone_cooldown_timer > 0] -= 1
+
+        frozen = self.freeze_timer > 0
+        self.freeze_timer[frozen] -= 1
+        self.tap_timer[frozen] = 0
+        self.burst_timer[frozen] = 0
+        self.pause_timer = np.where(frozen, np.maximum(self.pause_timer, self.freeze_timer), self.pause_timer)
+
+        tapping = ~frozen & (self.tap_timer > 0)
+        self.tap_timer[tapping] -= 1
+        bursting = ~frozen & ~tapping & (self.burst_timer > 0)
+        self.burst_timer[bursting] -= 1
+        pulling = tapping | bursting
+        self.pull = np.where(pulling, rules.pull_strength * (1 + self.clone_active), 0)
+        # fractions carry over so a few pulling members still move the rope
+        self._carry += int(self.pull.sum()) / float(self.size)
+        self.rope_pull = int(self._carry)
+        self._carry -= self.rope_pull
+
+        active = int(np.count_nonzero(pulling))
+        idle = self.size - active - int(np.count_nonzero(frozen))
+        stamina = max(0.0, self.stamina - rules.stamina_drain * active)
+        self.stamina = min(self.max_stamina, stamina + rules.stamina_regen * idle)
+
+    def activate_clone(self, members):
+        """Clone the given members (index array) for rules.clone_duration frames."""
+        rules = self.rules
+        members = np.asarray(members)
+        members = members[~self.clone_used[members] & ~self.clone_active[members]]
+        self.clone_active[members] = True
+        self.clone_timer[members] = rules.clone_duration
+        self.clone_used[members] = True
+        self.clone_cooldown_timer[members] = rules.clone_cooldown
+        if self.particles is not None:
+            for i in members.tolist():
+                self.particles.burst("clone", self._clone_x(i), int(self.y[i]), 0.5)
+        return len(members)
+
+    def _clone_x(self, i):
+        # same offset as Player.clone_x
+        offset_x = int(self.width * 0.8)
+        if self.side == "left":
+            return int(self.x[i]) + self.width // 2 + offset_x - 2
+        return int(self.x[i]) + self.width // 2 - offset_x + 2
+
+    def launch_bombs(self, throwers, targets, travel_time_frames=60):
+        """Bombs from the given members, each aimed at a random player-like in targets."""
+        bombs = []
+        for i in throwers:
+            if self.bomb_used[i]:
+                continue
+            self.bomb_used[i] = True
+            target = targets[self.rng.randrange(len(targets))]
+            bombs.append(launch_bomb(Member(self, i), target, travel_time_frames=travel_time_frames))
+        return bombs
+
+    def members(self):
+        """Member snapshots, front to back (bomb targets for the other side)."""
+        return [Member(self, i) for i in range(self.size)]
+
+    def hit(self, rect, freeze_frames=120, motion=(0.0, 0.0)):
+        """Freeze the front-most unfrozen member whose hitbox touches rect; its index or -1.
+
+        motion is how far rect moved this step (Bomb.motion): members it
+        touched on the way count too, as in projectile.swept_hit.
+        """
+        if not self.size:
+            return -1
+        x, y = self.x, self.y
+        touching = self.freeze_timer == 0
+        enter = np.full(self.size, -np.inf)
+        leave = np.full(self.size, np.inf)
+        for lo, hi, d in ((x - rect.right, x + self.width - rect.left, motion[0]),
+                          (y - self.height - rect.bottom, y - rect.top, motion[1])):
+            if d == 0:
+                touching = touching & (lo < 0) & (hi > 0)
+                continue
+            a, b = 1 + lo / d, 1 + hi / d
+            enter = np.maximum(enter, np.minimum(a, b))
+            leave = np.minimum(leave, np.maximum(a, b))
+        touching = touching & (enter < 1) & (leave > 0) & (enter < leave)
+        hits = np.flatnonzero(touching)
+        if not len(hits):
+            return -1
+        i = int(hits[0])
+        self.freeze_timer[i] = freeze_frames
+        if self.particles is not None:
+            self.particles.burst("explosion", int(x[i]) + self.width / 2, int(y[i]) + self.height / 2 - 30, 0.5)
+        return i
+
+    def draw(self, surface):
+        # surface is a Surface or a game.render.RenderQueue; back rows first
+        n = self.size
+        if not n:
+            return
+        leader = self.leader
+        view = leader.view
+        push = leader.push_img or leader.pull_img
+        pull = leader.pull_img or leader.push_img
+        order = slice(None, None, -1)
+        if push is None:
+            color = (180, 60, 60) if self.side == "left" else (60, 90, 180)
+            rects = [view.rect(x, y - self.height // 2, self.width, self.height)
+                     for x, y in zip(self.x[order].tolist(), self.y[order].tolist())]
+            primitive(surface, _fill_rects, color, rects)
+            return
+        scale = view.drawing_scale
+        ox, oy = (0, 0) if view.mode == "canvas" else (view.ox, view.oy)
+        w, h = push.get_size()
+        cx = ox + np.rint((self.x + self.width // 2) * scale).astype(np.int64) - w // 2
+        cy = oy + np.rint(self.y * scale).astype(np.int64) - h // 2
+        pulling = (self.pull > 0)[order].tolist()
+        seq = [(pull if p else push, xy) for p, xy in zip(pulling, zip(cx[order].tolist(), cy[order].tolist()))]
+        for i in np.flatnonzero(self.clone_active)[::-1].tolist():
+            img = pull if self.pull[i] > 0 else push
+            x, y = view.pt(self._clone_x(i), int(self.y[i]))
+            seq.append((leader._clone_image(img), (x - w // 2, y - h // 2)))
+        surface.blits(seq, doreturn=False)
+
+
+def _fill_rects(surface, color, rects):
+    for rect in rects:
+        surface.fill(color, rect)
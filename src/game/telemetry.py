@@ -0,0 +1,313 @@
+"""Per-tick match telemetry: a preallocated ring of column buffers, written behind.
+
+Game.run calls record(game) once per gameplay frame and event(...) for bomb
+spawns and impacts. Both only store scalars into preallocated NumPy columns
+(a few microseconds, no allocation, no locks on the fast path). When a
+chunk fills up it is handed to a writer thread, which saves it as one
+compressed columnar .npz file and returns the buffer to the ring.
+
+If the writer falls behind and every buffer is waiting to be written, new
+samples are dropped (and counted in `dropped`) until a buffer comes back;
+the game never waits on the disk.
+
+Chunks are not per match: a "match" column numbers the matches of a writer
+session and a MATCH_END event records each winner. Layout:
+<dir>/<YYYY-MM-DD>/<session>-<chunk>.npz. load_day() reads a day back as
+one set of concatenated columns with the matches renumbered day-wide:
+
+    cols = load_day("telemetry")          # today
+    cols["rope_pos"][cols["match"] == 3]
+
+Run from src/:  python -m game.telemetry --dir /tmp/tel --bench 500   (write + load throughput)
+"""
+import argparse
+import atexit
+import concurrent.futures
+import datetime
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from game.eventlog import log
+
+CHUNK_TICKS = 16384     # ticks per chunk file (~4.5 min of play at 60 fps)
+BUFFERS = 4             # chunk buffers in the ring
+EVENT_CAPACITY = 1024   # events per chunk; extra ones are dropped
+
+# per-tick columns
+COLUMNS = {
+    "match": np.uint32,
+    "tick": np.uint32,
+    "rope_pos": np.float32,
+    "left_pull": np.int16,
+    "right_pull": np.int16,
+    "left_team_pull": np.int16,
+    "right_team_pull": np.int16,
+    "left_stamina": np.float32,
+    "right_stamina": np.float32,
+    "left_flags": np.uint8,
+    "right_flags": np.uint8,
+}
+# per-event columns (stored in the same chunk file with an "event_" prefix)
+EVENT_COLUMNS = {
+    "match": np.uint32,
+    "tick": np.uint32,
+    "kind": np.uint8,
+    "side": np.uint8,
+    "x": np.float32,
+    "y": np.float32,
+}
+
+# bits of left_flags / right_flags
+FROZEN, CLONE_ACTIVE, CLONE_USED, BOMB_USED = 1, 2, 4, 8
+# event kinds; a MATCH_END's side is the winner (NO_SIDE for none)
+BOMB_SPAWN, BOMB_IMPACT, MATCH_END = 1, 2, 3
+SIDES = {"left": 0, "right": 1, "Left team": 0, "Right team": 1}
+NO_SIDE = 255
+
+
+def player_flags(p):
+    return ((FROZEN if p.freeze_timer > 0 else 0) | (CLONE_ACTIVE if p.clone_active else 0)
+            | (CLONE_USED if p.clone_used else 0) | (BOMB_USED if p.bomb_used else 0))
+
+
+class _Chunk:
+    """One ring slot: preallocated tick and event columns."""
+    def __init__(self, ticks, events):
+        self.cols = {k: np.zeros(ticks, dtype=t) for k, t in COLUMNS.items()}
+        self.events = {k: np.zeros(events, dtype=t) for k, t in EVENT_COLUMNS.items()}
+        self.n = 0
+        self.n_events = 0
+        self.day = None
+        self.index = 0
+
+
+class TelemetryWriter:
+    def __init__(self, directory, chunk_ticks=CHUNK_TICKS, buffers=BUFFERS, event_capacity=EVENT_CAPACITY):
+        self.directory = directory
+        self.chunk_ticks = chunk_ticks
+        self._free = queue.Queue()
+        for _ in range(max(2, buffers)):
+            self._free.put(_Chunk(chunk_ticks, event_capacity))
+        self._full = queue.Queue()
+        self._chunk = None
+        self.session = f"{datetime.datetime.now():%H%M%S}-{os.getpid()}"
+        self._chunk_index = 0
+        self.match = -1             # match number within the session; -1 before the first
+        self._in_match = False
+        self._tick = 0
+        self.dropped = 0            # ticks lost to backpressure
+        self.dropped_events = 0
+        self.written = 0            # chunk files written
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+        # flush what's buffered when the game exits through sys.exit()
+        atexit.register(self.close)
+
+    # -- game thread -------------------------------------------------------
+
+    def begin_match(self):
+        """Start recording a new match (its ticks count from 0)."""
+        self.end_match()
+        self.match += 1
+        self._in_match = True
+        self._tick = 0
+
+    def end_match(self, winner=None):
+        """Record the result ("Left team" / "Right team" / None) and stop recording."""
+        if self._in_match:
+            self.event(MATCH_END, SIDES.get(winner, NO_SIDE))
+            self._in_match = False
+
+    def flush(self):
+        """Hand the partly filled chunk to the writer now."""
+        if self._chunk is not None and (self._chunk.n or self._chunk.n_events):
+            self._submit()
+
+    def _current(self):
+        chunk = self._chunk
+        if chunk is None:
+            try:
+                chunk = self._free.get_nowait()
+            except queue.Empty:
+                return None         # every buffer is queued for writing: drop
+            chunk.n = chunk.n_events = 0
+            chunk.day = f"{datetime.date.today():%Y-%m-%d}"
+            chunk.index = self._chunk_index
+            self._chunk_index += 1
+            self._chunk = chunk
+        return chunk
+
+    def _submit(self):
+        self._full.put(self._chunk)
+        self._chunk = None
+
+    def record(self, game):
+        """Store one tick of game (a Game or headless Match)."""
+        if not self._in_match:
+            return
+        tick = self._tick
+        self._tick += 1
+        chunk = self._current()
+        if chunk is None:
+            self.dropped += 1
+            return
+        i = chunk.n
+        c = chunk.cols
+        left, right = game.left, game.right
+        c["match"][i] = self.match
+        c["tick"][i] = tick
+        c["rope_pos"][i] = game.rope.pos
+        c["left_pull"][i] = left.pull
+        c["right_pull"][i] = right.pull
+        left_team = getattr(game, "left_team", None)
+        if left_team is not None:
+            c["left_team_pull"][i] = left_team.total_pull()
+            c["right_team_pull"][i] = game.right_team.total_pull()
+        else:
+            c["left_team_pull"][i] = c["right_team_pull"][i] = 0
+        c["left_stamina"][i] = left.stamina
+        c["right_stamina"][i] = right.stamina
+        c["left_flags"][i] = player_flags(left)
+        c["right_flags"][i] = player_flags(right)
+        chunk.n = i + 1
+        if chunk.n == self.chunk_ticks:
+            self._submit()
+
+    def event(self, kind, side, x=0.0, y=0.0):
+        """Store a BOMB_SPAWN / BOMB_IMPACT / MATCH_END event at the current tick."""
+        if not self._in_match:
+            return
+        chunk = self._current()
+        if chunk is None or chunk.n_events >= len(chunk.events["tick"]):
+            self.dropped_events += 1
+            return
+        j = chunk.n_events
+        e = chunk.events
+        e["match"][j] = self.match
+        e["tick"][j] = self._tick
+        e["kind"][j] = kind
+        e["side"][j] = SIDES.get(side, side)
+        e["x"][j] = x
+        e["y"][j] = y
+        chunk.n_events = j + 1
+
+    def close(self):
+        if self._closed:
+            return
+        self.end_match()
+        self.flush()
+        self._closed = True
+        self._full.put(None)
+        self._thread.join()
+
+    # -- writer thread -----------------------------------------------------
+
+    def _run(self):
+        while True:
+            chunk = self._full.get()
+            if chunk is None:
+                return
+            try:
+                self._write(chunk)
+            except Exception as e:
+                log.error("data", "telemetry: failed to write chunk %d: %s", chunk.index, e)
+            self._free.put(chunk)
+
+    def _write(self, chunk):
+        directory = os.path.join(self.directory, chunk.day)
+        os.makedirs(directory, exist_ok=True)
+        arrays = {k: v[:chunk.n] for k, v in chunk.cols.items()}
+        arrays.update({"event_" + k: v[:chunk.n_events] for k, v in chunk.events.items()})
+        path = os.path.join(directory, f"{self.session}-{chunk.index:05d}.npz")
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp, path)
+        self.written += 1
+
+
+def _read_chunk(path):
+    with np.load(path) as data:
+        return {k: data[k] for k in data.files}
+
+
+def load_day(directory, day=None, workers=4):
+    """All chunks of one day (default today) as concatenated columns.
+
+    Returns a dict with every tick column and every event_ column; "match"
+    and "event_match" are renumbered 0..M-1 across the day and "matches"
+    lists the (session, match number) each index came from.
+    """
+    day = day or f"{datetime.date.today():%Y-%m-%d}"
+    folder = os.path.join(directory, day)
+    try:
+        names = sorted(n for n in os.listdir(folder) if n.endswith(".npz"))
+    except FileNotFoundError:
+        names = []
+    # zlib releases the GIL, so chunks decompress in parallel
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        chunks = list(pool.map(_read_chunk, [os.path.join(folder, n) for n in names]))
+
+    sessions = sorted({n.rsplit("-", 1)[0] for n in names})
+    session_of = np.array([sessions.index(n.rsplit("-", 1)[0]) for n in names], dtype=np.int64)
+    out = {}
+    for k, dtype in list(COLUMNS.items()) + [("event_" + k, t) for k, t in EVENT_COLUMNS.items()]:
+        out[k] = np.concatenate([c[k] for c in chunks]) if chunks else np.zeros(0, dtype=dtype)
+
+    # (session, match number) -> one day-wide match index
+    keys = []
+    for key in ("match", "event_match"):
+        session = np.repeat(session_of, [len(c[key]) for c in chunks]) if chunks else np.zeros(0, dtype=np.int64)
+        keys.append((session << 32) | out[key].astype(np.int64))
+    uniq, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+    n = len(keys[0])
+    out["match"] = inverse[:n].astype(np.int32)
+    out["event_match"] = inverse[n:].astype(np.int32)
+    out["matches"] = [(sessions[k >> 32], k & 0xFFFFFFFF) for k in uniq.tolist()]
+    return out
+
+
+def main(argv=None):
+    from game.sim import Match, AIController
+    parser = argparse.ArgumentParser(description="Telemetry write/load throughput on headless AI matches.")
+    parser.add_argument("--dir", required=True, help="telemetry directory")
+    parser.add_argument("--bench", type=int, default=0, help="first record this many headless matches")
+    parser.add_argument("--day", default=None, help="day to load (YYYY-MM-DD, default today)")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        writer = TelemetryWriter(args.dir)
+        ticks = 0
+        record_t = 0.0
+        start = time.perf_counter()
+        for seed in range(args.bench):
+            m = Match(left=AIController(), right=AIController(), seed=seed)
+            writer.begin_match()
+            while not m.game_over and m.tick < 60 * 60 * 2:
+                m.step()
+                t0 = time.perf_counter()
+                writer.record(m)
+                record_t += time.perf_counter() - t0
+                ticks += 1
+            writer.end_match(m.winner)
+        writer.close()
+        elapsed = time.perf_counter() - start
+        print(f"[telemetry] {args.bench} matches, {ticks} ticks in {elapsed:.2f}s; "
+              f"record {record_t / max(1, ticks) * 1e6:.2f} us/tick, {writer.written} chunks, "
+              f"{writer.dropped} ticks dropped")
+
+    t0 = time.perf_counter()
+    cols = load_day(args.dir, args.day)
+    elapsed = time.perf_counter() - t0
+    n = len(cols["tick"])
+    print(f"[telemetry] loaded {len(cols['matches'])} matches, {n} ticks, {len(cols['event_tick'])} events "
+          f"in {elapsed:.2f}s ({n / max(elapsed, 1e-9) / 1e6:.1f} M ticks/s)")
+
+
+if __name__ == "__main__":
+    main()
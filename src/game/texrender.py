@@ -0,0 +1,170 @@
+"""Optional SDL2 Renderer/Texture backend (pygame._sdl2.video), picked with TUG_BACKEND=texture.
+
+TextureScreen stands in for the display Surface the Game draws on. It has
+the part of the Surface API the draw code uses (blit, blits, fill, get_size)
+plus primitive() for the pygame.draw calls that go through
+game.render.primitive, and turns all of it into Renderer calls:
+
+  - every Surface blitted is uploaded as a Texture the first time it's seen
+    and reused after that (kept in a WeakKeyDictionary, so the sprite bank
+    is uploaded once and per-frame text surfaces are dropped with their
+    Surface). A cached Surface must not be drawn into after it was blitted.
+  - per-surface alpha (the semi-transparent clone, the game-over overlay) is
+    texture alpha modulation, not a blended copy.
+  - the Viewport works as on the surface path (native mode): sprites are
+    loaded pre-scaled for the window and effect frames come scaled from the
+    EffectManager's cache, so each scale is uploaded once and every draw is
+    an unscaled copy. Letting the renderer scale a logical canvas instead
+    is free on a GPU but costs ~4x the surface path on SDL's software
+    renderer at 1920x1080.
+
+The renderer is whatever SDL picks (a GPU driver when one works), and SDL's
+software renderer otherwise or when asked for (TUG_BACKEND=texture-software).
+convert()/convert_alpha() need a display mode, so a hidden 1x1 pygame display
+is opened for the pixel format and the frames go to a separate SDL window.
+
+Compare with the surface path on the same scenes:
+    python -m game.capture --bench 600                      (from src/)
+    python -m game.capture --bench 600 --backend texture
+"""
+import weakref
+
+import pygame
+
+from game.eventlog import log
+
+BACKENDS = ("surface", "texture", "texture-software")
+BLEND = 1       # SDL_BLENDMODE_BLEND
+
+
+def _driver_index(name):
+    from pygame._sdl2.video import get_drivers
+    for i, info in enumerate(get_drivers()):
+        if info.name == name:
+            return i
+    return -1
+
+
+class TextureScreen:
+    def __init__(self, size, title="Tug Of War - Prototype", software=False, hidden=False):
+        from pygame._sdl2.video import Window, Renderer
+        self.size = (int(size[0]), int(size[1]))
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = Window(title, size=self.size, hidden=hidden)
+        if software:
+            self.renderer = Renderer(self.window, index=_driver_index("software"), accelerated=0)
+        else:
+            self.renderer = Renderer(self.window, accelerated=-1)
+        self._textures = weakref.WeakKeyDictionary()
+        self._circles = {}      # (color, radius) -> circle Texture
+        self.uploads = 0        # textures created so far
+
+    # -- Surface API used by the draw code --
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def texture(self, surf):
+        """The Texture for surf, uploaded on first use."""
+        tex = self._textures.get(surf)
+        if tex is None:
+            from pygame._sdl2.video import Texture
+            tex = Texture.from_surface(self.renderer, surf)
+            alpha = surf.get_alpha()
+            if alpha is not None and alpha < 255:
+                tex.alpha = alpha
+                tex.blend_mode = BLEND
+            self._textures[surf] = tex
+            self.uploads += 1
+        return tex
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        w, h = source.get_size()
+        x, y = dest[0], dest[1]
+        tex = self.texture(source)
+        if area is None:
+            tex.draw(None, (int(x), int(y), w, h))
+        else:
+            area = pygame.Rect(area)
+            tex.draw(area, (int(x), int(y), area.w, area.h))
+
+    def blits(self, blit_sequence, doreturn=True):
+        texture = self.texture
+        for item in blit_sequence:
+            source, dest = item[0], item[1]
+            w, h = source.get_size()
+            texture(source).draw(None, (int(dest[0]), int(dest[1]), w, h))
+
+    fblits = blits
+
+    def fill(self, color, rect=None, special_flags=0):
+        r = self.renderer
+        r.draw_color = pygame.Color(color)
+        if rect is None:
+            r.clear()
+        else:
+            r.fill_rect(pygame.Rect(rect))
+
+    def primitive(self, fn, color, *args):
+        """fn(self, color, *args) for a pygame.draw function, as Renderer calls."""
+        r = self.renderer
+        if fn is pygame.draw.rect:
+            rect, width = pygame.Rect(args[0]), (args[1] if len(args) > 1 else 0)
+            r.draw_color = pygame.Color(color)
+            if width:
+                r.draw_rect(rect)
+            else:
+                r.fill_rect(rect)
+        elif fn is pygame.draw.line:
+            (x0, y0), (x1, y1) = args[0], args[1]
+            width = args[2] if len(args) > 2 else 1
+            r.draw_color = pygame.Color(color)
+            if width > 1 and y0 == y1:
+                r.fill_rect((min(x0, x1), y0 - width // 2, abs(x1 - x0) + 1, width))
+            else:
+                r.draw_line((x0, y0), (x1, y1))
+        elif fn is pygame.draw.circle:
+            (cx, cy), radius = args[0], int(args[1])
+            key = (tuple(pygame.Color(color)), radius)
+            tex = self._circles.get(key)
+            if tex is None:
+                from pygame._sdl2.video import Texture
+                dot = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(dot, color, (radius, radius), radius)
+                tex = self._circles[key] = Texture.from_surface(self.renderer, dot)
+            tex.draw(None, (int(cx) - radius, int(cy) - radius, radius * 2, radius * 2))
+        else:
+            # helpers built on fill()/blit() (team._fill_rects) work on this as on a Surface
+            fn(self, color, *args)
+
+    # -- frame --
+
+    def present(self):
+        self.renderer.present()
+
+    def to_surface(self):
+        """The current frame as a Surface (read back from the renderer)."""
+        return self.renderer.to_surface()
+
+    def close(self):
+        self._textures.clear()
+        self._circles.clear()
+        self.window.destroy()
+
+
+def open_screen(backend, size, hidden=False):
+    """TextureScreen for the texture backends; None (use the surface path) if SDL2 rendering fails."""
+    try:
+        return TextureScreen(size, software=backend == "texture-software", hidden=hidden)
+    except Exception as e:
+        log.warning("game", "%s backend unavailable (%s); drawing with surfaces", backend, e)
+        # drop the hidden format display so set_mode opens a normal window
+        pygame.display.quit()
+        return None
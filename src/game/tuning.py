@@ -0,0 +1,239 @@
+"""AI parameter tuner: grid and evolutionary search on the headless engine.
+
+Every candidate is a dict of PlayerState AI attributes (see AI_DEFAULTS). It
+plays the right-hand AI slot (the one Game.run drives) against a set of
+reference bots in game.sim.Match, with matches spread over all cores. The
+measured win rates are turned into difficulty presets saved as JSON, which
+main.py can apply to the 1P opponent (TUG_AI_PRESET=easy|normal|hard).
+
+Run from src/:  python -m game.tuning grid --games 200
+                python -m game.tuning evolve --generations 10
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import random
+
+from game.sim import Match, AIController, ScriptedController
+
+# hand-picked values currently in PlayerState / Game.run
+AI_DEFAULTS = {
+    "ai_aggressiveness": 0.0,
+    "ai_respond_bias": (0.0, 0.0),
+    "ai_burst_frames": (1, 4),
+    "ai_pause_frames": (1, 6),
+    "ai_opportunistic_chance": 0.18,
+    "ai_clone_chance": 0.004,
+    "ai_bomb_chance": 0.002,
+}
+
+# search bounds: floats for chances, (lo, hi) ints for frame ranges
+AI_BOUNDS = {
+    "ai_aggressiveness": (0.0, 1.0),
+    "ai_respond_bias": (0.0, 1.0),
+    "ai_burst_frames": (1, 12),
+    "ai_pause_frames": (1, 12),
+    "ai_opportunistic_chance": (0.0, 0.6),
+    "ai_clone_chance": (0.0, 0.03),
+    "ai_bomb_chance": (0.0, 0.03),
+}
+
+DEFAULT_GRID = {
+    # respond chance = aggressiveness + bias (opponent idle, opponent pulling)
+    "ai_aggressiveness": [0.0, 0.3],
+    "ai_respond_bias": [(0.0, 0.0), (0.2, 0.4)],
+    "ai_burst_frames": [(1, 2), (1, 4), (2, 6), (4, 8)],
+    "ai_pause_frames": [(1, 3), (1, 6), (4, 10)],
+    "ai_opportunistic_chance": [0.05, 0.18, 0.35, 0.5],
+    "ai_clone_chance": [0.004, 0.015],
+    "ai_bomb_chance": [0.002, 0.01],
+}
+
+PRESET_TARGETS = {"easy": 0.25, "normal": 0.5, "hard": 0.8}
+
+DEFAULT_PRESETS_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "ai_presets.json")
+
+MAX_TICKS = 60 * 60 * 2  # 2 minutes of play; unfinished rounds count as draws
+
+
+def _tapper(interval):
+    # human-ish reference: re-press every `interval` frames, clone and bomb early
+    def make():
+        events = [(t, "pull") for t in range(0, MAX_TICKS, interval)]
+        events += [(90, "bomb"), (240, "clone")]
+        return ScriptedController(events)
+    return make
+
+
+# reference opponents (left side), by name
+REFERENCE_BOTS = {
+    "default-ai": AIController,
+    "masher": _tapper(6),     # holds the pull continuously
+    "tapper": _tapper(12),    # half duty cycle
+}
+
+
+def apply_ai_params(player, params):
+    """Copy AI parameters onto a PlayerState/Player (tuples for frame ranges)."""
+    for key, value in params.items():
+        if isinstance(value, list):
+            value = tuple(value)
+        setattr(player, key, value)
+
+
+def play_series(params, opponent, games, seed=0, max_ticks=MAX_TICKS):
+    """Play `games` matches of params (right) vs a reference bot (left)."""
+    make_opponent = REFERENCE_BOTS[opponent]
+    wins = losses = draws = 0
+    for g in range(games):
+        m = Match(left=make_opponent(), right=AIController(), seed=seed * 100003 + g)
+        apply_ai_params(m.right, params)
+        winner = m.run(max_ticks=max_ticks)
+        if winner == "Right team":
+            wins += 1
+        elif winner == "Left team":
+            losses += 1
+        else:
+            draws += 1
+    return {"wins": wins, "losses": losses, "draws": draws,
+            "win_rate": (wins + 0.5 * draws) / float(max(1, games))}
+
+
+def _evaluate_job(job):
+    index, params, opponents, games, seed = job
+    rates = {}
+    for name in opponents:
+        rates[name] = play_series(params, name, games, seed=seed)["win_rate"]
+    return index, rates
+
+
+def evaluate(candidates, opponents=None, games=100, seed=0, workers=None):
+    """Score candidates against reference bots in parallel.
+
+    Returns a list of {"params", "win_rates", "score"} in candidate order;
+    score is the mean win rate. The same seeds are used for every candidate
+    so differences come from the parameters, not the dice.
+    """
+    opponents = list(opponents or REFERENCE_BOTS)
+    jobs = [(i, params, opponents, games, seed) for i, params in enumerate(candidates)]
+    results = [None] * len(candidates)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        scored = map(_evaluate_job, jobs)
+        for index, rates in scored:
+            results[index] = rates
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for index, rates in pool.imap_unordered(_evaluate_job, jobs):
+                results[index] = rates
+    return [{"params": candidates[i], "win_rates": rates,
+             "score": sum(rates.values()) / len(rates)} for i, rates in enumerate(results)]
+
+
+def grid_candidates(grid=None):
+    """Every combination of the grid values, on top of AI_DEFAULTS."""
+    grid = grid or DEFAULT_GRID
+    keys = sorted(grid)
+    out = []
+    for values in itertools.product(*(grid[k] for k in keys)):
+        params = dict(AI_DEFAULTS)
+        params.update(zip(keys, values))
+        out.append(params)
+    return out
+
+
+def grid_search(grid=None, **kwargs):
+    return evaluate(grid_candidates(grid), **kwargs)
+
+
+def _mutate(params, rng, scale=0.2):
+    child = dict(params)
+    for key, (lo, hi) in AI_BOUNDS.items():
+        if rng.random() > 0.5:
+            continue
+        value = child[key]
+        if key.endswith("_frames"):
+            a, b = value
+            a = min(hi, max(lo, a + rng.choice((-1, 0, 1))))
+            b = min(hi, max(a, b + rng.choice((-1, 0, 1))))
+            child[key] = (a, b)
+        elif isinstance(value, tuple):
+            child[key] = tuple(min(hi, max(lo, v + rng.gauss(0, scale * (hi - lo)))) for v in value)
+        else:
+            child[key] = min(hi, max(lo, value + rng.gauss(0, scale * (hi - lo))))
+    return child
+
+
+def evolve(generations=10, population=16, elite=4, seed=0, log=print, **kwargs):
+    """(mu + lambda) search for the strongest parameters.
+
+    Returns every scored candidate seen, so presets can be picked across the
+    whole strength range rather than just the winner.
+    """
+    rng = random.Random(seed)
+    pop = [dict(AI_DEFAULTS)] + [_mutate(AI_DEFAULTS, rng, scale=0.5) for _ in range(population - 1)]
+    history = []
+    parents = []
+    for gen in range(generations):
+        scored = evaluate(pop, seed=seed, **kwargs)
+        history.extend(scored)
+        parents = sorted(parents + scored, key=lambda r: r["score"], reverse=True)[:elite]
+        if log:
+            log(f"[tune] generation {gen}: best={parents[0]['score']:.3f}")
+        pop = [_mutate(rng.choice(parents)["params"], rng) for _ in range(population)]
+    return history
+
+
+def make_presets(results, targets=None):
+    """Pick the candidate whose mean win rate is closest to each target."""
+    targets = targets or PRESET_TARGETS
+    presets = {}
+    for name, target in targets.items():
+        best = min(results, key=lambda r: abs(r["score"] - target))
+        presets[name] = {"params": best["params"], "win_rates": best["win_rates"], "score": best["score"]}
+    return presets
+
+
+def save_presets(presets, path=DEFAULT_PRESETS_PATH):
+    with open(path, "w") as f:
+        json.dump(presets, f, indent=2, sort_keys=True)
+
+
+def load_presets(path=DEFAULT_PRESETS_PATH):
+    """Return {name: {"params": ...}} or {} when no presets file exists."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tune the tug-of-war AI on the headless engine.")
+    parser.add_argument("mode", choices=("grid", "evolve"))
+    parser.add_argument("--games", type=int, default=100, help="matches per candidate per reference bot")
+    parser.add_argument("--generations", type=int, default=10)
+    parser.add_argument("--population", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=DEFAULT_PRESETS_PATH)
+    args = parser.parse_args(argv)
+
+    if args.mode == "grid":
+        results = grid_search(games=args.games, seed=args.seed, workers=args.workers)
+    else:
+        results = evolve(generations=args.generations, population=args.population,
+                         games=args.games, seed=args.seed, workers=args.workers)
+
+    presets = make_presets(results)
+    for name, preset in presets.items():
+        rates = ", ".join(f"{bot}={rate:.2f}" for bot, rate in sorted(preset["win_rates"].items()))
+        print(f"[tune] {name}: score={preset['score']:.3f} ({rates})")
+    save_presets(presets, args.out)
+    print(f"[tune] wrote {len(presets)} presets to {os.path.normpath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
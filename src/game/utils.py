@@ -1,15 +1,29 @@
 import os
 import pygame
 
+from game.eventlog import log
+
 ASSET_ROOT = os.path.join("src", "assets")
 
 # optional global bomb image; set to a Surface when available to avoid NameError
 _BOMB_IMG = None
 
-def init_audio():
+def init_audio(frequency=44100, size=-16, channels=2, buffer=512):
+    """Pre-init and init the mixer.
+
+    A smaller buffer means lower latency between a key press and its sound but
+    more risk of crackling on slow machines. Each setting can be overridden
+    with TUG_AUDIO_FREQ / TUG_AUDIO_SIZE / TUG_AUDIO_CHANNELS / TUG_AUDIO_BUFFER.
+    """
+    def _env(name, default):
+        try:
+            return int(os.environ.get(name, default))
+        except ValueError:
+            return default
     try:
         # safe pre-init and init
-        pygame.mixer.pre_init(44100, -16, 2, 512)
+        pygame.mixer.pre_init(_env("TUG_AUDIO_FREQ", frequency), _env("TUG_AUDIO_SIZE", size),
+                              _env("TUG_AUDIO_CHANNELS", channels), _env("TUG_AUDIO_BUFFER", buffer))
         pygame.mixer.init()
     except Exception:
         pass
@@ -48,35 +62,54 @@ def load_sound(filename):
     return None
 
 def load_music(filename):
-    """Return a file path for pygame.mixer.music.load or None."""
-    try:
-        path = os.path.join(ASSET_ROOT, "music", filename)
-        if os.path.exists(path):
-            return path
-        # also try src/assets/ (fallback)
-        path = os.path.join(ASSET_ROOT, filename)
-        if os.path.exists(path):
-            return path
-    except Exception:
-        pass
-    print(f"[load_music] File not found: {os.path.join(ASSET_ROOT, 'music', filename)}")
+    """Return a file path for a music track or None.
+
+    Looks in assets/music/ then assets/, both under ASSET_ROOT and next to this
+    package (so it also works when not run from the repo root).
+    """
+    pkg_assets = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets"))
+    for root in (ASSET_ROOT, pkg_assets):
+        for sub in ("music", ""):
+            path = os.path.join(root, sub, filename)
+            if os.path.exists(path):
+                return path
+    log.warning("audio", "music file not found: %s", os.path.join(ASSET_ROOT, "music", filename))
     return None
 
+def sprite_path(filename):
+    """Path of filename under src/assets/sprites."""
+    base_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets", "sprites"))
+    return os.path.join(base_dir, filename)
+
 def load_image(filename):
     """
     Load an image from the assets/sprites directory.
+    The converted surface is kept in the on-disk surface cache (game.surfcache).
     """
-    base_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets", "sprites"))
-    path = os.path.join(base_dir, filename)
-    print(f"[debug] Attempting to load image from: {path}")  # Debug the path
+    from game.surfcache import cached
+    path = sprite_path(filename)
     try:
-        img = pygame.image.load(path).convert_alpha()
-        print(f"[debug] Successfully loaded image: {filename}")
+        img = cached(f"img:{filename}", [path], lambda: pygame.image.load(path).convert_alpha())
+        log.debug("asset", "loaded image %s", path)
         return img
     except Exception as e:
-        print(f"[debug] Failed to load image {filename} from {path}: {e}")
+        # callers probe for optional images (sequence frames, fallbacks), so a miss is only debug
+        log.debug("asset", "no image %s: %s", path, e)
         return None
 
+def load_scaled(filename, size):
+    """load_image + smoothscale to size; the scaled result is cached on disk too."""
+    from game.surfcache import cached
+    def build():
+        img = load_image(filename)
+        if img is None:
+            return None
+        try:
+            return pygame.transform.smoothscale(img, size)
+        except Exception:
+            return pygame.transform.scale(img, size)
+    return cached(f"img:{filename}@{size[0]}x{size[1]}", [sprite_path(filename)], build)
+
 def play_sound(sound, volume=1.0):
     """Play a pygame Sound if available."""
     if sound is None:
@@ -89,19 +122,6 @@ def play_sound(sound, volume=1.0):
 
 # --- music helpers ---
 
-def load_music(filename):
-    """Load music file path for pygame.mixer.music."""
-    try:
-        path = os.path.join("src", "assets", "music", filename)
-        if os.path.exists(path):
-            return path  # return path for pygame.mixer.music
-        else:
-            print(f"[load_music] File not found: {path}")
-            return None
-    except Exception as e:
-        print(f"[load_music] Error loading {filename}: {e}")
-        return None
-
 def play_music(path, loops=-1, volume=0.6):
     """Play background music from a file path (uses pygame.mixer.music)."""
     if path is None:
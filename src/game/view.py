@@ -0,0 +1,106 @@
+"""Logical-to-physical screen mapping.
+
+The game's rules and layout are all in logical pixels (800x480 by default).
+A Viewport maps that canvas onto the physical display: a uniform scale plus a
+letterbox offset. Two ways to use it:
+
+  native  (default)  sprites are loaded pre-scaled for the physical size (and
+                     cached that way by game.surfcache); draw code converts its
+                     logical positions with pt()/rect()/px() and blits once.
+  canvas             draw at logical size onto an offscreen surface and scale
+                     that to the display once per frame (present()).
+
+At 800x480 both are the identity and cost nothing.
+"""
+import os
+
+import pygame
+
+from game.eventlog import log
+
+LOGICAL_SIZE = (800, 480)
+
+
+class Viewport:
+    def __init__(self, physical=LOGICAL_SIZE, logical=LOGICAL_SIZE, mode="native"):
+        self.logical = (int(logical[0]), int(logical[1]))
+        self.physical = (int(physical[0]), int(physical[1]))
+        lw, lh = self.logical
+        pw, ph = self.physical
+        self.mode = mode
+        self.scale = min(pw / float(lw), ph / float(lh))
+        # letterbox: center the scaled canvas on the display
+        self.size_px = (int(round(lw * self.scale)), int(round(lh * self.scale)))
+        self.ox = (pw - self.size_px[0]) // 2
+        self.oy = (ph - self.size_px[1]) // 2
+        self.identity = self.scale == 1.0 and (self.ox, self.oy) == (0, 0)
+
+    @property
+    def drawing_scale(self):
+        """Scale draw code applies: 1.0 in canvas mode (the canvas is scaled afterwards)."""
+        return 1.0 if self.mode == "canvas" else self.scale
+
+    def px(self, v):
+        """Length in logical pixels -> physical pixels."""
+        return int(round(v * self.drawing_scale))
+
+    def size(self, w, h):
+        return (max(1, self.px(w)), max(1, self.px(h)))
+
+    def pt(self, x, y):
+        """Point in logical coordinates -> where to draw it."""
+        if self.mode == "canvas":
+            return (int(x), int(y))
+        return (self.ox + int(round(x * self.scale)), self.oy + int(round(y * self.scale)))
+
+    def rect(self, x, y, w, h):
+        left, top = self.pt(x, y)
+        return pygame.Rect(left, top, self.px(w), self.px(h))
+
+    def clear_bars(self, surface, color=(0, 0, 0)):
+        """Black out the letterbox margins (native mode draws straight onto the display)."""
+        if self.mode == "canvas" or (self.ox, self.oy) == (0, 0):
+            return
+        w, h = self.physical
+        cw, ch = self.size_px
+        if self.ox:
+            surface.fill(color, (0, 0, self.ox, h))
+            surface.fill(color, (self.ox + cw, 0, w - self.ox - cw, h))
+        if self.oy:
+            surface.fill(color, (0, 0, w, self.oy))
+            surface.fill(color, (0, self.oy + ch, w, h - self.oy - ch))
+
+    def target(self, display):
+        """Surface the game should draw on for this display."""
+        if self.mode == "canvas" and not self.identity:
+            return pygame.Surface(self.logical).convert(display)
+        return display
+
+    def present(self, surface, display):
+        """Canvas mode: scale the finished logical frame onto the display (once per frame)."""
+        if surface is display:
+            return
+        dest = display.subsurface(pygame.Rect((self.ox, self.oy), self.size_px))
+        if self.scale == int(self.scale):
+            pygame.transform.scale(surface, self.size_px, dest)
+        else:
+            pygame.transform.smoothscale(surface, self.size_px, dest)
+
+
+def from_env(logical=LOGICAL_SIZE):
+    """Viewport for TUG_DISPLAY ("WxH" or "desktop") and TUG_RENDER ("native" or "canvas")."""
+    mode = os.environ.get("TUG_RENDER", "native")
+    setting = os.environ.get("TUG_DISPLAY", "")
+    physical = logical
+    if setting == "desktop":
+        try:
+            physical = pygame.display.get_desktop_sizes()[0]
+        except Exception:
+            physical = logical
+    elif "x" in setting:
+        try:
+            w, h = setting.lower().split("x")
+            physical = (int(w), int(h))
+        except ValueError:
+            log.warning("game", "ignoring TUG_DISPLAY=%r; expected WxH or desktop", setting)
+    return Viewport(physical, logical, mode=mode)
@@ -0,0 +1,138 @@
+"""Monte Carlo win-probability estimate for a live match, computed off the render thread.
+
+The game loop hands WinProbability a snapshot every few frames with
+submit(); that only copies the rules state (game.sim.capture_state) and
+never blocks. A coordinator thread farms rollouts of the latest snapshot out
+to worker processes (so the GIL never stalls Game.run), folds results in as
+they arrive and publishes a running estimate. When a newer snapshot comes in
+the pending rollouts of the old one are cancelled and their results dropped.
+
+Rollouts play both sides with the existing AI rules (AIController, pulling
+toward the rope's center); the left side uses the left-hand ai_act rules as
+a stand-in for the human, so an even position comes out near 0.5.
+"""
+import concurrent.futures
+import multiprocessing
+import random
+import threading
+import time
+
+from game.sim import Match, AIController, capture_state
+
+ROLLOUTS = 2000          # target rollouts per snapshot
+CHUNK = 8                # rollouts per worker job (small so partial results land quickly)
+HORIZON = 60 * 20        # frames per rollout before scoring by rope position
+
+
+def _rollout_chunk(state, n, seed, horizon):
+    """Play n rollouts of state; returns the summed left-side score."""
+    total = 0.0
+    for i in range(n):
+        m = Match.from_state(state, left=AIController(), right=AIController(), seed=seed + i)
+        winner = m.run(max_ticks=horizon)
+        if winner == "Left team":
+            total += 1.0
+        elif winner is None:
+            rope = m.rope
+            # unfinished: the closer the knot to min_x the better for the left
+            total += (rope.max_x - rope.pos) / float(max(1, rope.max_x - rope.min_x))
+    return total
+
+
+class WinProbability:
+    """Publishes (left_chance, rollouts, generation) for the latest submitted state."""
+    def __init__(self, rollouts=ROLLOUTS, chunk=CHUNK, horizon=HORIZON, workers=None, publish_hz=5.0):
+        self.rollouts = rollouts
+        self.chunk = chunk
+        self.horizon = horizon
+        self.publish_interval = 1.0 / publish_hz
+        # spawn so workers don't inherit the SDL/display state of the game process
+        ctx = multiprocessing.get_context("spawn")
+        workers = workers or max(1, (multiprocessing.cpu_count() or 2) - 1)
+        self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pending = None           # (generation, state) waiting to be picked up
+        self._generation = 0
+        self._closed = False
+        # published result, read by the HUD without locking (single tuple assignment)
+        self.estimate = None           # (left_chance, rollouts, generation)
+        self._thread = threading.Thread(target=self._run, name="winprob", daemon=True)
+        self._thread.start()
+
+    def submit(self, game):
+        """Queue a fresh snapshot of game; cheap and non-blocking."""
+        if getattr(game, "game_over", False):
+            return
+        state = capture_state(game)
+        with self._lock:
+            self._generation += 1
+            self._pending = (self._generation, state)
+        self._wake.set()
+
+    def left_chance(self):
+        est = self.estimate
+        return None if est is None else est[0]
+
+    def close(self):
+        """Stop the coordinator thread and the worker processes (waits for running rollout chunks)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._thread.join()
+        self._pool.shutdown(wait=True)
+
+    def _take_pending(self):
+        with self._lock:
+            job, self._pending = self._pending, None
+        return job
+
+    def _run(self):
+        rng = random.Random()
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            job = self._take_pending()
+            while job is not None and not self._closed:
+                job = self._estimate(job, rng)
+
+    def _estimate(self, job, rng):
+        """Roll out one snapshot until done or superseded; returns the newer job if any."""
+        generation, state = job
+        sizes = {}
+        try:
+            for start in range(0, self.rollouts, self.chunk):
+                n = min(self.chunk, self.rollouts - start)
+                sizes[self._pool.submit(_rollout_chunk, state, n, rng.getrandbits(32), self.horizon)] = n
+        except RuntimeError:
+            # pool shut down underneath us
+            return None
+        futures = set(sizes)
+        score = 0.0
+        done = 0
+        last_publish = 0.0
+        while futures:
+            finished, futures = concurrent.futures.wait(futures, timeout=self.publish_interval,
+                                                        return_when=concurrent.futures.FIRST_COMPLETED)
+            for f in finished:
+                try:
+                    score += f.result()
+                    done += sizes[f]
+                except Exception:
+                    pass
+            newer = self._take_pending()
+            if newer is not None or self._closed:
+                # stale: publish what we have, drop queued rollouts of this
+                # snapshot and start on the new one
+                for f in futures:
+                    f.cancel()
+                if done:
+                    self.estimate = (score / done, done, generation)
+                return newer
+            now = time.monotonic()
+            if done and (now - last_publish >= self.publish_interval or not futures):
+                self.estimate = (score / done, done, generation)
+                last_publish = now
+        return None
@@ -5,71 +5,141 @@ import os
 import warnings
 warnings.filterwarnings("ignore", message="iCCP: known incorrect sRGB profile")
 from game.utils import init_audio  # keep only init_audio here
+from game.eventlog import log, install_crash_dump
 
 WIDTH, HEIGHT = 800, 480
 
-def main():
+def init_display():
     # ensure mixer pre-init then init pygame
     init_audio()
     pygame.init()
 
+    # WIDTH x HEIGHT is the logical canvas; TUG_DISPLAY / TUG_RENDER pick the
+    # physical size and how it's mapped (see game.view)
+    from game.view import from_env, Viewport
+    view = from_env((WIDTH, HEIGHT))
+
+    # TUG_BACKEND=texture (or texture-software): draw through an SDL2 Renderer
+    # onto a window of the same size (see game.texrender)
+    backend = os.environ.get("TUG_BACKEND", "surface")
+    if backend != "surface":
+        from game.texrender import BACKENDS, open_screen
+        if backend not in BACKENDS:
+            log.warning("game", "ignoring TUG_BACKEND=%r; expected one of %s", backend, ", ".join(BACKENDS))
+        else:
+            screen = open_screen(backend, view.physical)
+            if screen is not None:
+                # no offscreen canvas to scale: the texture path always draws native
+                return screen, Viewport(view.physical, (WIDTH, HEIGHT))
+
     # Initialize the display early (must happen before convert_alpha())
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    display = pygame.display.set_mode(view.physical)
     pygame.display.set_caption("Tug Of War - Prototype")
+    return view.target(display), view
 
-    # import modules that may load images/assets now that display exists
+def build_game(screen, view=None):
+    """Create the Game with its loaders and optional features; assets load in the background."""
+    # importing the game package has no side effects; assets load lazily below
     from game.core import Game
-    from game.utils import load_sound, load_music, load_image
+    from game.audio import SoundBank, MusicPlayer
+    from game.assets import AssetLoader, MENU
 
-    pull_sound = load_sound("pull.wav")
-    win_sound = load_sound("win.wav")
-    select_sound = load_sound("select.wav")
-    menu_music = load_music("menu.wav")
-    gameplay_music = load_music("gameplay.wav")
-    clone_sound = load_sound("clone-smoke.wav")
-    explosion_sound = load_sound("explosion.wav")  # Load explosion sound
+    # everything below is decoded on the loader thread: sounds and music first
+    # (the menu needs them), then the game queues its images with the menu
+    # background ahead of the gameplay sprites
+    assets = AssetLoader()
+    sounds = SoundBank()
+    music = MusicPlayer.for_bank(sounds)
+    assets.add("sounds", sounds.load, priority=MENU)
+    # music is crossfaded on the bank's music channels (per-track target volumes 0.0 .. 1.0)
+    assets.add("music", music.load_all, {
+        "menu": ("menu.wav", 0.4),
+        "gameplay": ("gameplay.wav", 0.6),
+    }, priority=MENU)
 
-    # per-track target volumes (0.0 .. 1.0)
-    menu_volume = 0.4
-    gameplay_volume = 0.6
+    game = Game(screen, WIDTH, HEIGHT, ai=True, sounds=sounds, music=music, assets=assets, view=view)
+    assets.start()
 
-    try:
-        if menu_music:
-            if isinstance(menu_music, pygame.mixer.Sound):
-                menu_music.set_volume(menu_volume)
-            else:
-                pygame.mixer.music.set_volume(menu_volume)
-    except Exception:
-        pass
+    # optional tuned AI difficulty for the 1P opponent (presets from game.tuning)
+    preset_name = os.environ.get("TUG_AI_PRESET")
+    if preset_name:
+        from game.tuning import load_presets, apply_ai_params
+        preset = load_presets().get(preset_name)
+        if preset:
+            apply_ai_params(game.right, preset["params"])
+            game.ai_label = preset_name
+        else:
+            log.warning("ai", "AI preset %r not found; using default AI", preset_name)
+
+    # optional lookup-table policy for the 1P opponent (built by game.policy)
+    policy_path = os.environ.get("TUG_AI_POLICY")
+    if policy_path:
+        from game.policy import TablePolicy
+        try:
+            game.right.ai_policy = TablePolicy.load(policy_path)
+            game.ai_label = "policy"
+        except (OSError, ValueError) as e:
+            log.warning("ai", "failed to load AI policy %s: %s", policy_path, e)
 
-    if pull_sound:
-        pull_sound.set_volume(0.6)
-    if win_sound:
-        win_sound.set_volume(0.7)
-    if select_sound:
-        select_sound.set_volume(1.0)
-    if clone_sound:
-        clone_sound.set_volume(1.0)
-    if explosion_sound:
-        explosion_sound.set_volume(1.0)
-
-    game = Game(screen, WIDTH, HEIGHT, ai=True)
-    game.pull_sound = pull_sound
-    game.win_sound = win_sound
-    game.select_sound = select_sound
-    game.menu_music = menu_music
-    game.gameplay_music = gameplay_music
-    game.menu_volume = menu_volume
-    game.gameplay_volume = gameplay_volume
-    game.clone_sound = clone_sound
-    game.explosion_sound = explosion_sound
+    # optional live win-chance meter (Monte Carlo rollouts in worker processes)
+    if os.environ.get("TUG_WIN_METER"):
+        from game.winprob import WinProbability
+        game.win_meter = WinProbability()
+
+    # optional per-tick telemetry: compressed .npz chunks under TUG_TELEMETRY/<day>/
+    telemetry_dir = os.environ.get("TUG_TELEMETRY")
+    if telemetry_dir:
+        from game.telemetry import TelemetryWriter
+        game.telemetry = TelemetryWriter(telemetry_dir)
+
+    # optional match ledger + ratings (SQLite file at TUG_LEDGER)
+    ledger_path = os.environ.get("TUG_LEDGER")
+    if ledger_path:
+        from game.ledger import Ledger
+        try:
+            game.ledger = Ledger(ledger_path)
+        except Exception as e:
+            log.warning("data", "failed to open ledger %s: %s", ledger_path, e)
+
+    # optional replay recording: seeded rounds + input logs saved to TUG_REPLAYS (see game.replay)
+    replay_dir = os.environ.get("TUG_REPLAYS")
+    if replay_dir:
+        game.replays = replay_dir
+
+    # optional team match: TUG_TEAM_SIZE pullers per side (2 .. 64, leaders included)
+    team_size = os.environ.get("TUG_TEAM_SIZE")
+    if team_size:
+        try:
+            game.set_team_size(int(team_size))
+        except ValueError:
+            log.warning("game", "ignoring TUG_TEAM_SIZE=%r; expected a number", team_size)
+
+    # optional AI-vs-AI spectator mode for QA: TUG_SPECTATE=<speed> (1 .. 32 ticks per frame)
+    spectate = os.environ.get("TUG_SPECTATE")
+    if spectate:
+        try:
+            game.spectate(int(spectate))
+        except ValueError:
+            log.warning("game", "ignoring TUG_SPECTATE=%r; expected a speed like 8", spectate)
 
     try:
         game._set_music("menu")
     except Exception:
         pass
+    return game
 
-    game.run()
+def main():
+    # levels/echo/dump file from TUG_LOG, TUG_LOG_ECHO, TUG_LOG_FILE (see game.eventlog)
+    log.configure_from_env()
+    install_crash_dump()
+    screen, view = init_display()
+    game = build_game(screen, view)
+    try:
+        game.run()
+    finally:
+        # Game.run leaves through sys.exit(); stop the meter's thread and worker processes
+        if game.win_meter is not None:
+            game.win_meter.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,23 @@
+from game.assets import GAMEPLAY, MENU, AssetLoader
+
+
+def test_menu_assets_load_first():
+    loader = AssetLoader()
+    order = []
+    for name, prio in (("tiles", GAMEPLAY), ("font", MENU), ("music", GAMEPLAY), ("logo", MENU)):
+        loader.add(name, lambda n=name: order.append(n) or n.upper(), priority=prio)
+    assert loader.progress() == 0.0
+    assert loader.wait(timeout=5)
+    # priority first, then the order they were queued in
+    assert order == ["font", "logo", "tiles", "music"]
+    assert loader.take_finished() == order and loader.take_finished() == []
+    assert loader.get("logo") == "LOGO" and loader.progress() == 1.0
+
+
+def test_failed_jobs_finish_and_late_jobs_restart_the_worker():
+    loader = AssetLoader()
+    loader.add("broken", lambda: 1 / 0)
+    assert loader.wait("broken", timeout=5) and loader.get("broken", "x") is None
+    loader._thread.join(5)
+    loader.add("late", lambda: 42)
+    assert loader.wait("late", timeout=5) and loader.get("late") == 42
@@ -0,0 +1,85 @@
+from game import audio
+from game.audio import MusicPlayer, SoundBank
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sound = None
+        self.fading = None
+
+    def get_busy(self):
+        return self.sound is not None
+
+    def play(self, sound, loops=0, fade_ms=0):
+        self.sound, self.fading = sound, None
+
+    def fadeout(self, ms):
+        self.fading = ms
+
+    def stop(self):
+        self.sound = None
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+
+def test_full_category_steals_the_oldest_voice():
+    bank = SoundBank()
+    bank.sounds = {"pull": "tap", "explosion": "boom"}
+    bank.voices = {"pull": [FakeChannel() for _ in range(3)], "impact": [FakeChannel()]}
+    first, second, third = (bank.play("pull") for _ in range(3))
+    assert len({id(first), id(second), id(third)}) == 3
+    assert bank.play("pull") is first and bank.play("pull") is second
+    # taps never reach the impact voice
+    assert bank.play("explosion") is bank.voices["impact"][0]
+    second.stop()
+    assert bank.play("pull") is second
+    assert bank.play("missing") is None
+
+
+def test_music_crossfades_and_starts_late_tracks(monkeypatch):
+    monkeypatch.setattr(audio, "load_music", lambda filename: filename)
+    monkeypatch.setattr(audio.pygame.mixer, "Sound", lambda path: "track:" + path)
+    a, b = FakeChannel(), FakeChannel()
+    music = MusicPlayer([a, b], fade_ms=300)
+    music.load_all({"menu": ("menu.ogg", 0.5)})
+
+    music.play("menu")
+    on = b
+    assert on.sound == "track:menu.ogg" and on.volume == 0.5
+    music.play("menu")      # already current: no restart, no fade
+    assert on.fading is None
+
+    music.play("game")      # not loaded yet: fade out, start once it is
+    assert on.fading == 300 and music.current is None
+    music.load("game", "game.ogg")
+    assert music.current == "game" and a.sound == "track:game.ogg"
+
+
+def test_music_without_reserved_channels_survives_a_busy_mixer(monkeypatch):
+    free = []
+
+    class FakeSound:
+        def __init__(self, path):
+            self.path = path
+
+        def set_volume(self, volume):
+            pass
+
+        def play(self, loops=0, fade_ms=0):
+            # Sound.play() returns None when every channel is busy
+            return free.pop() if free else None
+
+    monkeypatch.setattr(audio, "load_music", lambda filename: filename)
+    monkeypatch.setattr(audio.pygame.mixer, "Sound", FakeSound)
+    music = MusicPlayer()
+    music.load_all({"menu": ("menu.ogg", 1.0), "game": ("game.ogg", 1.0)})
+    music.play("menu")
+    assert music.channels == [] and music.current is None
+
+    free.append(FakeChannel())
+    music.play("menu")
+    ch, = music.channels
+    assert music.current == "menu"
+    music.play("game")      # reuses the channel it got
+    assert ch.sound.path == "game.ogg" and music.current == "game"
@@ -0,0 +1,56 @@
+import itertools
+import random
+
+import numpy as np
+
+from game.batch_ai import BatchAI, MatchPool, stream_key
+from game.player import PlayerState
+from game.sim import Match
+
+CENTER = 400
+
+
+def _players():
+    # chances of 0 or 1 only, so ai_act and BatchAI must agree whatever their dice say
+    out = []
+    for side, offset, opp_pull, freeze, pause, aggr, opportunistic, wish in itertools.product(
+            ("left", "right"), (-50, 0, 50), (0, 3), (0, 5), (0, 2), (0.0, 1.0), (0.0, 1.0), (0.0, 1.0)):
+        p = PlayerState(0, 0, side)
+        p.rng = random.Random(0)
+        p.freeze_timer, p.ai_pause_timer = freeze, pause
+        p.ai_aggressiveness, p.ai_respond_bias = aggr, (0.0, 0.0)
+        p.ai_opportunistic_chance = opportunistic
+        p.ai_clone_wish = p.ai_bomb_wish = wish
+        p.ai_burst_frames, p.ai_pause_frames = (3, 3), (5, 5)
+        out.append((p, CENTER + offset, opp_pull))
+    return out
+
+
+def test_decisions_match_ai_act():
+    cases = _players()
+    players = [p for p, _, _ in cases]
+    ai = BatchAI(players, [stream_key(1, k) for k in range(len(players))], rope_center=CENTER)
+    obs = BatchAI.observe(players, [PlayerState(0, 0, "left")] * len(players), [pos for _, pos, _ in cases])
+    obs["opponent_pull"] = np.array([pull for _, _, pull in cases], dtype=np.float64)
+    d = ai.decide(obs)
+
+    for k, (p, pos, pull) in enumerate(cases):
+        p.ai_wants_clone = p.ai_wants_bomb = False
+        p.ai_act(pos, CENTER, opponent_pull=pull)
+        if p.freeze_timer:
+            assert d["frozen"][k]
+            continue
+        assert (d["burst"][k], d["pause"][k]) == (p.ai_burst_timer, p.ai_pause_timer), k
+        assert (d["wants_clone"][k], d["wants_bomb"][k]) == (p.ai_wants_clone, p.ai_wants_bomb), k
+    # both branches were exercised
+    assert d["burst"].min() == 0 and d["burst"].max() == 3
+
+
+def test_match_pool_is_reproducible_per_seed():
+    def run(seeds):
+        matches = [Match(seed=s) for s in seeds]
+        MatchPool(matches, ai_sides=("left", "right")).run(max_ticks=600)
+        return [m.snapshot() for m in matches]
+
+    # a match plays out the same alone or in a bigger batch
+    assert run([3, 7, 11])[1] == run([7])[0]
@@ -0,0 +1,78 @@
+import pytest
+
+from game.capture import FrameCapture, compare, save_golden
+
+def test_capture_is_a_view_and_reproducible(tmp_path):
+    cap = FrameCapture()
+    try:
+        px = cap.scene("gameplay")
+        golden = str(tmp_path / "gameplay.png")
+        save_golden(px, golden)
+        # the frame is the display's memory, not a copy
+        px[0, 0] = (1, 2, 3)
+        assert tuple(cap.display.get_at((0, 0)))[:3] == (1, 2, 3)
+        with pytest.raises(RuntimeError):
+            cap.step()
+        del px
+        # same seed, same frame
+        px = cap.scene("gameplay")
+        assert compare(px, golden) == 0
+        del px
+        assert compare(cap.scene("game_over"), golden) > 0
+    finally:
+        cap.close()
+
+
+def _spectate(speed, seed=5, ledger=None):
+    cap = FrameCapture()
+    try:
+        game = cap.game
+        game.ledger = ledger
+        game.spectate(speed)
+        game.spectate_hold = None
+        game.round_seed = seed
+        while not game.game_over and cap.frames < 20000:
+            cap.step()
+        return game.winner, game.match_ticks, cap.frames
+    finally:
+        cap.close()
+
+
+def test_spectator_speed_skips_frames_not_ticks():
+    winner, ticks, frames = _spectate(1)
+    assert winner is not None and frames == ticks
+    # same match, one drawn frame per 8 ticks
+    assert _spectate(8) == (winner, ticks, -(-ticks // 8))
+
+
+def test_texture_backend_matches_surface_menu(tmp_path):
+    cap = FrameCapture()
+    try:
+        golden = str(tmp_path / "menu.png")
+        save_golden(cap.scene("menu"), golden)
+    finally:
+        cap.close()
+    cap = FrameCapture(backend="texture-software")
+    try:
+        px = cap.scene("menu")
+        # same draw calls; only blending rounding may differ
+        assert compare(px, golden) < 0.001 * px.shape[0] * px.shape[1]
+        assert cap.texture.uploads > 0
+        del px
+    finally:
+        cap.close()
+
+
+def test_spectated_matches_are_won_by_both_sides():
+    # both AIs pull toward the rope's real center, so neither side wins them all
+    winners = {_spectate(32, seed)[0] for seed in range(8)}
+    assert {"Left team", "Right team"} <= winners
+
+
+def test_spectated_matches_stay_off_the_ledger(tmp_path):
+    from game.ledger import Ledger
+    ledger = Ledger(str(tmp_path / "ledger.db"))
+    assert _spectate(32, ledger=ledger)[0] is not None
+    ledger.flush()
+    assert ledger.recorded == 0 and not ledger.ratings.players
+    ledger.close()
@@ -0,0 +1,27 @@
+import pygame
+
+from game.effects import EffectManager
+
+def frames(n, size=(8, 8)):
+    return [pygame.Surface(size) for _ in range(n)]
+
+def test_effects_finish_and_free_their_slots():
+    fx = EffectManager(capacity=3)
+    short, long = frames(2), frames(5)
+    assert fx.spawn(short, 10, 10, frame_ms=10)
+    assert fx.spawn(long, 20, 20, frame_ms=10)
+    assert fx.spawn(short, 30, 30, frame_ms=10)
+    assert not fx.spawn(short, 40, 40)      # pool full
+    fx.update(10)
+    assert len(fx) == 3 and fx._slots[fx._live[0]].image is short[1]
+    fx.update(10)
+    # both short ones are done; the long one is on its third frame
+    assert len(fx) == 1 and fx._slots[fx._live[0]].image is long[2]
+    assert fx.spawn(short, 40, 40) and fx.spawn(short, 50, 50)
+
+def test_scaled_frames_are_made_once():
+    fx = EffectManager()
+    src = frames(3, (10, 20))
+    a = fx.scaled("smoke", src, 2.0)
+    assert a[0].get_size() == (20, 40)
+    assert fx.scaled("smoke", src, 2.0) is a
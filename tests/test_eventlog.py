@@ -0,0 +1,23 @@
+from game.eventlog import EventLog, INFO, parse_levels
+
+def test_eventlog_ring_keeps_newest_and_filters_levels(tmp_path):
+    log = EventLog(capacity=8, level=INFO, echo=None)
+    log.debug("asset", "dropped %d", 0)
+    for i in range(20):
+        log.info("frame", "frame %d", i)
+    events = log.events()
+    assert log.recorded == 20 and len(events) == 8
+    assert [e[4][0] for e in events] == list(range(12, 20))
+
+    # per-category override: only ai debug events are recorded
+    log.configure(*parse_levels("warning,ai=debug"), echo=None)
+    log.clear()
+    log.debug("asset", "no")
+    log.info("frame", "no")
+    log.debug("ai", "bomb at tick %d", 5)
+    log.warning("audio", "missing %s", "menu.wav")
+    path = log.dump(str(tmp_path / "events.log"))
+    lines = open(path).read().splitlines()
+    assert lines[1].split()[1:] == ["DEBUG", "ai", "bomb", "at", "tick", "5"]
+    assert lines[2].split()[1:] == ["WARNING", "audio", "missing", "menu.wav"]
+    assert len(lines) == 3
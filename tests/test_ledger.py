@@ -0,0 +1,49 @@
+from game.ledger import Ledger
+
+def test_ledger_rates_and_persists_results(tmp_path):
+    path = str(tmp_path / "ledger.db")
+    ledger = Ledger(path)
+    for _ in range(20):
+        ledger.record("player1", "ai:hard", "Left team", ticks=600, specials=(1, 0, 0, 1))
+    ledger.record("player1", "ai:hard", None)
+    ledger.close()
+
+    # a fresh ledger picks the ratings back up from the file
+    ledger = Ledger(path)
+    (name, rating, rd, games, wins), = ledger.leaderboard(kind="human")
+    assert (name, games, wins) == ("player1", 21, 20)
+    assert rating > ledger.leaderboard(kind="ai")[0][1]
+    assert len(ledger.history("ai:hard", limit=50)) == 21
+    ledger.close()
+
+
+def test_ledger_drops_self_matches(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.db"))
+    for _ in range(20):
+        ledger.record("ai:default", "ai:default", "Left team")
+    ledger.record("ai:default", "player1", "left")
+    ledger.flush()
+    rating, rd, games, wins = ledger.ratings.get("ai:default")[2:]
+    assert (games, wins) == (1, 1) and rating > 1500
+    assert len(ledger.history("ai:default")) == 1
+    ledger.close()
+
+
+def test_failed_write_leaves_ratings_untouched(tmp_path):
+    path = str(tmp_path / "ledger.db")
+    ledger = Ledger(path)
+    ledger.record("player1", "ai:hard", "left")
+    ledger.flush()
+    before = list(ledger.ratings.players["player1"])
+    # can't be bound to a column: the batch's transaction rolls back
+    ledger.record("player1", "player2", "left", specials=(object(), 0, 0, 0))
+    ledger.flush()
+    assert ledger.ratings.players["player1"] == before and "player2" not in ledger.ratings.players
+    ledger.record("player2", "player1", "left")
+    ledger.close()
+
+    ledger = Ledger(path)
+    assert [r[1:3] for r in ledger.history("player2")] == [(ledger.ratings.players["player2"][0],
+                                                            ledger.ratings.players["player1"][0])]
+    assert ledger.ratings.players["player1"][4] == 2
+    ledger.close()
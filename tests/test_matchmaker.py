@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+from game.ledger import Ledger
+from game.matchmaker import Matchmaker, MatchHost, MatchmakingServer, Ticket, pairing_cost, play_matches
+
+
+def test_pairs_nearest_and_widens_over_time():
+    mm = Matchmaker()
+    assert mm.join(Ticket(1, "a", 1500, 40), 0.0) is None
+    assert mm.join(Ticket(2, "far", 1900, 40), 0.0) is None
+    assert mm.join(Ticket(3, "laggy", 1510, 250), 0.0) is None
+    # close rating and ping: paired at once, oldest first
+    left, right = mm.join(Ticket(4, "b", 1530, 50), 1.0)
+    assert (left.name, right.name) == ("a", "b")
+    # the others only meet once their windows are wide enough
+    assert mm.expire(19.0) == []
+    (left, right), = mm.expire(20.0)
+    assert {left.name, right.name} == {"far", "laggy"} and len(mm) == 0
+    assert mm.leave(3) is None
+
+
+def test_server_queues_pairs_and_plays(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.db"))
+
+    async def session():
+        server = MatchmakingServer(MatchHost(workers=0), ledger, tick_s=0.01)
+        port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for tag, name, rating in (("1", "alice", 1540), ("2", "bob", None)):
+            msg = {"op": "join", "ticket": tag, "name": name, "latency": 30}
+            if rating is not None:
+                msg["rating"] = rating
+            writer.write(json.dumps(msg).encode() + b"\n")
+        replies = []
+        while sum(r["op"] == "result" for r in replies) < 2:
+            replies.append(json.loads(await reader.readline()))
+        writer.close()
+        await server.close()
+        return replies
+
+    replies = asyncio.run(session())
+    ledger.close()
+    matches = {r["ticket"]: r for r in replies if r["op"] == "match"}
+    # bob sent no rating: the ledger's START_RATING for a new name
+    assert matches["1"]["opponent"] == "bob" and matches["1"]["rating"] == 1500
+    assert matches["1"]["side"] == "left" and matches["2"]["rating"] == 1540
+    results = [r for r in replies if r["op"] == "result"]
+    assert results[0]["winner"] == results[1]["winner"]
+
+    # AI stand-ins played it: nothing about alice or bob to rate
+    ledger = Ledger(str(tmp_path / "ledger.db"))
+    assert ledger.history("alice") == []
+    ledger.close()
+
+
+def test_never_pairs_a_player_with_itself():
+    mm = Matchmaker()
+    assert mm.join(Ticket(1, "kiosk", 1500, 40), 0.0) is None
+    assert mm.join(Ticket(2, "kiosk", 1500, 40), 0.0) is None
+    assert mm.expire(60.0) == []
+    left, right = mm.join(Ticket(3, "bob", 1500, 40), 61.0)
+    assert (left.id, right.name) == (1, "bob") and len(mm) == 1
+
+
+def test_one_name_queued_many_times_keeps_one_ticket_per_bucket():
+    mm = Matchmaker()
+    for i in range(1000):
+        assert mm.join(Ticket(i, "kiosk", 1500, 40), 0.0) is None
+    # the later tickets wait behind the first, so a search sees one kiosk ticket
+    assert [len(b) for b in mm.buckets.values()] == [1] and len(mm) == 1000
+    assert mm.leave(5).id == 5
+    assert mm.join(Ticket(1000, "bob", 1510, 45), 1.0)[0].id == 0
+    assert mm.join(Ticket(1001, "eve", 1510, 45), 1.0)[0].id == 1
+    assert mm.leave(1) is None and mm.leave(999).id == 999 and len(mm) == 996
+
+
+def test_pairing_benchmark_pairs_every_join():
+    cost, pairs = pairing_cost(5000, joins=500)
+    assert pairs == 500 and cost < 0.01
+    cost, pairs = pairing_cost(5000, joins=500, names=["kiosk"] * 9 + ["bob"])
+    assert pairs > 250
+
+
+def test_host_matches_are_not_decided_by_side():
+    # the older ticket always plays left
+    winners = [w for w, _ in play_matches(range(20))]
+    assert "Left team" in winners and "Right team" in winners
@@ -0,0 +1,16 @@
+from game.particles import ParticleSystem
+
+def test_particles_expire_and_stay_packed():
+    ps = ParticleSystem(capacity=100, seed=0)
+    ps.emit("spark", 10, 10, 30, life=(5, 5))
+    ps.emit("smoke", 20, 20, 30, life=(50, 50))
+    for _ in range(6):
+        ps.update()
+    # the short-lived sparks are gone; the smoke moved down to the front slots
+    assert ps.count == 30
+    assert (ps.life[:30] > 0).all()
+
+def test_particles_drop_emits_past_capacity():
+    ps = ParticleSystem(capacity=50, seed=0)
+    assert ps.burst("explosion", 0, 0) == 50
+    assert ps.emit("spark", 0, 0, 10) == 0
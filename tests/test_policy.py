@@ -0,0 +1,18 @@
+from game.policy import IDLE, build_table
+from game.sim import Match, AIController
+from game.tuning import REFERENCE_BOTS, MAX_TICKS
+
+
+def test_built_table_beats_a_reference_bot():
+    policy = build_table(rollouts=1, horizon=150, workers=1, log=None)
+    # ties don't all fall back to idle
+    assert policy.table.count(IDLE) < len(policy.table) // 4
+    best = 0
+    for name in sorted(REFERENCE_BOTS):
+        wins = 0
+        for seed in range(10):
+            m = Match(left=REFERENCE_BOTS[name](), right=AIController(), seed=seed)
+            m.right.ai_policy = policy
+            wins += m.run(max_ticks=MAX_TICKS) == "Right team"
+        best = max(best, wins)
+    assert best > 5
@@ -0,0 +1,22 @@
+import pygame
+
+from game.projectile import Bomb, swept_hit
+
+
+def test_fast_bomb_cannot_jump_over_a_hitbox():
+    target = pygame.Rect(250, 300, 20, 120)
+    bomb = Bomb(0, 360, 100, 0, gravity=0)
+    hit = sampled = False
+    for _ in range(5):
+        bomb.update()
+        hit = hit or bomb.hits(target)
+        sampled = sampled or bomb.get_rect().colliderect(target)
+    assert hit and not sampled
+
+
+def test_swept_hit_at_rest_is_colliderect():
+    target = pygame.Rect(100, 100, 50, 50)
+    for box in (pygame.Rect(140, 140, 20, 20), pygame.Rect(150, 100, 20, 20), pygame.Rect(0, 0, 10, 10)):
+        assert (swept_hit(box, (0, 0), target) is not None) == box.colliderect(target)
+    # entered a quarter of the way into the step
+    assert swept_hit(pygame.Rect(120, 100, 10, 10), (40, 0), target) == 0.25
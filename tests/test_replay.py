@@ -0,0 +1,24 @@
+import os
+
+from game.capture import FrameCapture
+from game.replay import export, load_replay
+
+def test_recorded_round_plays_back_identically(tmp_path):
+    cap = FrameCapture()
+    game = cap.game
+    game.replays = str(tmp_path / "replays")
+    try:
+        cap.scene("gameplay", frames=0)
+        while not game.game_over:
+            cap.play(60)
+    finally:
+        cap.close()
+    name, = os.listdir(game.replays)
+    replay = load_replay(os.path.join(game.replays, name))
+    assert replay["left"] and replay["winner"] == game.winner
+
+    # last second of the round plus the game-over tail, encoded by one worker
+    out = str(tmp_path / "clip")
+    stats = export(replay, out, start=replay["ticks"] / 60.0 - 1, workers=1)
+    assert (stats["winner"], stats["ticks"]) == (replay["winner"], replay["ticks"])
+    assert len(os.listdir(out)) == stats["frames"] == 120
@@ -0,0 +1,34 @@
+from game.policy import BOMB, CLONE, IDLE, PULL_LONG, TABLE_SIZE
+from game.selfplay import DISCOUNT_FRAMES, QTable, Trainer, _episode_updates
+
+
+def test_qtable_means_and_greedy_table_respects_specials():
+    q = QTable(TABLE_SIZE)
+    q.merge([(0, PULL_LONG, 1.0), (0, PULL_LONG, 0.8), (0, CLONE, 1.0), (3, BOMB, 1.0)])
+    assert abs(q.q[0][PULL_LONG] - 0.9) < 1e-9 and q.n[0][PULL_LONG] == 2
+    table = q.greedy_table(Trainer(workers=1).probe).table
+    # cell 0 has neither special left: clone isn't allowed even though it scored best
+    assert table[0] == PULL_LONG and table[3] == BOMB
+
+
+def test_returns_discount_toward_the_start():
+    trace = [(0, IDLE)] * (DISCOUNT_FRAMES + 1)
+    updates = _episode_updates(trace, 1.0, 0.5)
+    assert updates[-1][2] == 1.0 and updates[0][2] == 0.5
+
+
+def test_training_is_seeded_and_checkpoints(tmp_path):
+    runs = []
+    for _ in range(2):
+        trainer = Trainer(workers=1, games_per_worker=2, seed=3)
+        rate = trainer.train_round()
+        assert 0.0 <= rate <= 1.0
+        runs.append(trainer)
+    assert runs[0].q.q == runs[1].q.q and any(runs[0].q.n[c] != [0] * 5 for c in range(runs[0].q.size))
+
+    path = str(tmp_path / "selfplay.ckpt")
+    runs[0].save(path)
+    resumed = Trainer(workers=1)
+    resumed.load(path)
+    assert resumed.round == 1 and resumed.seed == 3 and resumed.q.q == runs[0].q.q
+    assert resumed.policy().table == runs[0].policy().table
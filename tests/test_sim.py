@@ -0,0 +1,77 @@
+from game.sim import Match, AIController, ScriptedController
+
+
+def _play(fast_forward, left=None, right=None, seed=1, max_ticks=4000):
+    m = Match(left=left() if left else None, right=right() if right else None,
+              seed=seed, fast_forward=fast_forward)
+    m.run(max_ticks=max_ticks)
+    return m.snapshot(), m.rng.getstate()
+
+
+def test_idle_match_fast_forwards_to_the_tick_limit():
+    m = Match(seed=0)
+    m.left.stamina = 10.0
+    m.right.freeze_timer = 30
+    assert m.steady_ticks() > 1
+    m.run(max_ticks=1000)
+    assert m.tick == 1000
+    assert m.left.stamina == m.left.max_stamina
+
+
+def test_fast_forward_matches_stepping_for_scripted_input():
+    def left():
+        # hold the pull, clone mid-burst, throw a bomb
+        events = [(t, "pull") for t in range(0, 600, 5)]
+        events += [(40, "clone"), (90, "bomb")]
+        return ScriptedController(events)
+
+    def right():
+        return ScriptedController([(t, "pull") for t in range(200, 900, 9)] + [(300, "clone")])
+
+    assert _play(True, left, right) == _play(False, left, right)
+
+
+def test_fast_forward_matches_stepping_against_ai():
+    def left():
+        return ScriptedController([(t, "pull") for t in range(0, 3000, 4)] + [(10, "bomb")])
+
+    for seed in range(5):
+        assert _play(True, left, AIController, seed=seed) == _play(False, left, AIController, seed=seed)
+
+
+def test_rope_stops_on_the_winning_tick():
+    m = Match(left=ScriptedController([(t, "pull") for t in range(0, 2000, 6)]), seed=3)
+    m.run()
+    assert m.winner == "Left team"
+    assert m.rope.pos == m.rope.min_x
+
+
+def test_ai_skips_frames_it_cannot_respond_on():
+    ai = AIController()
+    m = Match(right=ai, seed=0)
+    m.right.clone_used = m.right.bomb_used = True
+    m.right.ai_pause_timer = 0
+    m.left.tap_timer, m.left.pull = 50, m.left.pull_strength
+    # the knot drifts left 3 px a frame: it passes center - 10 on the 5th frame
+    assert ai.quiet_ticks(m, m.right, m.left) == 4
+    m.right.ai_pause_timer = 20
+    assert ai.quiet_ticks(m, m.right, m.left) == 19
+    m.left.pull = 0
+    assert ai.quiet_ticks(m, m.right, m.left) == 0
+
+
+def test_ai_matches_take_fewer_iterations_than_ticks():
+    for seed in range(4):
+        m = Match(AIController(), AIController(), seed=seed)
+        iterations = 0
+        while not m.game_over:
+            n = m.steady_ticks()
+            if n > 1:
+                m.advance(n)
+            else:
+                m.step()
+            iterations += 1
+        assert iterations < m.tick
+        stepped = Match(AIController(), AIController(), seed=seed, fast_forward=False)
+        stepped.run()
+        assert m.snapshot() == stepped.snapshot()
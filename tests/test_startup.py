@@ -0,0 +1,15 @@
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+
+
+def test_game_package_imports_without_side_effects():
+    # no display, no asset loading and no output just from importing the modules
+    code = ("import pygame, game.core, game.projectile, game.audio, game.assets, game.sim; "
+            "assert not pygame.display.get_init(); import game.projectile as p; assert not p._BOMB_IMGS")
+    env = dict(os.environ, PYTHONPATH=SRC, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout == ""
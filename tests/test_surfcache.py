@@ -0,0 +1,41 @@
+import os
+
+import pygame
+
+from game import surfcache
+
+
+def test_round_trips_pixels_and_hits_on_the_second_run(tmp_path, monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("TUG_SURFACE_CACHE", str(tmp_path / "cache"))
+    pygame.display.init()
+    try:
+        pygame.display.set_mode((4, 4))
+        src = tmp_path / "sprite.bin"
+        src.write_bytes(b"v1")
+
+        def build():
+            surf = pygame.Surface((3, 2), pygame.SRCALPHA).convert_alpha()
+            surf.fill((10, 20, 30, 40))
+            surf.set_at((2, 1), (200, 100, 50, 255))
+            built.append(surf)
+            return surf
+
+        built = []
+        before = dict(surfcache.stats)
+        first = surfcache.cached("sprite@2x", [str(src)], build)
+        again = surfcache.cached("sprite@2x", [str(src)], build)
+        assert len(built) == 1
+        assert surfcache.stats["misses"] == before["misses"] + 1
+        assert surfcache.stats["hits"] == before["hits"] + 1
+        assert again.get_size() == (3, 2)
+        assert again.get_at((0, 0)) == first.get_at((0, 0)) == (10, 20, 30, 40)
+        assert again.get_at((2, 1)) == (200, 100, 50, 255)
+
+        # a changed source misses, and its blob replaces the stale one
+        src.write_bytes(b"v2")
+        os.utime(src, ns=(0, 1))      # same size: make sure the digest memo sees a change
+        surfcache.cached("sprite@2x", [str(src)], build)
+        assert len(built) == 2 and len(os.listdir(tmp_path / "cache")) == 1
+    finally:
+        pygame.display.quit()
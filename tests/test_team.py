@@ -0,0 +1,60 @@
+import pygame
+
+from game.capture import FrameCapture
+from game.player import PlayerState, PULL_POWER
+from game.team import MAX_TEAM_SIZE, Team
+
+def make_team(size):
+    leader = PlayerState(100, 260, "left")
+    team = Team("left", size, leader, 800, seed=1)
+    team.ai_enabled = False
+    return team
+
+def test_squad_pulls_like_one_more_player():
+    team = make_team(31)
+    team.press()
+    team.step(rope_pos=400, opponent_pull=0)
+    assert (team.pull == PULL_POWER).all() and team.total_pull() == PULL_POWER
+    assert team.stamina < team.max_stamina
+
+def test_bomb_freezes_one_member():
+    team = make_team(4)
+    x, y = int(team.x[0]), int(team.y[0])
+    assert team.hit(pygame.Rect(x, y - 10, 4, 4)) == 0
+    team.press()
+    team.step(rope_pos=400, opponent_pull=0)
+    assert team.pull[0] == 0 and team.pull.sum() == 3 * PULL_POWER
+    # 3/4 of a pull per frame: the fraction is carried, not dropped
+    pulled = team.total_pull()
+    for _ in range(3):
+        team.step(rope_pos=400, opponent_pull=0)
+        pulled += team.total_pull()
+    assert pulled == 3 * PULL_POWER
+
+def test_fast_bomb_freezes_the_member_it_passed_through():
+    team = make_team(4)
+    x, y = int(team.x[0]), int(team.y[0])
+    r = pygame.Rect(x + team.width + 100, y - 10, 4, 4)
+    assert team.hit(r) == -1
+    assert team.hit(r, motion=(200, 0)) == 0
+
+
+def test_full_teams_still_play_a_match():
+    results = []
+    for seed in range(4):
+        cap = FrameCapture()
+        try:
+            game = cap.game
+            game.ledger = None
+            game.spectate(32)
+            game.spectate_hold = None
+            game.round_seed = seed
+            game.set_team_size(MAX_TEAM_SIZE, seed=seed)
+            while not game.game_over and cap.frames < 3000:
+                cap.step()
+            results.append((game.winner, game.match_ticks))
+        finally:
+            cap.close()
+    # the squad pull is scaled by 1/size, so full teams still play a match of normal length
+    assert min(ticks for _, ticks in results) > 100
+    assert {winner for winner, _ in results} == {"Left team", "Right team"}
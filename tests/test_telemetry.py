@@ -0,0 +1,22 @@
+from game.sim import Match, AIController
+from game.telemetry import TelemetryWriter, load_day, MATCH_END
+
+def test_telemetry_round_trip(tmp_path):
+    # room for all three matches, so a slow writer thread can't make it drop chunks
+    writer = TelemetryWriter(str(tmp_path), chunk_ticks=512, buffers=32)
+    ticks = 0
+    for seed in range(3):
+        m = Match(left=AIController(), right=AIController(), seed=seed)
+        writer.begin_match()
+        while not m.game_over:
+            m.step()
+            writer.record(m)
+            ticks += 1
+        writer.end_match(m.winner)
+    writer.close()
+
+    cols = load_day(str(tmp_path))
+    assert len(cols["matches"]) == 3
+    assert writer.dropped == 0 and len(cols["tick"]) == ticks
+    ends = cols["event_kind"] == MATCH_END
+    assert list(cols["event_match"][ends]) == [0, 1, 2]
@@ -0,0 +1,29 @@
+from game.tuning import AI_DEFAULTS, evaluate, evolve, grid_candidates
+
+
+def test_respond_parameters_change_results():
+    answers = dict(AI_DEFAULTS, ai_aggressiveness=0.3, ai_respond_bias=(0.2, 0.4))
+    base, responsive = evaluate([AI_DEFAULTS, answers], opponents=["default-ai"], games=10, workers=1)
+    assert base["win_rates"] != responsive["win_rates"]
+
+
+def test_evolve_keeps_the_best_score():
+    history = evolve(generations=3, population=4, elite=2, seed=1, log=None,
+                     opponents=["tapper"], games=6, workers=1)
+    # the first candidate is AI_DEFAULTS, which never beats the tapper; the search
+    # finds something better and later generations don't fall behind the first
+    assert history[0]["params"] == AI_DEFAULTS
+    scores = [r["score"] for r in history]
+    assert max(scores) > scores[0]
+    assert max(scores[4:]) >= max(scores[:4])
+    # same seed, same search
+    again = evolve(generations=3, population=4, elite=2, seed=1, log=None,
+                   opponents=["tapper"], games=6, workers=1)
+    assert [r["score"] for r in again] == [r["score"] for r in history]
+
+
+def test_default_grid_searches_the_respond_parameters():
+    grid = grid_candidates()
+    assert {c["ai_aggressiveness"] for c in grid} == {0.0, 0.3}
+    assert {c["ai_respond_bias"] for c in grid} == {(0.0, 0.0), (0.2, 0.4)}
+    assert AI_DEFAULTS in grid
@@ -0,0 +1,39 @@
+import pygame
+
+from game.view import Viewport, from_env
+
+
+def test_native_scales_and_letterboxes():
+    # 1920x1080 over 800x480: limited by height, 2.25x, bars left and right
+    vp = Viewport((1920, 1080))
+    assert vp.scale == 2.25 and vp.size_px == (1800, 1080) and (vp.ox, vp.oy) == (60, 0)
+    assert vp.pt(0, 0) == (60, 0) and vp.pt(800, 480) == (1860, 1080)
+    assert vp.px(10) == 22 and vp.size(64, 0.1) == (144, 1)
+    assert vp.rect(100, 40, 20, 10) == pygame.Rect(285, 90, 45, 22)
+    assert not vp.identity
+
+
+def test_canvas_draws_logical_and_scales_once():
+    vp = Viewport((1600, 1000), mode="canvas")
+    assert vp.scale == 2.0 and (vp.ox, vp.oy) == (0, 20)
+    assert vp.pt(100.7, 40) == (100, 40) and vp.px(10) == 10 and vp.size(64, 32) == (64, 32)
+
+    display = pygame.Surface((1600, 1000))
+    canvas = pygame.Surface(vp.logical)
+    canvas.fill((255, 0, 0))
+    vp.present(canvas, display)
+    assert display.get_at((0, 19))[:3] == (0, 0, 0)
+    assert display.get_at((0, 20))[:3] == display.get_at((1599, 979))[:3] == (255, 0, 0)
+
+
+def test_identity_and_env(monkeypatch):
+    vp = Viewport()
+    assert vp.identity and vp.pt(12, 34) == (12, 34) and vp.px(5) == 5
+    display = pygame.Surface(vp.logical)
+    assert vp.target(display) is display
+    monkeypatch.setenv("TUG_DISPLAY", "1200x720")
+    monkeypatch.setenv("TUG_RENDER", "canvas")
+    vp = from_env()
+    assert vp.physical == (1200, 720) and vp.mode == "canvas" and vp.scale == 1.5
+    monkeypatch.setenv("TUG_DISPLAY", "huge")
+    assert from_env().identity
@@ -0,0 +1,23 @@
+import time
+
+from game.sim import Match, capture_state
+from game.winprob import HORIZON, WinProbability, _rollout_chunk
+
+
+def test_even_opening_is_near_a_coin_flip():
+    state = capture_state(Match(seed=0))
+    assert 0.35 < _rollout_chunk(state, 100, 1, HORIZON) / 100 < 0.65
+
+
+def test_meter_publishes_and_closes():
+    meter = WinProbability(rollouts=16, workers=1)
+    try:
+        meter.submit(Match(seed=3))
+        deadline = time.monotonic() + 60
+        while meter.estimate is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        chance, rollouts, generation = meter.estimate
+        assert 0.0 <= chance <= 1.0 and generation == 1
+    finally:
+        meter.close()
+    assert not meter._thread.is_alive()